@@ -8,14 +8,42 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-
-from .const import DOMAIN
-from .coordinator import EasyEquitiesDataUpdateCoordinator
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
+
+from .alerts import async_setup_alerts
+from .allocation import async_setup_allocation
+from .cache import async_get_cache
+from .client import credential_key
+from .const import (
+    ACCOUNT_STORAGE_KEYS,
+    ACCOUNT_STORAGE_VERSION,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    DATA_STATISTICS,
+    DOMAIN,
+)
+from .coordinator import EasyEquitiesDataUpdateCoordinator, entry_platforms
+from .services import async_setup_services
+from .statistics import async_migrate_statistics, async_setup_statistics
+from .websocket_api import async_setup_websocket_api
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Easy Equities alerts, allocation targets, services and WebSocket API."""
+    await async_setup_alerts(hass)
+    await async_setup_allocation(hass)
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Easy Equities from a config entry."""
@@ -26,14 +54,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = EasyEquitiesDataUpdateCoordinator(hass, entry)
     
     _LOGGER.debug("Performing first refresh for entry: %s", entry.entry_id)
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # The account coordinators already poll; stop them before a retry
+        coordinator.async_unload()
+        raise
 
     if not coordinator.last_update_success:
         _LOGGER.error("First refresh failed for entry: %s", entry.entry_id)
+        coordinator.async_unload()
         raise ConfigEntryNotReady
 
     _LOGGER.info("First refresh successful for entry: %s", entry.entry_id)
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    # Follow the poller daemon instead of polling, if one is configured
+    coordinator.async_update_consumer()
+
+    await async_migrate_statistics(hass, coordinator)
+    if (stop_statistics := async_setup_statistics(hass, coordinator)) is not None:
+        entry.async_on_unload(stop_statistics)
 
     # Listen for options updates
     entry.async_on_unload(entry.add_update_listener(async_update_options))
@@ -46,9 +86,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update."""
-    _LOGGER.info("Options updated for entry: %s, reloading", entry.entry_id)
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Handle options update by applying it to the running coordinator."""
+    _LOGGER.info("Options updated for entry: %s, applying", entry.entry_id)
+    coordinator: EasyEquitiesDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    await coordinator.async_apply_options()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -56,7 +97,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("Unloading Easy Equities integration for entry: %s", entry.entry_id)
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator.async_unload()
+        await coordinator.async_save_state()
+        # Don't hold the entry's responses until they are looked up again
+        cache = async_get_cache(hass)
+        for session in coordinator.sessions.values():
+            cache.async_invalidate(session.credential)
         _LOGGER.info("Successfully unloaded entry: %s", entry.entry_id)
     else:
         _LOGGER.warning("Failed to unload all platforms for entry: %s", entry.entry_id)
@@ -64,6 +111,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached responses, stored income indexes, lots and statistics of a deleted config entry."""
+    hass.data.get(DATA_STATISTICS, {}).pop(entry.entry_id, None)
+    cache = async_get_cache(hass)
+    for platform in entry_platforms(entry):
+        cache.async_invalidate(
+            credential_key(platform, entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD])
+        )
+    for key in ACCOUNT_STORAGE_KEYS.values():
+        await Store(hass, ACCOUNT_STORAGE_VERSION, key.format(entry.entry_id)).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
     _LOGGER.info("Reloading Easy Equities integration for entry: %s", entry.entry_id)
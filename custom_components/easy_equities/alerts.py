@@ -0,0 +1,175 @@
+"""Price and value threshold alerts for Easy Equities holdings."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+import logging
+from typing import Any
+import uuid
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    ALERT_DIRECTION_ABOVE,
+    ALERT_DIRECTION_BELOW,
+    ALERT_DIRECTION_BOTH,
+    ALERT_METRICS,
+    ATTR_ACCOUNT_NAME,
+    ATTR_CONTRACT_CODE,
+    DATA_ALERTS,
+    DOMAIN,
+    EVENT_ALERT_TRIGGERED,
+)
+from .events import holding_key
+from .util import parse_number
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = f"{DOMAIN}.alerts"
+STORAGE_VERSION = 1
+
+
+def _metric_value(holding: dict[str, Any], metric: str) -> float | None:
+    """Return the parsed price or value of a holding."""
+    return parse_number(holding.get(f"current_{metric}"))
+
+
+class EasyEquitiesAlertRegistry:
+    """Persisted threshold alerts, indexed for crossing lookups.
+
+    Thresholds are kept sorted per (contract code, metric), so checking a
+    holding costs two bisections plus one step per crossed threshold, no
+    matter how many alerts are configured.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the registry."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self.alerts: dict[str, dict[str, Any]] = {}
+        # (contract_code, metric) -> sorted thresholds and their alert ids
+        self._index: dict[tuple[str, str], tuple[list[float], list[str]]] = {}
+
+    async def async_load(self) -> None:
+        """Load the alerts from storage."""
+        if (stored := await self._store.async_load()) is None:
+            return
+        for alert in stored["alerts"]:
+            self._add(alert)
+        _LOGGER.debug("Loaded %d alert(s)", len(self.alerts))
+
+    async def async_add(
+        self,
+        contract_code: str,
+        threshold: float,
+        metric: str,
+        direction: str,
+        account_id: str | None = None,
+        name: str | None = None,
+    ) -> dict[str, Any]:
+        """Add an alert and persist it."""
+        alert = {
+            "id": uuid.uuid4().hex,
+            ATTR_CONTRACT_CODE: contract_code,
+            "threshold": threshold,
+            "metric": metric,
+            "direction": direction,
+            "account_id": account_id,
+            "name": name,
+        }
+        self._add(alert)
+        await self._async_save()
+        return alert
+
+    async def async_remove(self, alert_id: str) -> bool:
+        """Remove an alert, returning whether it existed."""
+        if (alert := self.alerts.pop(alert_id, None)) is None:
+            return False
+        thresholds, ids = self._index[(alert[ATTR_CONTRACT_CODE], alert["metric"])]
+        position = ids.index(alert_id)
+        del thresholds[position]
+        del ids[position]
+        await self._async_save()
+        return True
+
+    def _add(self, alert: dict[str, Any]) -> None:
+        """Add an alert to the index."""
+        self.alerts[alert["id"]] = alert
+        thresholds, ids = self._index.setdefault(
+            (alert[ATTR_CONTRACT_CODE], alert["metric"]), ([], [])
+        )
+        position = bisect_right(thresholds, alert["threshold"])
+        thresholds.insert(position, alert["threshold"])
+        ids.insert(position, alert["id"])
+
+    async def _async_save(self) -> None:
+        """Persist the alerts."""
+        await self._store.async_save({"alerts": list(self.alerts.values())})
+
+    def _crossed(
+        self, key: tuple[str, str], old: float, new: float
+    ) -> list[tuple[str, str]]:
+        """Return (alert id, direction) for thresholds crossed from old to new."""
+        if (entry := self._index.get(key)) is None or old == new:
+            return []
+        thresholds, ids = entry
+        if new > old:
+            # Crossed upwards: old < threshold <= new
+            start, end = bisect_right(thresholds, old), bisect_right(thresholds, new)
+            return [(alert_id, ALERT_DIRECTION_ABOVE) for alert_id in ids[start:end]]
+        # Crossed downwards: new <= threshold < old
+        start, end = bisect_left(thresholds, new), bisect_left(thresholds, old)
+        return [(alert_id, ALERT_DIRECTION_BELOW) for alert_id in ids[start:end]]
+
+    @callback
+    def async_evaluate(
+        self,
+        account: dict[str, Any],
+        previous: list[dict[str, Any]],
+        current: list[dict[str, Any]],
+    ) -> None:
+        """Fire an event for each alert crossed between two holdings snapshots."""
+        if not self.alerts:
+            return
+        before = {holding_key(holding): holding for holding in previous}
+        for holding in current:
+            key = holding_key(holding)
+            if (old_holding := before.get(key)) is None:
+                continue
+            for metric in ALERT_METRICS:
+                if (key, metric) not in self._index:
+                    continue
+                old = _metric_value(old_holding, metric)
+                new = _metric_value(holding, metric)
+                if old is None or new is None:
+                    continue
+                for alert_id, direction in self._crossed((key, metric), old, new):
+                    alert = self.alerts[alert_id]
+                    if alert["direction"] not in (direction, ALERT_DIRECTION_BOTH):
+                        continue
+                    if alert["account_id"] not in (account["id"], None):
+                        continue
+                    _LOGGER.debug("Alert %s crossed %s", alert_id, direction)
+                    self.hass.bus.async_fire(
+                        EVENT_ALERT_TRIGGERED,
+                        {
+                            "alert_id": alert_id,
+                            "name": alert["name"],
+                            ATTR_CONTRACT_CODE: key,
+                            "metric": metric,
+                            "threshold": alert["threshold"],
+                            "account_id": account["id"],
+                            ATTR_ACCOUNT_NAME: account["name"],
+                            "crossed": direction,
+                            "previous": old,
+                            "current": new,
+                        },
+                    )
+
+
+async def async_setup_alerts(hass: HomeAssistant) -> EasyEquitiesAlertRegistry:
+    """Load the alert registry and store it for the coordinators."""
+    registry = EasyEquitiesAlertRegistry(hass)
+    await registry.async_load()
+    hass.data[DATA_ALERTS] = registry
+    return registry
@@ -0,0 +1,214 @@
+"""Target allocations for Easy Equities holdings and exchanges.
+
+Targets are percentages of the portfolio per holding (contract code) and per
+exchange (the market segment of the contract code, e.g. ZA or US). They are
+set with the set_allocation service or read from a YAML file in the config
+directory, and stored across restarts.
+
+Weights, drift and rebalancing amounts are computed for every holding in one
+vectorized NumPy pass each time the portfolio data is rebuilt. NumPy is
+imported in the executor when targets are first loaded, so setups without
+targets never import it.
+"""
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+import sys
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
+from homeassistant.util.yaml import load_yaml
+
+from .client import async_import_module
+from .const import (
+    ALLOCATION_FILE,
+    DATA_ALLOCATION,
+    DOMAIN,
+    SIGNAL_ALLOCATION_UPDATED,
+)
+from .events import holding_key
+from .util import parse_number
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = f"{DOMAIN}.allocation"
+STORAGE_VERSION = 1
+
+TARGET_HOLDINGS = "holdings"
+TARGET_EXCHANGES = "exchanges"
+
+
+def exchange_of(contract_code: str | None) -> str:
+    """Return the exchange segment of a contract code, e.g. ZA for EQU.ZA.STX40."""
+    parts = (contract_code or "").split(".")
+    return parts[1].upper() if len(parts) > 2 else "OTHER"
+
+
+def validate_targets(targets: dict[str, Any]) -> dict[str, dict[str, float]]:
+    """Return normalized targets, raising ValueError if they are invalid."""
+    validated: dict[str, dict[str, float]] = {}
+    for group in (TARGET_HOLDINGS, TARGET_EXCHANGES):
+        weights = targets.get(group) or {}
+        if not isinstance(weights, dict):
+            raise ValueError(f"{group} must map codes to target percentages")
+        parsed: dict[str, float] = {}
+        for code, weight in weights.items():
+            try:
+                weight = float(weight)
+            except (TypeError, ValueError) as err:
+                raise ValueError(f"Target of {code} is not a number: {weight}") from err
+            if not 0 <= weight <= 100:
+                raise ValueError(f"Target of {code} must be between 0 and 100: {weight}")
+            key = str(code).strip()
+            parsed[key.upper() if group == TARGET_EXCHANGES else key] = weight
+        if sum(parsed.values()) > 100.0001:
+            raise ValueError(f"{group} targets add up to more than 100%")
+        validated[group] = parsed
+    return validated
+
+
+def _group(np: Any, labels: list[str], values: Any, targets: dict[str, float]) -> dict[str, Any]:
+    """Return weight, target, drift and rebalancing amount per label."""
+    names, inverse = np.unique(np.array(labels, dtype=object), return_inverse=True)
+    current = np.bincount(inverse, weights=values, minlength=len(names))
+    total = current.sum()
+    weight = current / total * 100 if total else np.zeros(len(names))
+    target = np.array([targets.get(name, np.nan) for name in names], dtype=float)
+    drift = weight - target
+    # Buy (positive) or sell (negative) amount to reach the target weight
+    trade = target / 100 * total - current
+    return {
+        "names": names,
+        "current": current,
+        "weight": weight,
+        "target": target,
+        "drift": drift,
+        "trade": trade,
+    }
+
+
+def _rows(np: Any, grouped: dict[str, Any]) -> dict[str, dict[str, float | None]]:
+    """Return the grouped arrays as rows keyed by name."""
+    rows: dict[str, dict[str, float | None]] = {}
+    for index, name in enumerate(grouped["names"]):
+        targeted = not np.isnan(grouped["target"][index])
+        rows[str(name)] = {
+            "value": round(float(grouped["current"][index]), 2),
+            "weight": round(float(grouped["weight"][index]), 2),
+            "target": round(float(grouped["target"][index]), 2) if targeted else None,
+            "drift": round(float(grouped["drift"][index]), 2) if targeted else None,
+            "rebalance": round(float(grouped["trade"][index]), 2) if targeted else None,
+        }
+    return rows
+
+
+def compute_allocation(
+    holdings: list[dict[str, Any]], targets: dict[str, dict[str, float]]
+) -> dict[str, Any] | None:
+    """Return current weights, drift and rebalancing amounts against the targets.
+
+    Holdings held in several accounts are combined by contract code; targeted
+    holdings that aren't held count as zero, so their full target is bought.
+    Holdings and exchanges without a target are reported but never traded.
+    Returns None if there are no targets or NumPy hasn't been loaded.
+    """
+    if not (targets.get(TARGET_HOLDINGS) or targets.get(TARGET_EXCHANGES)):
+        return None
+    if (np := sys.modules.get("numpy")) is None:
+        return None
+
+    keys = [holding_key(holding) for holding in holdings]
+    values = [parse_number(holding.get("current_value")) or 0.0 for holding in holdings]
+    held = set(keys)
+    for contract_code in targets.get(TARGET_HOLDINGS, {}):
+        if contract_code not in held:
+            keys.append(contract_code)
+            values.append(0.0)
+    value_array = np.array(values, dtype=float)
+
+    by_holding = _group(np, keys, value_array, targets.get(TARGET_HOLDINGS, {}))
+    by_exchange = _group(
+        np, [exchange_of(key) for key in keys], value_array, targets.get(TARGET_EXCHANGES, {})
+    )
+
+    drifts = np.concatenate((by_holding["drift"], by_exchange["drift"]))
+    trades = np.nan_to_num(by_holding["trade"])
+    return {
+        "total": round(float(value_array.sum()), 2),
+        "max_drift": (
+            round(float(np.nanmax(np.abs(drifts))), 2) if not np.all(np.isnan(drifts)) else None
+        ),
+        "buy": round(float(trades[trades > 0].sum()), 2),
+        "sell": round(float(-trades[trades < 0].sum()), 2),
+        TARGET_HOLDINGS: _rows(np, by_holding),
+        TARGET_EXCHANGES: _rows(np, by_exchange),
+    }
+
+
+class EasyEquitiesAllocationTargets:
+    """Persisted target allocations, shared by every config entry."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the targets."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self.targets: dict[str, dict[str, float]] = {TARGET_HOLDINGS: {}, TARGET_EXCHANGES: {}}
+
+    @property
+    def path(self) -> Path:
+        """Return the path of the YAML targets file."""
+        return Path(self.hass.config.path(ALLOCATION_FILE))
+
+    async def async_load(self) -> None:
+        """Load the targets from the YAML file if it exists, else from storage."""
+        if await self.hass.async_add_executor_job(self.path.exists):
+            try:
+                await self.async_load_file()
+            except HomeAssistantError as err:
+                _LOGGER.error("Ignoring %s: %s", ALLOCATION_FILE, err)
+            else:
+                return
+        if (stored := await self._store.async_load()) is not None:
+            self.targets = validate_targets(stored)
+            await self._async_prepare()
+
+    async def async_load_file(self) -> dict[str, dict[str, float]]:
+        """Read the targets from the YAML file and store them."""
+        try:
+            content = await self.hass.async_add_executor_job(load_yaml, str(self.path))
+        except (FileNotFoundError, HomeAssistantError) as err:
+            raise HomeAssistantError(f"Could not read {self.path}: {err}") from err
+        return await self.async_set(content or {})
+
+    async def async_set(self, targets: dict[str, Any]) -> dict[str, dict[str, float]]:
+        """Validate, store and apply new targets."""
+        try:
+            self.targets = validate_targets(targets)
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+        await self._async_prepare()
+        await self._store.async_save(self.targets)
+        _LOGGER.debug(
+            "Allocation targets set for %d holding(s) and %d exchange(s)",
+            len(self.targets[TARGET_HOLDINGS]),
+            len(self.targets[TARGET_EXCHANGES]),
+        )
+        async_dispatcher_send(self.hass, SIGNAL_ALLOCATION_UPDATED)
+        return self.targets
+
+    async def _async_prepare(self) -> None:
+        """Import NumPy off the event loop once there are targets to compute."""
+        if self.targets[TARGET_HOLDINGS] or self.targets[TARGET_EXCHANGES]:
+            await async_import_module(self.hass, "numpy")
+
+
+async def async_setup_allocation(hass: HomeAssistant) -> EasyEquitiesAllocationTargets:
+    """Load the allocation targets and store them for the coordinators."""
+    targets = EasyEquitiesAllocationTargets(hass)
+    await targets.async_load()
+    hass.data[DATA_ALLOCATION] = targets
+    return targets
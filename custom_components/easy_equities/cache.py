@@ -0,0 +1,145 @@
+"""Read-through cache of Easy Equities API responses.
+
+Every API call of the integration goes through the sessions, which look the
+response up here first, keyed by credential, endpoint and account. Responses
+are kept for a short per-endpoint time to live, expired ones are swept on
+every fetch, the least recently used are evicted beyond a maximum number of
+entries, and concurrent requests for the
+same key share a single call. Cached responses are shared between callers,
+which must not modify them.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+import logging
+import time
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import CACHE_TTLS, DATA_CACHE, DEFAULT_CACHE_MAX_ENTRIES
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# (credential, endpoint, account id); the account id is None for the account list
+CacheKey = tuple[str, str, "str | None"]
+
+_COUNTERS = ("hits", "misses", "coalesced", "evictions")
+
+
+class EasyEquitiesResponseCache:
+    """LRU cache of API responses with per-endpoint TTLs and request coalescing."""
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] = CACHE_TTLS,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the cache."""
+        self.ttls = dict(ttls)
+        self.max_entries = max_entries
+        # Key -> (expiry on the monotonic clock, response), least recently used first
+        self._entries: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[CacheKey, asyncio.Task[Any]] = {}
+        self._counters: dict[str, dict[str, int]] = {}
+
+    def _count(self, endpoint: str, counter: str) -> None:
+        """Increment a counter of an endpoint."""
+        counters = self._counters.setdefault(endpoint, dict.fromkeys(_COUNTERS, 0))
+        counters[counter] += 1
+
+    async def async_get(
+        self,
+        key: CacheKey,
+        fetch: Callable[[], Awaitable[_T]],
+        force: bool = False,
+    ) -> _T:
+        """Return the cached response of a key, fetching it on a miss.
+
+        With force, a cached response is ignored and replaced, but a call
+        already in flight is still shared since its response is fresh.
+        """
+        endpoint = key[1]
+        if not force and (entry := self._entries.get(key)) is not None:
+            expires, response = entry
+            if expires > time.monotonic():
+                self._entries.move_to_end(key)
+                self._count(endpoint, "hits")
+                return response
+            del self._entries[key]
+
+        if (task := self._inflight.get(key)) is not None:
+            self._count(endpoint, "coalesced")
+        else:
+            self._count(endpoint, "misses")
+            task = asyncio.ensure_future(self._async_fetch(key, fetch))
+            task.add_done_callback(_retrieve_exception)
+            self._inflight[key] = task
+        # Shielded, so a cancelled caller doesn't cancel the call for the others
+        return await asyncio.shield(task)
+
+    async def _async_fetch(self, key: CacheKey, fetch: Callable[[], Awaitable[_T]]) -> _T:
+        """Fetch and store the response of a key."""
+        try:
+            response = await fetch()
+        finally:
+            self._inflight.pop(key, None)
+        now = time.monotonic()
+        self._sweep(now)
+        if (ttl := self.ttls.get(key[1], 0)) > 0:
+            self._entries[key] = (now + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._count(evicted[1], "evictions")
+        return response
+
+    def _sweep(self, now: float) -> None:
+        """Drop the expired responses, so they aren't held until looked up again."""
+        for key in [key for key, (expires, _) in self._entries.items() if expires <= now]:
+            del self._entries[key]
+
+    @callback
+    def async_invalidate(self, credential: str | None = None) -> None:
+        """Drop the cached responses of a credential, or all of them."""
+        for key in [key for key in self._entries if credential in (None, key[0])]:
+            del self._entries[key]
+
+    def stats(self) -> dict[str, Any]:
+        """Return the hit and miss counters per endpoint, for tuning the TTLs."""
+        endpoints: dict[str, Any] = {}
+        for endpoint, counters in sorted(self._counters.items()):
+            lookups = counters["hits"] + counters["misses"] + counters["coalesced"]
+            endpoints[endpoint] = {
+                **counters,
+                "ttl": self.ttls.get(endpoint, 0),
+                "hit_ratio": round(
+                    (counters["hits"] + counters["coalesced"]) / lookups, 3
+                )
+                if lookups
+                else None,
+            }
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "in_flight": len(self._inflight),
+            "endpoints": endpoints,
+        }
+
+
+def _retrieve_exception(task: asyncio.Task[Any]) -> None:
+    """Mark a failed call as handled when every caller has gone away."""
+    if not task.cancelled():
+        task.exception()
+
+
+@callback
+def async_get_cache(hass: HomeAssistant) -> EasyEquitiesResponseCache:
+    """Return the shared response cache, creating it on first use."""
+    if DATA_CACHE not in hass.data:
+        hass.data[DATA_CACHE] = EasyEquitiesResponseCache()
+    return hass.data[DATA_CACHE]
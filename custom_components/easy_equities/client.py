@@ -0,0 +1,143 @@
+"""Lazy access to the Easy Equities client library.
+
+The client library pulls in its HTTP and HTML parsing stack when imported.
+Nothing here imports it at module level; it is imported in the executor the
+first time a client is created, keeping it off the event loop during startup.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib
+import logging
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Union
+
+from .cache import async_get_cache
+from .const import (
+    CLIENT_PLATFORM_SATRIX,
+    ENDPOINT_ACCOUNTS,
+    ENDPOINT_HOLDINGS,
+    ENDPOINT_PRICES,
+    ENDPOINT_TRANSACTIONS,
+    ENDPOINT_VALUATIONS,
+)
+
+if TYPE_CHECKING:
+    from easy_equities_client.clients import EasyEquitiesClient, SatrixClient
+    from homeassistant.core import HomeAssistant
+
+    Client = Union[EasyEquitiesClient, SatrixClient]
+
+CLIENT_MODULE = "easy_equities_client.clients"
+
+_LOGGER = logging.getLogger(__name__)
+
+# Client accounts method and extra arguments of each cached endpoint
+_ENDPOINT_CALLS: dict[str, tuple[str, tuple[Any, ...]]] = {
+    ENDPOINT_ACCOUNTS: ("list", ()),
+    ENDPOINT_HOLDINGS: ("holdings", (True,)),
+    ENDPOINT_PRICES: ("holdings", (False,)),
+    ENDPOINT_VALUATIONS: ("valuations", ()),
+    ENDPOINT_TRANSACTIONS: ("transactions", ()),
+}
+
+
+def credential_key(platform: str, username: str, password: str) -> str:
+    """Return the cache key of a platform and credentials."""
+    secret = f"{platform}\0{username.lower()}\0{password}"
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()
+
+
+def create_client(is_satrix: bool) -> Client:
+    """Create an Easy Equities or Satrix client.
+
+    Imports the client library on first use, so this blocks and must run in
+    the executor.
+    """
+    clients = importlib.import_module(CLIENT_MODULE)
+    return clients.SatrixClient() if is_satrix else clients.EasyEquitiesClient()
+
+
+async def async_create_client(hass: HomeAssistant, is_satrix: bool) -> Client:
+    """Create a client in the executor."""
+    return await hass.async_add_executor_job(create_client, is_satrix)
+
+
+class EasyEquitiesSession:
+    """A logged-in client for one platform, shared by its accounts.
+
+    The client switches the active account server-side before each account
+    call, so calls for different accounts of a platform must not interleave;
+    they hold account_lock. Sessions of different platforms are independent
+    and are used concurrently.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, platform: str, username: str, password: str
+    ) -> None:
+        """Initialize the session."""
+        self.hass = hass
+        self.platform = platform
+        self.is_satrix = platform == CLIENT_PLATFORM_SATRIX
+        self._username = username
+        self._password = password
+        self.client: Client | None = None
+        self._login_lock = asyncio.Lock()
+        self.account_lock = asyncio.Lock()
+
+    async def async_get_client(self) -> Client:
+        """Return a logged-in client, logging in on first use."""
+        async with self._login_lock:
+            if self.client:
+                return self.client
+            _LOGGER.debug("Logging in to %s as %s", self.platform, self._username)
+            client = await async_create_client(self.hass, self.is_satrix)
+            await self.hass.async_add_executor_job(
+                client.login, self._username, self._password
+            )
+            _LOGGER.info("Login to %s successful", self.platform)
+            self.client = client
+            return client
+
+    def invalidate(self) -> None:
+        """Drop the client so the next call logs in again."""
+        self.client = None
+
+    @property
+    def credential(self) -> str:
+        """Return the cache key of the platform and credentials."""
+        return credential_key(self.platform, self._username, self._password)
+
+    async def async_fetch(
+        self, endpoint: str, account_id: str | None = None, force: bool = False
+    ) -> Any:
+        """Return the response of an endpoint through the shared cache.
+
+        Account endpoints switch the active account, so callers fetching them
+        hold account_lock. With force, a cached response is not reused.
+        """
+        method, args = _ENDPOINT_CALLS[endpoint]
+
+        async def _async_call() -> Any:
+            client = await self.async_get_client()
+            account_args = () if account_id is None else (account_id,)
+            return await self.hass.async_add_executor_job(
+                getattr(client.accounts, method), *account_args, *args
+            )
+
+        return await async_get_cache(self.hass).async_get(
+            (self.credential, endpoint, account_id), _async_call, force
+        )
+
+
+async def async_import_module(hass: HomeAssistant, name: str) -> ModuleType:
+    """Import an optional dependency in the executor on first use.
+
+    Use this for heavy libraries (e.g. NumPy for analytics) so that their
+    import cost is paid by the first feature that needs them, not at startup.
+    """
+    if (module := sys.modules.get(name)) is not None:
+        return module
+    return await hass.async_add_executor_job(importlib.import_module, name)
@@ -1,20 +1,31 @@
 """Config flow for Easy Equities integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
-from easy_equities_client.clients import EasyEquitiesClient, SatrixClient
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 
-from .const import CONF_ACCOUNT_ID, CONF_ACCOUNT_IDS, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .client import EasyEquitiesSession
+from .const import (
+    CLIENT_PLATFORM_EASY_EQUITIES,
+    CLIENT_PLATFORMS,
+    CONF_ACCOUNT_ID,
+    CONF_ACCOUNT_IDS,
+    CONF_CLIENT_PLATFORMS,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    ENDPOINT_ACCOUNTS,
+)
 from .options import async_get_options_flow
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,35 +34,53 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_USERNAME): str,
         vol.Required(CONF_PASSWORD): str,
-        vol.Optional("is_satrix", default=False): bool,
+        vol.Required(
+            CONF_CLIENT_PLATFORMS, default=[CLIENT_PLATFORM_EASY_EQUITIES]
+        ): cv.multi_select(CLIENT_PLATFORMS),
     }
 )
 
 
+async def _async_list_accounts(
+    hass: HomeAssistant, platform: str, username: str, password: str
+) -> list[Any]:
+    """Log in to a platform and return its accounts.
+
+    The list is cached, so the entry's first refresh doesn't fetch it again.
+    """
+    session = EasyEquitiesSession(hass, platform, username, password)
+    return await session.async_fetch(ENDPOINT_ACCOUNTS)
+
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
     username = data[CONF_USERNAME]
     password = data[CONF_PASSWORD]
-    is_satrix = data.get("is_satrix", False)
+    platforms = data[CONF_CLIENT_PLATFORMS]
 
     try:
-        if is_satrix:
-            client = SatrixClient()
-        else:
-            client = EasyEquitiesClient()
-
-        # Test login
-        await hass.async_add_executor_job(client.login, username, password)
+        # Log in to every platform at once, each with its own client
+        results = await asyncio.gather(
+            *(
+                _async_list_accounts(hass, platform, username, password)
+                for platform in platforms
+            )
+        )
 
-        # Get accounts
-        accounts = await hass.async_add_executor_job(client.accounts.list)
+        accounts: dict[str, str] = {}
+        for platform, platform_accounts in zip(platforms, results):
+            for acc in platform_accounts:
+                name = acc.name
+                if len(platforms) > 1:
+                    name = f"{name} ({CLIENT_PLATFORMS[platform]})"
+                accounts.setdefault(acc.id, name)
 
         if not accounts:
             raise CannotConnect("No accounts found")
 
         return {
             "title": f"Easy Equities ({username})",
-            "accounts": [{"id": acc.id, "name": acc.name} for acc in accounts],
+            "accounts": [{"id": acc_id, "name": name} for acc_id, name in accounts.items()],
         }
     except Exception as err:
         _LOGGER.exception("Validation error: %s", err)
@@ -66,7 +95,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
     @staticmethod
-    async def async_get_options_flow(
+    @callback
+    def async_get_options_flow(
         config_entry: config_entries.ConfigEntry,
     ) -> config_entries.OptionsFlow:
         """Get the options flow for this handler."""
@@ -83,7 +113,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle the initial step."""
         errors: dict[str, str] = {}
 
-        if user_input is not None:
+        if user_input is not None and not user_input.get(CONF_CLIENT_PLATFORMS):
+            errors[CONF_CLIENT_PLATFORMS] = "no_platforms"
+        elif user_input is not None:
             try:
                 info = await validate_input(self.hass, user_input)
                 self.data = user_input
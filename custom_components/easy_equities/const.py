@@ -7,12 +7,110 @@ DOMAIN: Final = "easy_equities"
 DEFAULT_NAME: Final = "Easy Equities"
 DEFAULT_SCAN_INTERVAL: Final = 300  # 5 minutes
 DEFAULT_TIMEOUT: Final = 30
+DEFAULT_RETRY_INTERVAL: Final = 60  # Retry failed accounts after 1 minute
+DEFAULT_MAX_CONCURRENT_REFRESHES: Final = 2  # Across all config entries
+DEFAULT_REFRESHES_PER_MINUTE: Final = 20  # Across all config entries
+DEFAULT_REFRESH_BURST: Final = 5  # Refreshes allowed before pacing starts
+DEFAULT_REFRESH_DEBOUNCE: Final = 10  # Seconds to coalesce refresh service calls
+
+DATA_SCHEDULER: Final = f"{DOMAIN}_scheduler"
+DATA_ALERTS: Final = f"{DOMAIN}_alerts"
+DATA_ALLOCATION: Final = f"{DOMAIN}_allocation"
+DATA_CACHE: Final = f"{DOMAIN}_cache"
+DATA_PROFILE_LOCK: Final = f"{DOMAIN}_profile_lock"
+DATA_STATISTICS: Final = f"{DOMAIN}_statistics"
+
+# Stores of the per-account income indexes and FIFO lots, formatted with the
+# entry id and keyed by the account coordinator attribute they persist
+ACCOUNT_STORAGE_KEYS: Final = {
+    "income": f"{DOMAIN}.income.{{}}",
+    "lots": f"{DOMAIN}.lots.{{}}",
+}
+ACCOUNT_STORAGE_VERSION: Final = 1
+ACCOUNT_SAVE_DELAY: Final = 10  # Seconds to collect changes before writing
+
+# Dispatcher signal, formatted with the entry id: (added_ids, removed_ids)
+SIGNAL_ACCOUNTS_UPDATED: Final = f"{DOMAIN}_accounts_updated_{{}}"
+# Dispatcher signal sent when the allocation targets change
+SIGNAL_ALLOCATION_UPDATED: Final = f"{DOMAIN}_allocation_updated"
 
 CONF_USERNAME: Final = "username"
 CONF_PASSWORD: Final = "password"
 CONF_ACCOUNT_ID: Final = "account_id"
 CONF_ACCOUNT_IDS: Final = "account_ids"  # Multiple accounts
 CONF_SCAN_INTERVAL: Final = "scan_interval"
+CONF_ACCOUNT_SCAN_INTERVALS: Final = "account_scan_intervals"  # Per-account overrides
+CONF_VALUE_CHANGE_THRESHOLD: Final = "value_change_threshold"
+CONF_TRADINGVIEW_OVERRIDES: Final = "tradingview_overrides"  # CODE=SYMBOL pairs
+CONF_TRANSACTION_RETENTION: Final = "transaction_retention"
+CONF_KEEP_RAW_DATA: Final = "keep_raw_data"
+CONF_PRICE_SCAN_INTERVAL: Final = "price_scan_interval"
+CONF_IS_SATRIX: Final = "is_satrix"  # Single platform entries
+CONF_CLIENT_PLATFORMS: Final = "platforms"
+CONF_POLLER: Final = "poller"  # HOST[:PORT] of scripts/poller.py
+CONF_POLLER_TOKEN: Final = "poller_token"
+
+# Broker platforms an entry can log in to, each with its own session
+CLIENT_PLATFORM_EASY_EQUITIES: Final = "easy_equities"
+CLIENT_PLATFORM_SATRIX: Final = "satrix"
+CLIENT_PLATFORMS: Final = {
+    CLIENT_PLATFORM_EASY_EQUITIES: "Easy Equities",
+    CLIENT_PLATFORM_SATRIX: "Satrix",
+}
+
+DEFAULT_VALUE_CHANGE_THRESHOLD: Final = 5.0  # Percent move that fires an event
+DEFAULT_TRANSACTION_RETENTION: Final = 10  # Recent transactions kept per account
+DEFAULT_PRICE_SCAN_INTERVAL: Final = 0  # Price-only refreshes disabled
+MIN_PRICE_SCAN_INTERVAL: Final = 30
+MAX_TRANSACTION_RETENTION: Final = 50
+
+# Events fired when the holdings of an account change between refreshes
+EVENT_HOLDING_OPENED: Final = f"{DOMAIN}_holding_opened"
+EVENT_HOLDING_CLOSED: Final = f"{DOMAIN}_holding_closed"
+EVENT_HOLDING_SHARES_CHANGED: Final = f"{DOMAIN}_holding_shares_changed"
+EVENT_HOLDING_VALUE_MOVED: Final = f"{DOMAIN}_holding_value_moved"
+EVENT_ALERT_TRIGGERED: Final = f"{DOMAIN}_alert_triggered"
+
+ALERT_METRICS: Final = ("price", "value")
+ALERT_DIRECTION_ABOVE: Final = "above"
+ALERT_DIRECTION_BELOW: Final = "below"
+ALERT_DIRECTION_BOTH: Final = "both"
+ALERT_DIRECTIONS: Final = (ALERT_DIRECTION_ABOVE, ALERT_DIRECTION_BELOW, ALERT_DIRECTION_BOTH)
+
+# API endpoints fetched per account
+ENDPOINT_HOLDINGS: Final = "holdings"
+ENDPOINT_VALUATIONS: Final = "valuations"
+ENDPOINT_TRANSACTIONS: Final = "transactions"
+ENDPOINTS: Final = (ENDPOINT_HOLDINGS, ENDPOINT_VALUATIONS, ENDPOINT_TRANSACTIONS)
+# Calls that are cached but not refreshed per account
+ENDPOINT_ACCOUNTS: Final = "accounts"
+ENDPOINT_PRICES: Final = "prices"  # Holdings without shares
+
+# Seconds a response is served from the cache. Shorter than the minimum scan
+# intervals, so scheduled refreshes always fetch; bursts and services reuse.
+CACHE_TTLS: Final = {
+    ENDPOINT_ACCOUNTS: 300,
+    ENDPOINT_HOLDINGS: 30,
+    ENDPOINT_PRICES: 10,
+    ENDPOINT_VALUATIONS: 30,
+    ENDPOINT_TRANSACTIONS: 30,
+}
+DEFAULT_CACHE_MAX_ENTRIES: Final = 256
+
+SERVICE_REFRESH: Final = "refresh"
+SERVICE_ADD_ALERT: Final = "add_alert"
+SERVICE_REMOVE_ALERT: Final = "remove_alert"
+SERVICE_LIST_ALERTS: Final = "list_alerts"
+SERVICE_FETCH_RAW_DATA: Final = "fetch_raw_data"
+SERVICE_EXPORT: Final = "export"
+SERVICE_PROFILE_REFRESH: Final = "profile_refresh"
+SERVICE_BACKFILL_STATISTICS: Final = "backfill_statistics"
+SERVICE_SET_ALLOCATION: Final = "set_allocation"
+SERVICE_CACHE_STATS: Final = "cache_stats"
+
+EXPORT_DIRECTORY: Final = "easy_equities_exports"  # Relative to the config dir
+ALLOCATION_FILE: Final = "easy_equities_allocation.yaml"  # Relative to the config dir
+ATTR_ENDPOINTS: Final = "endpoints"
 
 ATTR_ACCOUNT_NAME: Final = "account_name"
 ATTR_ACCOUNT_NUMBER: Final = "account_number"
@@ -25,3 +123,29 @@ ATTR_CURRENT_PRICE: Final = "current_price"
 ATTR_SHARES: Final = "shares"
 ATTR_CONTRACT_CODE: Final = "contract_code"
 ATTR_ISIN: Final = "isin"
+ATTR_STALE: Final = "stale"
+ATTR_STALE_SINCE: Final = "stale_since"
+ATTR_STALE_ACCOUNTS: Final = "stale_accounts"
+ATTR_TRADINGVIEW_SYMBOL: Final = "tradingview_symbol"
+ATTR_TRADINGVIEW_SYMBOLS: Final = "tradingview_symbols"
+ATTR_DIVIDENDS: Final = "dividends"
+ATTR_INTEREST: Final = "interest"
+ATTR_TRAILING_12_MONTHS: Final = "trailing_12_months"
+ATTR_MONTHLY: Final = "monthly"
+ATTR_BY_HOLDING: Final = "by_holding"
+ATTR_CASH_ITEMS: Final = "cash_items"
+ATTR_ACCRUED: Final = "accrued"
+ATTR_WEIGHT: Final = "weight"
+ATTR_PLATFORMS: Final = "platforms"
+ATTR_HOLDINGS: Final = "holdings"
+ATTR_EXCHANGES: Final = "exchanges"
+ATTR_BUY: Final = "buy"
+ATTR_SELL: Final = "sell"
+ATTR_ACCOUNTS: Final = "accounts"
+ATTR_CONTRACT_CODES: Final = "contract_codes"
+ATTR_REALIZED_GAIN: Final = "realized_gain"
+ATTR_UNREALIZED_GAIN: Final = "unrealized_gain"
+ATTR_COST_BASIS: Final = "cost_basis"
+ATTR_LOTS: Final = "lots"
+ATTR_OLDEST_LOT_DAYS: Final = "oldest_lot_days"
+ATTR_UNMATCHED_SHARES: Final = "unmatched_shares"
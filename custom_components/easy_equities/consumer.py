@@ -0,0 +1,166 @@
+"""Receive account snapshots from the poller daemon instead of polling.
+
+While ``scripts/poller.py`` keeps publishing an account, the account's
+coordinator stops its own schedule and applies each snapshot. When the
+connection drops, or the poller stops publishing an account for two of its
+intervals, the account's data is marked stale and it polls the API again
+until fresh snapshots arrive.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import json
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .snapshot import DEFAULT_POLLER_INTERVAL, MAX_SNAPSHOT_BYTES, decode_snapshot, parse_address
+
+if TYPE_CHECKING:
+    from .coordinator import EasyEquitiesDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+RECONNECT_MIN = 5  # Seconds
+RECONNECT_MAX = 300
+# Poller intervals without a snapshot after which an account polls again
+STALE_INTERVALS = 2
+
+
+class EasyEquitiesConsumer:
+    """Connection of one entry to the poller daemon."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: EasyEquitiesDataUpdateCoordinator,
+        address: str,
+        token: str,
+    ) -> None:
+        """Initialize the consumer."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.address = address
+        self.token = token
+        self.host, self.port = parse_address(address)
+        self.interval = DEFAULT_POLLER_INTERVAL
+        self.snapshots = 0
+        # When the snapshot last applied to each followed account was fetched
+        self._fetched: dict[str, datetime] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def max_age(self) -> timedelta:
+        """Return the age after which a snapshot is overdue."""
+        return timedelta(seconds=STALE_INTERVALS * self.interval)
+
+    def start(self) -> None:
+        """Start connecting to the poller in the background."""
+        self._task = self.hass.async_create_background_task(
+            self._async_run(), f"{self.coordinator.name} poller consumer"
+        )
+
+    def stop(self, resume: bool = True) -> None:
+        """Disconnect, letting the accounts poll again unless they are unloading."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if resume:
+            self._resume_polling()
+        self._fetched.clear()
+
+    def _resume_polling(self) -> None:
+        """Let every followed account poll the API again."""
+        for account_id in list(self._fetched):
+            self._unfollow(account_id)
+
+    def _unfollow(self, account_id: str) -> None:
+        """Mark an account's data stale and let it poll the API again."""
+        del self._fetched[account_id]
+        if (account_coordinator := self.coordinator.account_coordinators.get(account_id)) is None:
+            return
+        account_coordinator.async_set_subscribed(False)
+        account_coordinator.async_mark_stale(f"No snapshot from the poller at {self.address}")
+
+    async def _async_run(self) -> None:
+        """Keep a connection to the poller, reconnecting with backoff."""
+        delay = RECONNECT_MIN
+        while True:
+            try:
+                await self._async_receive()
+            except (OSError, asyncio.IncompleteReadError, ValueError) as err:
+                _LOGGER.warning(
+                    "Poller at %s unavailable, polling the API: %s", self.address, err
+                )
+            self._resume_polling()
+            if self.snapshots:
+                # Connections that delivered snapshots retry quickly
+                delay, self.snapshots = RECONNECT_MIN, 0
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX)
+
+    async def _async_receive(self) -> None:
+        """Read snapshots until the poller disconnects."""
+        reader, writer = await asyncio.open_connection(
+            self.host, self.port, limit=MAX_SNAPSHOT_BYTES
+        )
+        try:
+            writer.write(json.dumps({"token": self.token}).encode("utf-8") + b"\n")
+            await writer.drain()
+            _LOGGER.info("Connected to poller at %s", self.address)
+            while True:
+                try:
+                    # Wake up at least once per interval to notice overdue accounts
+                    line = await asyncio.wait_for(reader.readline(), self.interval)
+                except asyncio.TimeoutError:
+                    self._check_overdue()
+                    continue
+                if not line:
+                    break
+                try:
+                    snapshot = decode_snapshot(line)
+                except ValueError as err:
+                    _LOGGER.warning("Ignoring snapshot from %s: %s", self.address, err)
+                else:
+                    self._apply(snapshot)
+                self._check_overdue()
+            _LOGGER.warning("Poller at %s closed the connection", self.address)
+        finally:
+            writer.close()
+
+    def _check_overdue(self) -> None:
+        """Stop following the accounts the poller no longer publishes."""
+        now = dt_util.utcnow()
+        for account_id, fetched in list(self._fetched.items()):
+            if now - fetched > self.max_age:
+                _LOGGER.warning(
+                    "No snapshot of account %s from the poller at %s since %s, polling the API",
+                    account_id,
+                    self.address,
+                    fetched.isoformat(),
+                )
+                self._unfollow(account_id)
+
+    def _apply(self, snapshot: dict) -> None:
+        """Apply a fresh snapshot to the coordinator of its account."""
+        if str(snapshot.get("username", "")).lower() != self.coordinator.username.lower():
+            return
+        account_id = str(snapshot["account"]["id"])
+        account_coordinator = self.coordinator.account_coordinators.get(account_id)
+        if account_coordinator is None or account_coordinator.platform != snapshot.get("platform"):
+            return
+        if isinstance(interval := snapshot.get("interval"), int) and interval > 0:
+            self.interval = interval
+        fetched = dt_util.parse_datetime(str(snapshot.get("fetched_at")))
+        fetched = dt_util.as_utc(fetched) if fetched else dt_util.utcnow()
+        if dt_util.utcnow() - fetched > self.max_age:
+            # e.g. the latest snapshot of a poller that can no longer log in
+            _LOGGER.debug("Ignoring overdue snapshot of account %s", account_id)
+            return
+        self.snapshots += 1
+        self._fetched[account_id] = fetched
+        account_coordinator.async_set_subscribed(True)
+        account_coordinator.async_apply_snapshot(snapshot)
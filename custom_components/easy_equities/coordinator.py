@@ -1,305 +1,1181 @@
-"""Data update coordinator for Easy Equities."""
+"""Data update coordinators for Easy Equities."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Awaitable
+from contextlib import asynccontextmanager, suppress
+from functools import partial
 import logging
-from datetime import timedelta
+import time
+from datetime import date, timedelta
+from pathlib import Path
 from typing import Any
 
-from easy_equities_client.clients import EasyEquitiesClient, SatrixClient
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .allocation import compute_allocation
+from .client import EasyEquitiesSession
+from .consumer import EasyEquitiesConsumer
 from .const import (
-    ATTR_ACCOUNT_NAME,
-    ATTR_ACCOUNT_NUMBER,
-    ATTR_CURRENCY,
+    ACCOUNT_SAVE_DELAY,
+    ACCOUNT_STORAGE_KEYS,
+    ACCOUNT_STORAGE_VERSION,
     CONF_ACCOUNT_ID,
     CONF_ACCOUNT_IDS,
+    CONF_ACCOUNT_SCAN_INTERVALS,
+    CONF_CLIENT_PLATFORMS,
+    CONF_IS_SATRIX,
+    CONF_KEEP_RAW_DATA,
     CONF_PASSWORD,
+    CONF_POLLER,
+    CONF_POLLER_TOKEN,
+    CONF_PRICE_SCAN_INTERVAL,
     CONF_SCAN_INTERVAL,
+    CONF_TRADINGVIEW_OVERRIDES,
+    CONF_TRANSACTION_RETENTION,
     CONF_USERNAME,
+    CONF_VALUE_CHANGE_THRESHOLD,
+    CLIENT_PLATFORM_EASY_EQUITIES,
+    CLIENT_PLATFORM_SATRIX,
+    CLIENT_PLATFORMS,
+    DATA_ALERTS,
+    DATA_ALLOCATION,
+    DEFAULT_PRICE_SCAN_INTERVAL,
+    DEFAULT_REFRESH_DEBOUNCE,
+    DEFAULT_RETRY_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TRANSACTION_RETENTION,
+    DEFAULT_VALUE_CHANGE_THRESHOLD,
     DOMAIN,
+    ENDPOINT_ACCOUNTS,
+    ENDPOINT_HOLDINGS,
+    ENDPOINT_PRICES,
+    ENDPOINT_TRANSACTIONS,
+    ENDPOINT_VALUATIONS,
+    ENDPOINTS,
+    MIN_PRICE_SCAN_INTERVAL,
+    SIGNAL_ACCOUNTS_UPDATED,
+    SIGNAL_ALLOCATION_UPDATED,
 )
+from .events import diff_holdings, holding_key
+from .export import export_account
+from .income import IncomeIndex, combine_income
+from .lots import LotBook, combine_lots, summarize_lots
+from .positions import consolidate_positions
+from .retention import trim_holdings, trim_transactions, trim_valuations
+from .scheduler import async_get_scheduler
+from .tradingview import parse_overrides, tradingview_symbol
 from .util import parse_currency
+from .valuations import ValuationBreakdown, combine_breakdowns, parse_valuations
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def entry_platforms(entry: ConfigEntry) -> list[str]:
+    """Return the platforms of a config entry; older entries have one."""
+    if platforms := entry.data.get(CONF_CLIENT_PLATFORMS):
+        return list(platforms)
+    if entry.data.get(CONF_IS_SATRIX, False):
+        return [CLIENT_PLATFORM_SATRIX]
+    return [CLIENT_PLATFORM_EASY_EQUITIES]
+
+
+def _is_auth_error(err: Exception) -> bool:
+    """Return True if a client error looks like an authentication failure."""
+    return "login" in str(err).lower() or "authentication" in str(err).lower()
+
+
+def _patch_prices(
+    holdings: list[dict[str, Any]], prices: list[dict[str, Any]]
+) -> list[dict[str, Any]] | None:
+    """Return copies of the holdings with the prices and values of a price-only fetch.
+
+    Returns None when the positions differ, since shares, which the price-only
+    fetch leaves out, then need a full holdings refresh.
+    """
+    latest = {holding_key(holding): holding for holding in prices}
+    if len(latest) != len(holdings) or any(holding_key(h) not in latest for h in holdings):
+        return None
+    patched = []
+    for holding in holdings:
+        price = latest[holding_key(holding)]
+        patched.append(
+            {
+                **holding,
+                "current_price": price.get("current_price", holding.get("current_price")),
+                "current_value": price.get("current_value", holding.get("current_value")),
+            }
+        )
+    return patched
+
+
+def _raise_update_error(err: Exception) -> None:
+    """Translate a client error into the matching coordinator exception."""
+    # Check if it's an authentication error
+    if _is_auth_error(err):
+        raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
+    raise UpdateFailed(f"Error communicating with Easy Equities API: {err}") from err
+
+
 class EasyEquitiesDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Easy Equities data."""
+    """Portfolio-level coordinator aggregating the per-account coordinators.
+
+    Owns one API session per platform (Easy Equities, Satrix) and one
+    EasyEquitiesAccountCoordinator per selected account. Each account polls on
+    its own interval; this coordinator does not poll, it folds every account
+    update into the portfolio totals across platforms.
+    """
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
         _LOGGER.info("Initializing Easy Equities coordinator for entry: %s", entry.entry_id)
         self.entry = entry
-        self.client: EasyEquitiesClient | SatrixClient | None = None
-        # Support both single account (backward compat) and multiple accounts
-        account_ids = entry.data.get(CONF_ACCOUNT_IDS)
-        if not account_ids:
-            # Backward compatibility: single account
-            account_id = entry.data.get(CONF_ACCOUNT_ID)
-            self.account_ids = [account_id] if account_id else []
-            _LOGGER.debug("Using single account mode (backward compat): %s", account_id)
-        else:
-            self.account_ids = account_ids
-            _LOGGER.info("Using multiple accounts mode: %s accounts", len(account_ids))
+        self.account_ids = self._selected_account_ids()
         self.account_id = entry.data.get(CONF_ACCOUNT_ID)  # Keep for backward compat
         self.username = entry.data[CONF_USERNAME]
         self.password = entry.data[CONF_PASSWORD]
-        self.is_satrix = entry.data.get("is_satrix", False)
-        _LOGGER.debug("Client type: %s", "Satrix" if self.is_satrix else "Easy Equities")
+        self.tradingview_overrides = self._tradingview_overrides()
+        # Sessions are independent, so platforms are fetched concurrently
+        self.sessions: dict[str, EasyEquitiesSession] = {
+            platform: EasyEquitiesSession(hass, platform, self.username, self.password)
+            for platform in self._client_platforms()
+        }
+        _LOGGER.debug("Client platforms: %s", ", ".join(self.sessions))
 
-        scan_interval = timedelta(
-            seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-        )
-        _LOGGER.debug("Scan interval set to: %s seconds", scan_interval.total_seconds())
+        self.accounts: list[Any] = []
+        self.account_platforms: dict[str, str] = {}
+        self.account_coordinators: dict[str, EasyEquitiesAccountCoordinator] = {}
+        self._account_listeners: dict[str, CALLBACK_TYPE] = {}
+        # Running totals, adjusted by the delta of each account update
+        self._account_summaries: dict[str, dict[str, Any]] = {}
+        self._total_purchase_value = 0.0
+        self._total_current_value = 0.0
+        self._refreshing_accounts = False
+        # Connection to the poller daemon, when one is configured
+        self.consumer: EasyEquitiesConsumer | None = None
+        # Income indexes and FIFO lots per account id, loaded before the
+        # accounts are created
+        self._stores: dict[str, Store[dict[str, Any]]] = {
+            kind: Store(hass, ACCOUNT_STORAGE_VERSION, key.format(entry.entry_id))
+            for kind, key in ACCOUNT_STORAGE_KEYS.items()
+        }
+        self._stored: dict[str, dict[str, Any]] | None = None
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=scan_interval,
+            update_interval=None,
+        )
+        self._allocation_unsub = async_dispatcher_connect(
+            hass, SIGNAL_ALLOCATION_UPDATED, self._handle_allocation_update
         )
         _LOGGER.info("Coordinator initialized successfully")
 
-    async def async_update_interval(self) -> None:
-        """Update the scan interval from options."""
-        scan_interval = timedelta(
-            seconds=self.entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    def _client_platforms(self) -> list[str]:
+        """Return the platforms of the entry."""
+        return entry_platforms(self.entry)
+
+    def account_label(self, account: Any) -> str:
+        """Return the account name, with its platform if the entry has several."""
+        if len(self.sessions) < 2:
+            return account.name
+        platform = self.account_platforms.get(account.id, "")
+        return f"{account.name} ({CLIENT_PLATFORMS.get(platform, platform)})"
+
+    def _tradingview_overrides(self) -> dict[str, str]:
+        """Return the TradingView symbol overrides from the options."""
+        try:
+            return parse_overrides(self.entry.options.get(CONF_TRADINGVIEW_OVERRIDES, ""))
+        except ValueError as err:
+            _LOGGER.warning("Ignoring TradingView overrides: %s", err)
+            return {}
+
+    def _selected_account_ids(self) -> list[str]:
+        """Return the account ids selected in options or at setup."""
+        # Support both single account (backward compat) and multiple accounts
+        account_ids = self.entry.options.get(CONF_ACCOUNT_IDS) or self.entry.data.get(
+            CONF_ACCOUNT_IDS
         )
-        self.update_interval = scan_interval
+        if not account_ids:
+            # Backward compatibility: single account
+            account_id = self.entry.data.get(CONF_ACCOUNT_ID)
+            _LOGGER.debug("Using single account mode (backward compat): %s", account_id)
+            return [account_id] if account_id else []
+        _LOGGER.info("Using multiple accounts mode: %s accounts", len(account_ids))
+        return list(account_ids)
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from Easy Equities."""
-        _LOGGER.info("Starting data update for Easy Equities integration")
+    def account_scan_interval(self, account_id: str) -> timedelta:
+        """Return the scan interval configured for an account."""
+        overrides = self.entry.options.get(CONF_ACCOUNT_SCAN_INTERVALS, {})
+        return timedelta(
+            seconds=overrides.get(
+                account_id,
+                self.entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            )
+        )
+
+    @callback
+    def async_update_consumer(self) -> None:
+        """Connect to, reconnect to or disconnect from the poller from the options."""
+        address = self.entry.options.get(CONF_POLLER, "")
+        token = self.entry.options.get(CONF_POLLER_TOKEN, "")
+        if self.consumer is not None:
+            if (self.consumer.address, self.consumer.token) == (address, token):
+                return
+            self.consumer.stop()
+            self.consumer = None
+        if not address:
+            return
         try:
-            if not self.client:
-                _LOGGER.debug("Initializing client (type: %s)", "Satrix" if self.is_satrix else "Easy Equities")
-                # Initialize client
-                if self.is_satrix:
-                    self.client = SatrixClient()
-                else:
-                    self.client = EasyEquitiesClient()
+            self.consumer = EasyEquitiesConsumer(self.hass, self, address, token)
+        except ValueError as err:
+            _LOGGER.error("Not using the poller at %s: %s", address, err)
+            return
+        _LOGGER.info("Receiving account snapshots from the poller at %s", address)
+        self.consumer.start()
 
-                # Login
-                _LOGGER.debug("Attempting login for user: %s", self.username)
-                await self.hass.async_add_executor_job(
-                    self.client.login, self.username, self.password
-                )
-                _LOGGER.info("Login successful")
+    def stored_state(self, kind: str, account_id: str) -> dict[str, Any] | None:
+        """Return the stored income index or lot book of an account."""
+        return (self._stored or {}).get(kind, {}).get(account_id)
+
+    @callback
+    def async_schedule_save(self, kind: str) -> None:
+        """Write the income indexes or lot books after changes have settled."""
+        self._stores[kind].async_delay_save(
+            partial(self._state_to_save, kind), ACCOUNT_SAVE_DELAY
+        )
+
+    def _state_to_save(self, kind: str) -> dict[str, Any]:
+        """Return the states of a kind to store; deselected accounts keep theirs."""
+        if self._stored is None:
+            self._stored = {}
+        stored = self._stored.setdefault(kind, {})
+        for account_id, account_coordinator in self.account_coordinators.items():
+            stored[account_id] = getattr(account_coordinator, kind).as_dict()
+        return stored
+
+    async def async_save_state(self) -> None:
+        """Write the income indexes and lot books now, e.g. when the entry unloads."""
+        if self._stored is None:
+            return
+        for kind, store in self._stores.items():
+            await store.async_save(self._state_to_save(kind))
+
+    async def async_update_interval(self) -> None:
+        """Update the scan interval of every account from options."""
+        for account_id, account_coordinator in self.account_coordinators.items():
+            account_coordinator.scan_interval = self.account_scan_interval(account_id)
+            if account_coordinator.subscribed:
+                continue
+            if not account_coordinator.data or not account_coordinator.data.get("stale"):
+                account_coordinator.update_interval = account_coordinator.scan_interval
+                # Re-arm the pending timer so the new interval applies now
+                if account_coordinator.data is not None:
+                    account_coordinator._schedule_refresh()
+
+    async def async_apply_options(self) -> None:
+        """Apply changed options to the running coordinators.
+
+        Interval changes re-arm each account's pending refresh right away.
+        Accounts added to the selection are fetched and accounts removed from
+        it are dropped, without logging in again or refreshing the other
+        accounts.
+        """
+        await self.async_update_interval()
+        for account_coordinator in self.account_coordinators.values():
+            account_coordinator.async_update_price_interval()
+        self.async_update_consumer()
+
+        overrides = self._tradingview_overrides()
+        if overrides != self.tradingview_overrides:
+            self.tradingview_overrides = overrides
+            for account_coordinator in self.account_coordinators.values():
+                account_coordinator.async_update_tradingview_symbols()
+            self.async_update_listeners()
 
-            # Get account data
-            _LOGGER.debug("Fetching account list")
-            accounts = await self.hass.async_add_executor_job(
-                self.client.accounts.list
+        account_ids = self._selected_account_ids()
+        if account_ids == self.account_ids:
+            return
+        self.account_ids = account_ids
+
+        removed = [
+            account_id
+            for account_id in self.account_coordinators
+            if account_id not in account_ids
+        ]
+        for account_id in removed:
+            _LOGGER.info("Account %s deselected, removing", account_id)
+            self._account_listeners.pop(account_id)()
+            account_coordinator = self.account_coordinators.pop(account_id)
+            account_coordinator.async_unload()
+            # Kept, so income and lots are complete if the account is selected again
+            if self._stored is not None:
+                for kind in ACCOUNT_STORAGE_KEYS:
+                    self._stored.setdefault(kind, {})[account_id] = getattr(
+                        account_coordinator, kind
+                    ).as_dict()
+            previous = self._account_summaries.pop(account_id, None)
+            if previous is not None:
+                self._total_purchase_value -= previous["total_purchase_value"]
+                self._total_current_value -= previous["total_current_value"]
+
+        added = [
+            account
+            for account in self.accounts
+            if account.id in account_ids and account.id not in self.account_coordinators
+        ]
+        for account in added:
+            _LOGGER.info("Account %s selected, adding", account.name)
+            self._add_account_coordinator(account)
+
+        self._refreshing_accounts = True
+        try:
+            await asyncio.gather(
+                *(
+                    self.account_coordinators[account.id].async_refresh()
+                    for account in added
+                )
             )
-            _LOGGER.info("Found %d account(s)", len(accounts))
-
-            if not accounts:
-                _LOGGER.error("No accounts found for user: %s", self.username)
-                raise UpdateFailed("No accounts found")
-
-            # Determine which accounts to fetch
-            accounts_to_fetch = []
-            if self.account_ids:
-                # Multiple accounts selected
-                _LOGGER.debug("Processing %d selected account(s)", len(self.account_ids))
-                for account_id in self.account_ids:
-                    account = next(
-                        (acc for acc in accounts if acc.id == account_id), None
+        finally:
+            self._refreshing_accounts = False
+        for account in added:
+            account_coordinator = self.account_coordinators[account.id]
+            if account_coordinator.data:
+                self._apply_account_summary(account.id, account_coordinator.data["summary"])
+
+        self.async_set_updated_data(self._build_result())
+        async_dispatcher_send(
+            self.hass,
+            SIGNAL_ACCOUNTS_UPDATED.format(self.entry.entry_id),
+            [account.id for account in added],
+            removed,
+        )
+
+    async def _async_list_accounts(self, session: EasyEquitiesSession) -> list[Any]:
+        """Return the accounts of one platform."""
+        async with async_get_scheduler(self.hass).async_slot():
+            _LOGGER.debug("Fetching %s account list", session.platform)
+            return await session.async_fetch(ENDPOINT_ACCOUNTS)
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Refresh the account lists and every account coordinator."""
+        _LOGGER.info("Starting data update for Easy Equities integration")
+        results = await asyncio.gather(
+            *(self._async_list_accounts(session) for session in self.sessions.values()),
+            return_exceptions=True,
+        )
+        accounts: list[Any] = []
+        errors: list[BaseException] = []
+        for session, result in zip(self.sessions.values(), results):
+            if isinstance(result, BaseException):
+                _LOGGER.error("Failed to list %s accounts: %s", session.platform, result)
+                # Force a fresh login attempt on the next refresh
+                session.invalidate()
+                errors.append(result)
+                # Keep the platform's known accounts; they are served stale
+                accounts.extend(
+                    account
+                    for account in self.accounts
+                    if self.account_platforms.get(account.id) == session.platform
+                )
+                continue
+            for account in result:
+                platform = self.account_platforms.setdefault(account.id, session.platform)
+                if platform != session.platform:
+                    _LOGGER.warning(
+                        "Ignoring %s account %s, its id is already used on %s",
+                        session.platform,
+                        account.name,
+                        platform,
                     )
-                    if account:
-                        accounts_to_fetch.append(account)
-                        _LOGGER.debug("Added account: %s (%s)", account.name, account.id)
-                    else:
-                        _LOGGER.warning("Account ID %s not found in available accounts", account_id)
-            elif self.account_id:
-                # Single account (backward compatibility)
-                _LOGGER.debug("Processing single account: %s", self.account_id)
+                    continue
+                accounts.append(account)
+        if errors and len(errors) == len(self.sessions):
+            if not isinstance(errors[0], Exception):
+                raise errors[0]
+            _raise_update_error(errors[0])
+        _LOGGER.info("Found %d account(s)", len(accounts))
+
+        if not accounts:
+            _LOGGER.error("No accounts found for user: %s", self.username)
+            raise UpdateFailed("No accounts found")
+        self.accounts = accounts
+
+        # Determine which accounts to fetch
+        accounts_to_fetch = []
+        if self.account_ids:
+            # Multiple accounts selected
+            _LOGGER.debug("Processing %d selected account(s)", len(self.account_ids))
+            for account_id in self.account_ids:
                 account = next(
-                    (acc for acc in accounts if acc.id == self.account_id), None
+                    (acc for acc in accounts if acc.id == account_id), None
                 )
                 if account:
                     accounts_to_fetch.append(account)
                     _LOGGER.debug("Added account: %s (%s)", account.name, account.id)
-            else:
-                # No account specified, use first account
-                _LOGGER.debug("No account specified, using first account")
-                accounts_to_fetch = [accounts[0]]
-                _LOGGER.debug("Using account: %s (%s)", accounts[0].name, accounts[0].id)
-
-            if not accounts_to_fetch:
-                _LOGGER.error("No valid accounts found after filtering")
-                raise UpdateFailed("No valid accounts found")
-
-            # Fetch data for all selected accounts
-            _LOGGER.info("Fetching data for %d account(s)", len(accounts_to_fetch))
-            all_accounts_data = []
-            all_holdings = []
-            total_purchase_value = 0.0
-            total_current_value = 0.0
-
-            for account in accounts_to_fetch:
-                _LOGGER.debug("Processing account: %s (%s)", account.name, account.id)
-                
-                # Fetch holdings
-                _LOGGER.debug("Fetching holdings for account: %s", account.id)
-                holdings = await self.hass.async_add_executor_job(
-                    self.client.accounts.holdings, account.id, True
+                else:
+                    _LOGGER.warning("Account ID %s not found in available accounts", account_id)
+        elif self.account_id:
+            # Single account (backward compatibility)
+            _LOGGER.debug("Processing single account: %s", self.account_id)
+            account = next(
+                (acc for acc in accounts if acc.id == self.account_id), None
+            )
+            if account:
+                accounts_to_fetch.append(account)
+                _LOGGER.debug("Added account: %s (%s)", account.name, account.id)
+        else:
+            # No account specified, use first account
+            _LOGGER.debug("No account specified, using first account")
+            accounts_to_fetch = [accounts[0]]
+            _LOGGER.debug("Using account: %s (%s)", accounts[0].name, accounts[0].id)
+
+        if not accounts_to_fetch:
+            _LOGGER.error("No valid accounts found after filtering")
+            raise UpdateFailed("No valid accounts found")
+
+        if self._stored is None:
+            self._stored = {
+                kind: await store.async_load() or {} for kind, store in self._stores.items()
+            }
+        for account in accounts_to_fetch:
+            if account.id not in self.account_coordinators:
+                self._add_account_coordinator(account)
+
+        # Refresh every account concurrently; their listeners are muted so the
+        # totals are rebuilt once below instead of once per account
+        self._refreshing_accounts = True
+        try:
+            await asyncio.gather(
+                *(
+                    self.account_coordinators[account.id].async_refresh()
+                    for account in accounts_to_fetch
                 )
-                _LOGGER.info("Account %s: Found %d holding(s)", account.name, len(holdings))
+            )
+        finally:
+            self._refreshing_accounts = False
+
+        for account in accounts_to_fetch:
+            account_coordinator = self.account_coordinators[account.id]
+            if isinstance(account_coordinator.last_exception, ConfigEntryAuthFailed):
+                raise account_coordinator.last_exception
+
+        self._account_summaries = {}
+        self._total_purchase_value = 0.0
+        self._total_current_value = 0.0
+        for account_id, account_coordinator in self.account_coordinators.items():
+            if account_coordinator.data:
+                self._apply_account_summary(account_id, account_coordinator.data["summary"])
+
+        if not self._account_summaries:
+            raise UpdateFailed("Failed to fetch data for all accounts")
+
+        return self._build_result()
+
+    def _add_account_coordinator(self, account: Any) -> None:
+        """Create the coordinator for an account and follow its updates."""
+        account_coordinator = EasyEquitiesAccountCoordinator(self.hass, self, account)
+        self.account_coordinators[account.id] = account_coordinator
+        # Listening also starts the account's own refresh schedule
+        self._account_listeners[account.id] = account_coordinator.async_add_listener(
+            lambda: self._handle_account_update(account.id)
+        )
+
+    @callback
+    def async_unload(self) -> None:
+        """Stop following the account coordinators."""
+        self._allocation_unsub()
+        if self.consumer is not None:
+            self.consumer.stop(resume=False)
+            self.consumer = None
+        for account_id, account_coordinator in self.account_coordinators.items():
+            self._account_listeners.pop(account_id)()
+            account_coordinator.async_unload()
+
+    @callback
+    def _handle_account_update(self, account_id: str) -> None:
+        """Fold an account update into the portfolio totals."""
+        if self._refreshing_accounts:
+            return
+        account_coordinator = self.account_coordinators.get(account_id)
+        if not account_coordinator or not account_coordinator.data:
+            return
+        self._apply_account_summary(account_id, account_coordinator.data["summary"])
+        self.async_set_updated_data(self._build_result())
+
+    @callback
+    def _handle_allocation_update(self) -> None:
+        """Recompute the allocation against the new targets."""
+        if self.data is not None:
+            self.async_set_updated_data(self._build_result())
+
+    def _apply_account_summary(self, account_id: str, summary: dict[str, Any]) -> None:
+        """Replace an account's contribution to the running totals."""
+        previous = self._account_summaries.get(account_id)
+        if previous is not None:
+            self._total_purchase_value -= previous["total_purchase_value"]
+            self._total_current_value -= previous["total_current_value"]
+        self._total_purchase_value += summary["total_purchase_value"]
+        self._total_current_value += summary["total_current_value"]
+        self._account_summaries[account_id] = summary
+
+    def _build_result(self) -> dict[str, Any]:
+        """Combine per-account data into the portfolio result."""
+        all_accounts_data = [
+            account_coordinator.data
+            for account_coordinator in self.account_coordinators.values()
+            if account_coordinator.data
+        ]
+        all_holdings = [
+            holding
+            for account_data in all_accounts_data
+            for holding in account_data["holdings"]
+        ]
+        total_purchase_value = self._total_purchase_value
+        total_current_value = self._total_current_value
+
+        # Calculate overall totals
+        total_profit_loss = total_current_value - total_purchase_value
+        total_profit_loss_percent = (
+            (total_profit_loss / total_purchase_value * 100)
+            if total_purchase_value > 0
+            else 0
+        )
+
+        _LOGGER.info(
+            "Overall totals: Purchase=%.2f, Current=%.2f, Profit/Loss=%.2f (%.2f%%), Holdings=%d",
+            total_purchase_value,
+            total_current_value,
+            total_profit_loss,
+            total_profit_loss_percent,
+            len(all_holdings)
+        )
+
+        # Totals per platform, for entries holding Easy Equities and Satrix
+        platforms: dict[str, dict[str, float]] = {}
+        for account_data in all_accounts_data:
+            totals = platforms.setdefault(
+                account_data["account"]["platform"],
+                {"total_purchase_value": 0.0, "total_current_value": 0.0},
+            )
+            totals["total_purchase_value"] += account_data["summary"]["total_purchase_value"]
+            totals["total_current_value"] += account_data["summary"]["total_current_value"]
+
+        # Weights, drift and rebalancing amounts against the allocation targets
+        allocation = None
+        if (targets := self.hass.data.get(DATA_ALLOCATION)) is not None:
+            allocation = compute_allocation(all_holdings, targets.targets)
+
+        # Use first account for backward compatibility
+        primary_account = all_accounts_data[0]["account"] if all_accounts_data else None
 
-                # Fetch valuations
-                _LOGGER.debug("Fetching valuations for account: %s", account.id)
-                valuations = await self.hass.async_add_executor_job(
-                    self.client.accounts.valuations, account.id
+        return {
+            "account": primary_account,  # Primary account for backward compatibility
+            "accounts": all_accounts_data,  # All accounts data
+            "holdings": all_holdings,  # All holdings from all accounts
+            "transactions": [
+                tx for account_data in all_accounts_data
+                for tx in account_data["transactions"]
+            ][:50],  # Combined transactions, limit to 50
+            "summary": {
+                "total_purchase_value": total_purchase_value,
+                "total_current_value": total_current_value,
+                "total_profit_loss": total_profit_loss,
+                "total_profit_loss_percent": total_profit_loss_percent,
+                "holdings_count": len(all_holdings),
+                "platforms": platforms,
+            },
+            "breakdown": combine_breakdowns(
+                [account_data["breakdown"] for account_data in all_accounts_data]
+            ),
+            "income": combine_income(
+                (
+                    account_coordinator.income
+                    for account_coordinator in self.account_coordinators.values()
+                ),
+                dt_util.now().date(),
+            ),
+            "allocation": allocation,
+            # FIFO lot gains and ages, per contract code and in total
+            "lots": combine_lots(account_data["lots"] for account_data in all_accounts_data),
+            # Holdings of one instrument combined across accounts
+            "positions": consolidate_positions(all_holdings),
+            "stale_accounts": [
+                account_data["account"]["id"]
+                for account_data in all_accounts_data
+                if account_data.get("stale")
+            ],
+        }
+
+
+class EasyEquitiesAccountCoordinator(DataUpdateCoordinator):
+    """Coordinator fetching a single account on its own schedule.
+
+    When a refresh fails the last good data is kept, flagged as stale, and the
+    account is retried on the shorter retry interval.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        portfolio: EasyEquitiesDataUpdateCoordinator,
+        account: Any,
+    ) -> None:
+        """Initialize the account coordinator."""
+        self.portfolio = portfolio
+        self.account = account
+        self.account_id: str = account.id
+        self.platform = portfolio.account_platforms.get(account.id, CLIENT_PLATFORM_EASY_EQUITIES)
+        self.session = portfolio.sessions[self.platform]
+        self.scan_interval = portfolio.account_scan_interval(account.id)
+        self.retry_interval = timedelta(seconds=DEFAULT_RETRY_INTERVAL)
+        self._scheduler = async_get_scheduler(hass)
+        self._scheduler_key = f"{portfolio.entry.entry_id}_{account.id}"
+        # Offset the first scheduled refresh so entries don't poll in lockstep
+        self._phase = self._scheduler.async_register(self._scheduler_key)
+        self._phase_pending = True
+        # Latest response per endpoint, so targeted refreshes can reuse the rest
+        self._responses: dict[str, Any] = {}
+        self._pending_endpoints: set[str] = set()
+        # Outcome of the refresh that will serve the pending endpoints
+        self._pending_result: asyncio.Future[None] | None = None
+        # Seconds spent on each API call and on building the data, last refresh
+        self.timings: dict[str, float] = {}
+        # Holding values at their last value_moved event
+        self._value_baselines: dict[str, float] = {}
+        # Income and fees, indexed once per transaction as transactions arrive
+        self.income = IncomeIndex.from_dict(portfolio.stored_state("income", account.id))
+        # FIFO lots, applying each trade once as transactions arrive
+        self.lots = LotBook.from_dict(portfolio.stored_state("lots", account.id))
+        # Parsed once per valuations response, before it is trimmed
+        self.breakdown: ValuationBreakdown = parse_valuations(None)
+        # True from the time a full or endpoint refresh waits for the session
+        self._refreshing = False
+        # True while snapshots from the poller replace the own schedule
+        self.subscribed = False
+        _LOGGER.debug(
+            "Account %s scan interval set to: %s seconds",
+            account.name,
+            self.scan_interval.total_seconds(),
+        )
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{account.id}",
+            update_interval=self.scan_interval,
+        )
+        # Bursts of refresh requests collapse into one fetch per window
+        self._endpoint_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=DEFAULT_REFRESH_DEBOUNCE,
+            immediate=True,
+            function=self._async_refresh_pending_endpoints,
+        )
+        self._price_unsub: CALLBACK_TYPE | None = None
+        self.async_update_price_interval()
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data for the account, serving stale data on failure."""
+        try:
+            async with self._async_account_refresh():
+                responses = await self._async_fetch_endpoints(set(ENDPOINTS))
+            started = time.perf_counter()
+            self._retain_responses(responses)
+            data = self._build_data()
+            self.timings["build"] = time.perf_counter() - started
+        except Exception as err:
+            # Force a fresh login attempt on the next refresh
+            self.session.invalidate()
+            # Failing accounts are retried sooner, whether or not they ever loaded
+            self.update_interval = None if self.subscribed else self.retry_interval
+            if self.data is None or _is_auth_error(err):
+                _LOGGER.exception(
+                    "Unexpected error updating account %s: %s", self.account.name, err
                 )
-                _LOGGER.debug("Account %s: Found %d valuation(s)", account.name, len(valuations))
-                
-                # Extract currency from valuations
-                account_currency = "ZAR"  # Default fallback
-                if valuations and isinstance(valuations, dict):
-                    top_summary = valuations.get("TopSummary", {})
-                    account_currency = top_summary.get("AccountCurrency", account_currency)
-                    _LOGGER.debug("Account %s currency: %s", account.name, account_currency)
-
-                # Fetch transactions (last 30 days)
-                _LOGGER.debug("Fetching transactions for account: %s", account.id)
-                transactions = await self.hass.async_add_executor_job(
-                    self.client.accounts.transactions, account.id
+                _raise_update_error(err)
+            _LOGGER.warning(
+                "Failed to update account %s (%s), serving cached data: %s",
+                self.account.name,
+                self.account_id,
+                err,
+            )
+            return self._stale_data(err)
+
+        self._fire_holding_events(data)
+        if self.subscribed:
+            self.update_interval = None
+            return data
+        self.update_interval = self.scan_interval
+        if self._phase_pending:
+            self._phase_pending = False
+            self.update_interval += self.scan_interval * self._phase
+            _LOGGER.debug(
+                "Account %s first scheduled refresh in %s seconds",
+                self.account.name,
+                self.update_interval.total_seconds(),
+            )
+        return data
+
+    @asynccontextmanager
+    async def _async_account_refresh(self) -> AsyncIterator[None]:
+        """Hold the platform's session and a scheduler slot to refresh the account."""
+        self._refreshing = True
+        try:
+            async with self.session.account_lock, self._scheduler.async_slot():
+                yield
+        finally:
+            self._refreshing = False
+
+    async def async_request_endpoint_refresh(self, endpoints: set[str]) -> None:
+        """Request a refresh of some endpoints of the account.
+
+        Requests are merged until the refresh runs; a request made while a
+        refresh is in flight, or within the debounce window after it, is
+        served by a single follow-up refresh. Raises HomeAssistantError if
+        the refresh serving the request fails.
+        """
+        self._pending_endpoints |= endpoints
+        if self._pending_result is None:
+            self._pending_result = self.hass.loop.create_future()
+        result = self._pending_result
+        await self._endpoint_debouncer.async_call()
+        await result
+
+    async def _async_refresh_pending_endpoints(self) -> None:
+        """Refresh the pending endpoints and resolve the requests they serve."""
+        endpoints, self._pending_endpoints = self._pending_endpoints, set()
+        result, self._pending_result = self._pending_result, None
+        if not endpoints or result is None:
+            return
+        try:
+            await self._async_refresh_endpoints(endpoints)
+        except HomeAssistantError as err:
+            result.set_exception(err)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected error refreshing account %s", self.account.name)
+            result.set_exception(
+                HomeAssistantError(f"Failed to refresh account {self.account.name}: {err}")
+            )
+        else:
+            result.set_result(None)
+        finally:
+            # Never leave the merged requests waiting, even when cancelled
+            if not result.done():
+                result.set_exception(
+                    HomeAssistantError(f"Refresh of account {self.account.name} was cancelled")
                 )
-                _LOGGER.debug("Account %s: Found %d transaction(s)", account.name, len(transactions))
-
-                # Calculate account totals with proper currency parsing
-                _LOGGER.debug("Calculating totals for account: %s", account.name)
-                account_purchase_value = 0.0
-                account_current_value = 0.0
-                
-                for holding in holdings:
-                    try:
-                        purchase_val_str = holding.get("purchase_value", "0")
-                        current_val_str = holding.get("current_value", "0")
-                        
-                        purchase_val = parse_currency(purchase_val_str)
-                        current_val = parse_currency(current_val_str)
-                        
-                        account_purchase_value += purchase_val
-                        account_current_value += current_val
-                        
-                        _LOGGER.debug(
-                            "Holding %s: purchase=%s (parsed: %.2f), current=%s (parsed: %.2f)",
-                            holding.get("name", "Unknown"),
-                            purchase_val_str,
-                            purchase_val,
-                            current_val_str,
-                            current_val
-                        )
-                    except Exception as err:
-                        _LOGGER.error(
-                            "Error parsing currency for holding %s: %s. Purchase: %s, Current: %s",
-                            holding.get("name", "Unknown"),
-                            err,
-                            holding.get("purchase_value"),
-                            holding.get("current_value")
-                        )
-                        # Continue with other holdings
-                        continue
-
-                _LOGGER.info(
-                    "Account %s totals: Purchase=%.2f, Current=%.2f, Profit/Loss=%.2f",
-                    account.name,
-                    account_purchase_value,
-                    account_current_value,
-                    account_current_value - account_purchase_value
+
+    async def _async_refresh_endpoints(self, endpoints: set[str]) -> None:
+        """Fetch endpoints and publish the updated data.
+
+        Raises HomeAssistantError if the account couldn't be refreshed.
+        """
+        if not self._responses:
+            # Nothing to patch yet, fall back to a regular refresh
+            await self.async_refresh()
+            if not self.last_update_success:
+                raise HomeAssistantError(
+                    f"Failed to refresh account {self.account.name}: {self.last_exception}"
                 )
+            return
+        _LOGGER.debug(
+            "Refreshing %s for account %s", ", ".join(sorted(endpoints)), self.account.name
+        )
+        try:
+            async with self._async_account_refresh():
+                # Requested refreshes want the latest data, not a cached response
+                responses = await self._async_fetch_endpoints(endpoints, force=True)
+        except Exception as err:
+            self.session.invalidate()
+            _LOGGER.warning(
+                "Failed to refresh %s for account %s: %s",
+                ", ".join(sorted(endpoints)),
+                self.account.name,
+                err,
+            )
+            raise HomeAssistantError(
+                f"Failed to refresh {', '.join(sorted(endpoints))} "
+                f"for account {self.account.name}: {err}"
+            ) from err
+        self._retain_responses(responses)
+        data = self._build_data()
+        self._fire_holding_events(data)
+        self.async_set_updated_data(data)
+
+    @callback
+    def async_update_price_interval(self) -> None:
+        """Start, restart or stop the price-only refreshes from the options."""
+        if self._price_unsub is not None:
+            self._price_unsub()
+            self._price_unsub = None
+        seconds = self.portfolio.entry.options.get(
+            CONF_PRICE_SCAN_INTERVAL, DEFAULT_PRICE_SCAN_INTERVAL
+        )
+        if not seconds or self.subscribed:
+            return
+        interval = timedelta(seconds=max(seconds, MIN_PRICE_SCAN_INTERVAL))
+        if interval >= self.scan_interval:
+            # Every price refresh would be a full one anyway
+            return
+        self._price_unsub = async_track_time_interval(
+            self.hass,
+            self._async_refresh_prices,
+            interval,
+            name=f"{DOMAIN} prices {self.account.name}",
+        )
+
+    async def _async_refresh_prices(self, _now: Any = None) -> None:
+        """Patch the latest prices and values into the current data.
+
+        Fetches the holdings without shares, a single API call, and leaves
+        the schedule of the full refresh untouched.
+        """
+        if self.data is None or self.data.get("stale") or not self._responses:
+            return
+        if self._refreshing:
+            # A refresh of this account is running and will bring fresh prices
+            return
+        try:
+            # Waits for the refreshes of the platform's other accounts
+            async with self.session.account_lock, self._scheduler.async_slot():
+                prices = await self._async_timed_job(
+                    ENDPOINT_PRICES, self.session.async_fetch(ENDPOINT_PRICES, self.account_id)
+                )
+        except Exception as err:
+            # Only log in again when the session expired; other accounts share it
+            if _is_auth_error(err):
+                self.session.invalidate()
+            _LOGGER.debug("Failed to refresh prices for account %s: %s", self.account.name, err)
+            return
+        holdings = _patch_prices(self._responses.get(ENDPOINT_HOLDINGS, []), prices)
+        if holdings is None:
+            _LOGGER.debug("Positions of account %s changed, refreshing holdings", self.account.name)
+            # A failure is already logged by the holdings refresh
+            with suppress(HomeAssistantError):
+                await self.async_request_endpoint_refresh({ENDPOINT_HOLDINGS})
+            return
+        self._responses[ENDPOINT_HOLDINGS] = holdings
+        data = self._build_data()
+        self._fire_holding_events(data)
+        # Publish without async_set_updated_data, which would push back the full refresh
+        self.data = data
+        self.async_update_listeners()
+
+    @callback
+    def async_set_subscribed(self, subscribed: bool) -> None:
+        """Stop polling while the poller publishes the account, or resume."""
+        if subscribed == self.subscribed:
+            return
+        self.subscribed = subscribed
+        _LOGGER.debug(
+            "Account %s %s",
+            self.account.name,
+            "follows the poller" if subscribed else "polls the API again",
+        )
+        if subscribed:
+            self.update_interval = None
+            self._unschedule_refresh()
+        else:
+            self.update_interval = self.scan_interval
+            if self.data is not None:
+                self._schedule_refresh()
+        self.async_update_price_interval()
+
+    @callback
+    def async_mark_stale(self, reason: str) -> None:
+        """Flag the data as stale and refresh it from the API."""
+        if self.data is not None and not self.data.get("stale"):
+            self.async_set_updated_data(self._stale_data(reason))
+        self.hass.async_create_task(self.async_request_refresh())
 
-                # Add account identifier and currency to holdings
-                for holding in holdings:
-                    holding["_account_id"] = account.id
-                    holding["_account_name"] = account.name
-                    holding["_account_currency"] = account_currency
-
-                all_holdings.extend(holdings)
-                total_purchase_value += account_purchase_value
-                total_current_value += account_current_value
-
-                all_accounts_data.append({
-                    "account": {
-                        "id": account.id,
-                        "name": account.name,
-                        "trading_currency_id": account.trading_currency_id,
-                        "currency": account_currency,
-                    },
-                    "holdings": holdings,
-                    "valuations": valuations,
-                    "transactions": transactions[:50],  # Limit to last 50 transactions
-                    "summary": {
-                        "total_purchase_value": account_purchase_value,
-                        "total_current_value": account_current_value,
-                        "total_profit_loss": account_current_value - account_purchase_value,
-                        "total_profit_loss_percent": (
-                            ((account_current_value - account_purchase_value) / account_purchase_value * 100)
-                            if account_purchase_value > 0
-                            else 0
-                        ),
-                        "holdings_count": len(holdings),
-                        "currency": account_currency,
-                    },
-                })
-
-            # Calculate overall totals
-            total_profit_loss = total_current_value - total_purchase_value
-            total_profit_loss_percent = (
-                (total_profit_loss / total_purchase_value * 100)
-                if total_purchase_value > 0
-                else 0
+    @callback
+    def async_apply_snapshot(self, snapshot: dict[str, Any]) -> None:
+        """Apply the responses of a poller snapshot as a refresh."""
+        responses = {
+            endpoint: response
+            for endpoint, response in snapshot["responses"].items()
+            if endpoint in ENDPOINTS
+        }
+        started = time.perf_counter()
+        self._retain_responses(responses)
+        data = self._build_data()
+        data["last_updated"] = snapshot.get("fetched_at") or data["last_updated"]
+        self.timings = {"build": time.perf_counter() - started}
+        self._fire_holding_events(data)
+        self.async_set_updated_data(data)
+
+    @callback
+    def async_unload(self) -> None:
+        """Release the scheduler slot held by the account."""
+        self._endpoint_debouncer.async_cancel()
+        if self._pending_result is not None:
+            self._pending_result.set_exception(
+                HomeAssistantError(f"Account {self.account.name} was unloaded before refreshing")
             )
+            self._pending_result = None
+        if self._price_unsub is not None:
+            self._price_unsub()
+            self._price_unsub = None
+        self._scheduler.async_unregister(self._scheduler_key)
 
-            _LOGGER.info(
-                "Overall totals: Purchase=%.2f, Current=%.2f, Profit/Loss=%.2f (%.2f%%), Holdings=%d",
-                total_purchase_value,
-                total_current_value,
-                total_profit_loss,
-                total_profit_loss_percent,
-                len(all_holdings)
+    @callback
+    def async_update_tradingview_symbols(self) -> None:
+        """Re-map the TradingView symbols of the current holdings."""
+        if self.data is None:
+            return
+        for holding in self.data["holdings"]:
+            holding["_tradingview_symbol"] = tradingview_symbol(
+                holding.get("contract_code"), self.portfolio.tradingview_overrides
             )
+        self.async_update_listeners()
 
-            # Use first account for backward compatibility
-            primary_account = all_accounts_data[0]["account"] if all_accounts_data else None
-
-            result = {
-                "account": primary_account,  # Primary account for backward compatibility
-                "accounts": all_accounts_data,  # All accounts data
-                "holdings": all_holdings,  # All holdings from all accounts
-                "valuations": all_accounts_data[0]["valuations"] if all_accounts_data else {},  # Primary account valuations
-                "transactions": [
-                    tx for account_data in all_accounts_data
-                    for tx in account_data["transactions"]
-                ][:50],  # Combined transactions, limit to 50
-                "summary": {
-                    "total_purchase_value": total_purchase_value,
-                    "total_current_value": total_current_value,
-                    "total_profit_loss": total_profit_loss,
-                    "total_profit_loss_percent": total_profit_loss_percent,
-                    "holdings_count": len(all_holdings),
-                },
+    def _fire_holding_events(self, data: dict[str, Any]) -> None:
+        """Fire holding change and alert events for changes since the last data."""
+        previous = self.data["holdings"] if self.data is not None else None
+        threshold = self.portfolio.entry.options.get(
+            CONF_VALUE_CHANGE_THRESHOLD, DEFAULT_VALUE_CHANGE_THRESHOLD
+        )
+        events = diff_holdings(
+            data["account"], previous or [], data["holdings"], self._value_baselines, threshold
+        )
+        if previous is None:
+            # The first refresh only records the baselines
+            return
+        for event_type, event_data in events:
+            self.hass.bus.async_fire(event_type, event_data)
+        if (alerts := self.hass.data.get(DATA_ALERTS)) is not None:
+            alerts.async_evaluate(data["account"], previous, data["holdings"])
+
+    def _stale_data(self, err: Exception | str) -> dict[str, Any]:
+        """Return the last good data flagged as stale."""
+        data = self.data
+        if not data.get("stale"):
+            stale_since = dt_util.utcnow().isoformat()
+            # New holding dicts; the previous ones are shared with the portfolio and entities
+            data = {
+                **data,
+                "stale": True,
+                "stale_since": stale_since,
+                "holdings": [
+                    {**holding, "_stale_since": stale_since} for holding in data["holdings"]
+                ],
             }
-            
-            _LOGGER.info("Data update completed successfully")
-            return result
-
-        except ConfigEntryAuthFailed:
-            _LOGGER.error("Authentication failed for user: %s", self.username)
-            raise
-        except UpdateFailed:
-            _LOGGER.error("Update failed")
-            raise
-        except Exception as err:
-            _LOGGER.exception("Unexpected error during data update: %s", err)
-            # Check if it's an authentication error
-            if "login" in str(err).lower() or "authentication" in str(err).lower():
-                raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
-            raise UpdateFailed(f"Error communicating with Easy Equities API: {err}") from err
+        return {**data, "last_error": str(err)}
+
+    async def _async_fetch_endpoints(
+        self, endpoints: set[str], force: bool = False
+    ) -> dict[str, Any]:
+        """Fetch the raw responses of the given endpoints for the account."""
+        account = self.account
+        _LOGGER.debug("Processing account: %s (%s)", account.name, account.id)
+        responses: dict[str, Any] = {}
+
+        if ENDPOINT_HOLDINGS in endpoints:
+            # Fetch holdings
+            _LOGGER.debug("Fetching holdings for account: %s", account.id)
+            responses[ENDPOINT_HOLDINGS] = await self._async_timed_job(
+                ENDPOINT_HOLDINGS,
+                self.session.async_fetch(ENDPOINT_HOLDINGS, account.id, force),
+            )
+            _LOGGER.info(
+                "Account %s: Found %d holding(s)",
+                account.name,
+                len(responses[ENDPOINT_HOLDINGS]),
+            )
+
+        if ENDPOINT_VALUATIONS in endpoints:
+            # Fetch valuations
+            _LOGGER.debug("Fetching valuations for account: %s", account.id)
+            responses[ENDPOINT_VALUATIONS] = await self._async_timed_job(
+                ENDPOINT_VALUATIONS,
+                self.session.async_fetch(ENDPOINT_VALUATIONS, account.id, force),
+            )
+            _LOGGER.debug(
+                "Account %s: Found %d valuation(s)",
+                account.name,
+                len(responses[ENDPOINT_VALUATIONS]),
+            )
+
+        if ENDPOINT_TRANSACTIONS in endpoints:
+            # Fetch transactions (last 30 days)
+            _LOGGER.debug("Fetching transactions for account: %s", account.id)
+            responses[ENDPOINT_TRANSACTIONS] = await self._async_timed_job(
+                ENDPOINT_TRANSACTIONS,
+                self.session.async_fetch(ENDPOINT_TRANSACTIONS, account.id, force),
+            )
+            _LOGGER.debug(
+                "Account %s: Found %d transaction(s)",
+                account.name,
+                len(responses[ENDPOINT_TRANSACTIONS]),
+            )
+
+        return responses
+
+    async def _async_timed_job(self, name: str, call: Awaitable[Any]) -> Any:
+        """Await an API call, recording how long it took."""
+        started = time.perf_counter()
+        try:
+            return await call
+        finally:
+            self.timings[name] = time.perf_counter() - started
+
+    def _retain_responses(self, responses: dict[str, Any]) -> None:
+        """Keep the trimmed responses, or the raw ones if configured to."""
+        options = self.portfolio.entry.options
+        if ENDPOINT_TRANSACTIONS in responses:
+            # Index the full response before it is trimmed
+            if self.income.add(responses[ENDPOINT_TRANSACTIONS]):
+                self.portfolio.async_schedule_save("income")
+            if self.lots.add(responses[ENDPOINT_TRANSACTIONS]):
+                self.portfolio.async_schedule_save("lots")
+        if ENDPOINT_VALUATIONS in responses:
+            self.breakdown = parse_valuations(responses[ENDPOINT_VALUATIONS])
+        if options.get(CONF_KEEP_RAW_DATA, False):
+            if ENDPOINT_HOLDINGS in responses:
+                # Cached responses are shared; _build_data annotates the holdings
+                responses[ENDPOINT_HOLDINGS] = [
+                    dict(holding) for holding in responses[ENDPOINT_HOLDINGS]
+                ]
+        else:
+            retention = options.get(CONF_TRANSACTION_RETENTION, DEFAULT_TRANSACTION_RETENTION)
+            if ENDPOINT_HOLDINGS in responses:
+                responses[ENDPOINT_HOLDINGS] = trim_holdings(responses[ENDPOINT_HOLDINGS])
+            if ENDPOINT_VALUATIONS in responses:
+                responses[ENDPOINT_VALUATIONS] = trim_valuations(responses[ENDPOINT_VALUATIONS])
+            if ENDPOINT_TRANSACTIONS in responses:
+                responses[ENDPOINT_TRANSACTIONS] = trim_transactions(
+                    responses[ENDPOINT_TRANSACTIONS], retention
+                )
+        self._responses.update(responses)
+
+    async def async_fetch_raw_data(self, endpoints: set[str]) -> dict[str, Any]:
+        """Fetch the untrimmed responses of the given endpoints on demand."""
+        async with self.session.account_lock, self._scheduler.async_slot():
+            return await self._async_fetch_endpoints(endpoints)
+
+    async def async_export(
+        self,
+        directory: Path,
+        fmt: str,
+        kinds: list[str],
+        start: date | None,
+        end: date | None,
+    ) -> list[Path]:
+        """Stream the account's transactions and holdings to export files."""
+        async with self.session.account_lock, self._scheduler.async_slot():
+            client = await self.session.async_get_client()
+            return await self.hass.async_add_executor_job(
+                export_account,
+                client,
+                self.account,
+                directory,
+                fmt,
+                kinds,
+                start,
+                end,
+                dt_util.now(),
+            )
+
+    def _build_data(self) -> dict[str, Any]:
+        """Build the account data from the latest endpoint responses."""
+        account = self.account
+        holdings = self._responses.get(ENDPOINT_HOLDINGS, [])
+        valuations = self._responses.get(ENDPOINT_VALUATIONS, {})
+        transactions = self._responses.get(ENDPOINT_TRANSACTIONS, [])
+
+        # Currency from the parsed valuations, ZAR as a fallback
+        account_currency = self.breakdown["currency"] or "ZAR"
+        _LOGGER.debug("Account %s currency: %s", account.name, account_currency)
+
+        # Calculate account totals with proper currency parsing
+        _LOGGER.debug("Calculating totals for account: %s", account.name)
+        account_purchase_value = 0.0
+        account_current_value = 0.0
+
+        for holding in holdings:
+            try:
+                purchase_val_str = holding.get("purchase_value", "0")
+                current_val_str = holding.get("current_value", "0")
+
+                purchase_val = parse_currency(purchase_val_str)
+                current_val = parse_currency(current_val_str)
+
+                account_purchase_value += purchase_val
+                account_current_value += current_val
+
+                _LOGGER.debug(
+                    "Holding %s: purchase=%s (parsed: %.2f), current=%s (parsed: %.2f)",
+                    holding.get("name", "Unknown"),
+                    purchase_val_str,
+                    purchase_val,
+                    current_val_str,
+                    current_val
+                )
+            except Exception as err:
+                _LOGGER.error(
+                    "Error parsing currency for holding %s: %s. Purchase: %s, Current: %s",
+                    holding.get("name", "Unknown"),
+                    err,
+                    holding.get("purchase_value"),
+                    holding.get("current_value")
+                )
+                # Continue with other holdings
+                continue
+
+        _LOGGER.info(
+            "Account %s totals: Purchase=%.2f, Current=%.2f, Profit/Loss=%.2f",
+            account.name,
+            account_purchase_value,
+            account_current_value,
+            account_current_value - account_purchase_value
+        )
+
+        # Add account identifier and currency to holdings
+        for holding in holdings:
+            holding["_account_id"] = account.id
+            holding["_account_name"] = account.name
+            holding["_account_currency"] = account_currency
+            holding["_tradingview_symbol"] = tradingview_symbol(
+                holding.get("contract_code"), self.portfolio.tradingview_overrides
+            )
+
+        return {
+            "account": {
+                "id": account.id,
+                "name": account.name,
+                "trading_currency_id": account.trading_currency_id,
+                "currency": account_currency,
+                "platform": self.platform,
+            },
+            "holdings": holdings,
+            "valuations": valuations,
+            "breakdown": self.breakdown,
+            "transactions": transactions,
+            "lots": summarize_lots(self.lots, holdings, dt_util.now().date()),
+            "summary": {
+                "total_purchase_value": account_purchase_value,
+                "total_current_value": account_current_value,
+                "total_profit_loss": account_current_value - account_purchase_value,
+                "total_profit_loss_percent": (
+                    ((account_current_value - account_purchase_value) / account_purchase_value * 100)
+                    if account_purchase_value > 0
+                    else 0
+                ),
+                "holdings_count": len(holdings),
+                "currency": account_currency,
+            },
+            "last_updated": dt_util.utcnow().isoformat(),
+            "stale": False,
+            "stale_since": None,
+        }
@@ -0,0 +1,110 @@
+"""Holding change detection for Easy Equities.
+
+Compares the holdings of an account between two refreshes and describes what
+changed as event payloads, so automations can trigger on events instead of
+templating over every holding sensor.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from .const import (
+    ATTR_ACCOUNT_NAME,
+    ATTR_CONTRACT_CODE,
+    ATTR_CURRENT_VALUE,
+    ATTR_SHARES,
+    EVENT_HOLDING_CLOSED,
+    EVENT_HOLDING_OPENED,
+    EVENT_HOLDING_SHARES_CHANGED,
+    EVENT_HOLDING_VALUE_MOVED,
+)
+from .util import parse_number
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def holding_key(holding: dict[str, Any]) -> str:
+    """Return the key identifying a holding within an account."""
+    return holding.get("contract_code") or holding.get("name", "unknown")
+
+
+def _record(holding: dict[str, Any]) -> dict[str, Any]:
+    """Return the API fields of a holding, without integration annotations."""
+    return {key: value for key, value in holding.items() if not key.startswith("_")}
+
+
+def diff_holdings(
+    account: dict[str, Any],
+    previous: list[dict[str, Any]],
+    current: list[dict[str, Any]],
+    baselines: dict[str, float],
+    value_threshold: float,
+) -> list[tuple[str, dict[str, Any]]]:
+    """Diff two holdings snapshots of an account.
+
+    Returns (event_type, event_data) pairs for opened and closed positions,
+    share count changes, and values that moved more than value_threshold
+    percent from their baseline. Baselines map holding keys to the value at
+    the last value_moved event (or when the holding was first seen) and are
+    updated in place, so slow drift is reported once it adds up.
+    """
+    before = {holding_key(holding): holding for holding in previous}
+    after = {holding_key(holding): holding for holding in current}
+    base = {"account_id": account["id"], ATTR_ACCOUNT_NAME: account["name"]}
+    events: list[tuple[str, dict[str, Any]]] = []
+
+    for key in before.keys() - after.keys():
+        baselines.pop(key, None)
+        events.append(
+            (
+                EVENT_HOLDING_CLOSED,
+                {**base, ATTR_CONTRACT_CODE: key, "holding": _record(before[key])},
+            )
+        )
+
+    for key, holding in after.items():
+        data = {**base, ATTR_CONTRACT_CODE: key, "name": holding.get("name")}
+        current_value = parse_number(holding.get(ATTR_CURRENT_VALUE))
+
+        if key not in before:
+            if current_value is not None:
+                baselines[key] = current_value
+            events.append((EVENT_HOLDING_OPENED, {**data, "holding": _record(holding)}))
+            continue
+
+        old_shares = parse_number(before[key].get(ATTR_SHARES))
+        new_shares = parse_number(holding.get(ATTR_SHARES))
+        if old_shares != new_shares:
+            events.append(
+                (
+                    EVENT_HOLDING_SHARES_CHANGED,
+                    {**data, "previous_shares": old_shares, ATTR_SHARES: new_shares},
+                )
+            )
+
+        if current_value is None:
+            continue
+        baseline = baselines.setdefault(key, current_value)
+        if not baseline:
+            baselines[key] = current_value
+            continue
+        change_percent = (current_value - baseline) / abs(baseline) * 100
+        if abs(change_percent) >= value_threshold:
+            baselines[key] = current_value
+            events.append(
+                (
+                    EVENT_HOLDING_VALUE_MOVED,
+                    {
+                        **data,
+                        "previous_value": baseline,
+                        ATTR_CURRENT_VALUE: current_value,
+                        "change_percent": round(change_percent, 2),
+                    },
+                )
+            )
+
+    _LOGGER.debug(
+        "Account %s: %d holding change event(s)", account["name"], len(events)
+    )
+    return events
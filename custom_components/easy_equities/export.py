@@ -0,0 +1,163 @@
+"""Stream Easy Equities transactions and holdings to CSV or NDJSON files.
+
+Rows are produced by generators and written one at a time, so at most one
+account's API response is held in memory, never the whole export. This
+module does not import Home Assistant; the export service and the
+``scripts/analyze_data.py --export`` CLI both use it.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import csv
+from datetime import date, datetime
+import json
+import logging
+from pathlib import Path
+from typing import IO, Any
+
+from .util import parse_number
+
+_LOGGER = logging.getLogger(__name__)
+
+FORMAT_CSV = "csv"
+FORMAT_NDJSON = "ndjson"
+FORMATS = (FORMAT_CSV, FORMAT_NDJSON)
+
+EXPORT_TRANSACTIONS = "transactions"
+EXPORT_HOLDINGS = "holdings"
+EXPORT_KINDS = (EXPORT_TRANSACTIONS, EXPORT_HOLDINGS)
+
+TRANSACTION_COLUMNS = (
+    "account_id",
+    "account_name",
+    "transaction_id",
+    "date",
+    "action",
+    "contract_code",
+    "comment",
+    "amount",
+)
+
+HOLDING_COLUMNS = (
+    "account_id",
+    "account_name",
+    "snapshot_time",
+    "name",
+    "contract_code",
+    "isin",
+    "shares",
+    "current_price",
+    "purchase_value",
+    "current_value",
+)
+
+
+def _transaction_date(transaction: dict[str, Any]) -> date | None:
+    """Return the date of a transaction, if it can be parsed."""
+    try:
+        return datetime.fromisoformat(str(transaction.get("TransactionDate"))[:19]).date()
+    except ValueError:
+        return None
+
+
+def iter_transaction_rows(
+    account: Any,
+    transactions: Iterable[dict[str, Any]],
+    start: date | None = None,
+    end: date | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield export rows for the transactions dated within [start, end]."""
+    for transaction in transactions:
+        transaction_date = _transaction_date(transaction)
+        if (start or end) and transaction_date is None:
+            continue
+        if start and transaction_date < start:
+            continue
+        if end and transaction_date > end:
+            continue
+        yield {
+            "account_id": account.id,
+            "account_name": account.name,
+            "transaction_id": transaction.get("TransactionId"),
+            "date": transaction_date.isoformat() if transaction_date else None,
+            "action": transaction.get("Action"),
+            "contract_code": transaction.get("ContractCode"),
+            "comment": transaction.get("Comment"),
+            "amount": transaction.get("DebitCredit"),
+        }
+
+
+def iter_holding_rows(
+    account: Any, holdings: Iterable[dict[str, Any]], snapshot_time: datetime
+) -> Iterator[dict[str, Any]]:
+    """Yield export rows for a holdings snapshot."""
+    for holding in holdings:
+        yield {
+            "account_id": account.id,
+            "account_name": account.name,
+            "snapshot_time": snapshot_time.isoformat(),
+            "name": holding.get("name"),
+            "contract_code": holding.get("contract_code"),
+            "isin": holding.get("isin"),
+            "shares": parse_number(holding.get("shares")),
+            "current_price": parse_number(holding.get("current_price")),
+            "purchase_value": parse_number(holding.get("purchase_value")),
+            "current_value": parse_number(holding.get("current_value")),
+        }
+
+
+def write_rows(
+    rows: Iterable[dict[str, Any]],
+    stream: IO[str],
+    fmt: str,
+    columns: tuple[str, ...],
+) -> int:
+    """Write rows to a text stream as they are produced, returning the count."""
+    count = 0
+    if fmt == FORMAT_CSV:
+        writer = csv.DictWriter(stream, fieldnames=columns)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    else:
+        for row in rows:
+            stream.write(json.dumps(row, default=str) + "\n")
+            count += 1
+    return count
+
+
+def export_account(
+    client: Any,
+    account: Any,
+    directory: Path,
+    fmt: str = FORMAT_CSV,
+    kinds: Iterable[str] = EXPORT_KINDS,
+    start: date | None = None,
+    end: date | None = None,
+    snapshot_time: datetime | None = None,
+) -> list[Path]:
+    """Export one account to files in directory, returning their paths.
+
+    Calls the client, so this blocks and must run in the executor.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    snapshot_time = snapshot_time or datetime.now().astimezone()
+    paths: list[Path] = []
+    for kind in kinds:
+        if kind == EXPORT_TRANSACTIONS:
+            rows = iter_transaction_rows(
+                account, client.accounts.transactions(account.id), start, end
+            )
+            columns = TRANSACTION_COLUMNS
+        else:
+            rows = iter_holding_rows(
+                account, client.accounts.holdings(account.id, True), snapshot_time
+            )
+            columns = HOLDING_COLUMNS
+        path = directory / f"{account.id}_{kind}.{fmt}"
+        with path.open("w", encoding="utf-8", newline="") as stream:
+            count = write_rows(rows, stream, fmt, columns)
+        _LOGGER.info("Exported %d %s row(s) of account %s to %s", count, kind, account.name, path)
+        paths.append(path)
+    return paths
@@ -0,0 +1,159 @@
+"""Dividend, interest and fee aggregation for Easy Equities accounts.
+
+Each transaction is classified once, when it is first seen, and added to
+running per-month and per-holding totals. Refreshes only process the
+transactions that are new since the previous one, and the totals are
+persisted, so they outlive the API's short transaction window.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import date, datetime
+import logging
+import re
+from typing import Any
+
+from .util import SeenTransactions, parse_number
+
+_LOGGER = logging.getLogger(__name__)
+
+INCOME_DIVIDEND = "dividend"
+INCOME_INTEREST = "interest"
+INCOME_FEE = "fee"
+INCOME_KINDS = (INCOME_DIVIDEND, INCOME_INTEREST, INCOME_FEE)
+
+# Whole words matched against a transaction's action, in order
+_KEYWORDS: tuple[tuple[str, re.Pattern[str]], ...] = (
+    (INCOME_DIVIDEND, re.compile(r"\b(?:dividends?|distributions?)\b")),
+    (INCOME_INTEREST, re.compile(r"\binterest\b")),
+    (
+        INCOME_FEE,
+        re.compile(r"\b(?:fees?|charges?|commissions?|brokerage|vat|lev(?:y|ies))\b"),
+    ),
+)
+# Trades, whose comments name the instrument ("Bought Satrix Dividend Plus ...")
+_TRADE = re.compile(r"\b(?:buy|sell|bought|sold)\b")
+
+
+def classify_transaction(transaction: dict[str, Any]) -> str | None:
+    """Return the income kind of a transaction, or None for trades and deposits.
+
+    The comment is only read when there is no action, and never for trades.
+    """
+    action = str(transaction.get("Action") or "").lower()
+    comment = str(transaction.get("Comment") or "").lower()
+    if _TRADE.search(action) or comment.startswith(("bought ", "sold ")):
+        return None
+    text = action or comment
+    for kind, pattern in _KEYWORDS:
+        if pattern.search(text):
+            return kind
+    return None
+
+
+def _month(transaction: dict[str, Any]) -> str | None:
+    """Return the YYYY-MM month of a transaction."""
+    try:
+        moment = datetime.fromisoformat(str(transaction.get("TransactionDate"))[:19])
+    except ValueError:
+        return None
+    return f"{moment.year:04d}-{moment.month:02d}"
+
+
+def _previous_months(today: date, count: int) -> list[str]:
+    """Return the YYYY-MM keys of the count months up to and including today's."""
+    index = today.year * 12 + today.month - 1
+    return [
+        f"{(index - offset) // 12:04d}-{(index - offset) % 12 + 1:02d}"
+        for offset in range(count)
+    ]
+
+
+class IncomeIndex:
+    """Running income and fee totals of one account.
+
+    Dividends and interest are signed as received (withholding tax reduces
+    them); fees are stored as positive amounts paid.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._seen = SeenTransactions()
+        self.totals: dict[str, float] = defaultdict(float)
+        self.monthly: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self.by_holding: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+
+    def add(self, transactions: Iterable[dict[str, Any]]) -> int:
+        """Index the transactions not seen before, returning how many were new."""
+        added = 0
+        for transaction in transactions:
+            if not self._seen.add(transaction):
+                continue
+            added += 1
+            if (kind := classify_transaction(transaction)) is None:
+                continue
+            if (amount := parse_number(transaction.get("DebitCredit"))) is None:
+                continue
+            if kind == INCOME_FEE:
+                amount = -amount
+            self.totals[kind] += amount
+            if month := _month(transaction):
+                self.monthly[kind][month] += amount
+            if contract_code := transaction.get("ContractCode"):
+                self.by_holding[kind][contract_code] += amount
+        self._seen.prune()
+        if added:
+            _LOGGER.debug("Indexed %d new transaction(s)", added)
+        return added
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the index as JSON-serializable data for storage."""
+        return {
+            "seen": self._seen.as_dict(),
+            "totals": dict(self.totals),
+            "monthly": {kind: dict(months) for kind, months in self.monthly.items()},
+            "by_holding": {kind: dict(codes) for kind, codes in self.by_holding.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> IncomeIndex:
+        """Return an index restored from storage."""
+        index = cls()
+        if data:
+            index._seen = SeenTransactions.from_dict(data.get("seen"))
+            index.totals.update(data.get("totals", {}))
+            for kind, months in data.get("monthly", {}).items():
+                index.monthly[kind].update(months)
+            for kind, codes in data.get("by_holding", {}).items():
+                index.by_holding[kind].update(codes)
+        return index
+
+    def trailing(self, kind: str, today: date, months: int = 12) -> float:
+        """Return the total of a kind over the last months, this month included."""
+        monthly = self.monthly.get(kind, {})
+        return sum(monthly.get(month, 0.0) for month in _previous_months(today, months))
+
+
+def combine_income(indexes: Iterable[IncomeIndex], today: date) -> dict[str, Any]:
+    """Combine account indexes into portfolio income figures."""
+    indexes = list(indexes)
+    months = _previous_months(today, 12)
+    result: dict[str, Any] = {}
+    for kind in INCOME_KINDS:
+        result[kind] = {
+            "total": sum(index.totals.get(kind, 0.0) for index in indexes),
+            "trailing_12_months": sum(index.trailing(kind, today) for index in indexes),
+            "monthly": {
+                month: total
+                for month in reversed(months)
+                if (total := sum(index.monthly.get(kind, {}).get(month, 0.0) for index in indexes))
+            },
+        }
+    by_holding: dict[str, float] = defaultdict(float)
+    for index in indexes:
+        for income_kind in (INCOME_DIVIDEND, INCOME_INTEREST):
+            for contract_code, amount in index.by_holding.get(income_kind, {}).items():
+                by_holding[contract_code] += amount
+    result["by_holding"] = dict(by_holding)
+    return result
@@ -0,0 +1,256 @@
+"""FIFO lots of Easy Equities holdings, built from buy and sell transactions.
+
+Each buy opens a lot with its quantity, cost and date; each sell closes the
+oldest lots of the instrument first and realizes the proceeds less their
+cost. Like the income index, every transaction is applied once, when it is
+first seen, so refreshes only process the new ones. The lots are persisted,
+so they cover every trade seen since tracking started, not only those the API
+still returns.
+
+Quantities and prices are read from the transaction comments, e.g.
+"Bought Satrix 40 10.0000 @ 100.00"; the amount is the transaction's debit
+or credit, so costs and proceeds include the fees charged on the trade.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date
+import logging
+import re
+from typing import Any, TypedDict
+
+from .util import SeenTransactions, parse_number, transaction_date
+
+_LOGGER = logging.getLogger(__name__)
+
+SIDE_BUY = "buy"
+SIDE_SELL = "sell"
+
+# Quantity and price at the end of a trade comment. Names can end in digits
+# ("Satrix 40 10 @ 100.00"), so only commas are taken as thousands separators.
+_NUMBER = r"\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?"
+_TRADE = re.compile(rf"(?P<quantity>{_NUMBER})\s*@\s*(?P<price>{_NUMBER})\s*$")
+
+
+class Lot(TypedDict):
+    """Shares of one buy that are still held."""
+
+    transaction_id: Any
+    date: str
+    quantity: float
+    cost: float
+
+
+def parse_trade(transaction: dict[str, Any]) -> tuple[str, float, float] | None:
+    """Return the side, quantity and amount of a trade, or None for other transactions."""
+    action = str(transaction.get("Action") or "").lower()
+    comment = str(transaction.get("Comment") or "")
+    if action == "buy" or comment.lower().startswith("bought "):
+        side = SIDE_BUY
+    elif action == "sell" or comment.lower().startswith("sold "):
+        side = SIDE_SELL
+    else:
+        return None
+    if not transaction.get("ContractCode") or (match := _TRADE.search(comment)) is None:
+        return None
+    quantity = parse_number(match["quantity"])
+    if not quantity:
+        return None
+    if (amount := parse_number(transaction.get("DebitCredit"))) is None:
+        amount = quantity * (parse_number(match["price"]) or 0.0)
+    return side, quantity, abs(amount)
+
+
+class LotBook:
+    """Open FIFO lots and realized gains of one account, by contract code.
+
+    Sells of shares bought before tracking started can't be matched to a
+    lot; their quantity is counted as unmatched and left out of the
+    realized gain.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty book."""
+        self._seen = SeenTransactions()
+        self.lots: dict[str, list[Lot]] = {}
+        self.realized: dict[str, float] = {}
+        self.unmatched: dict[str, float] = {}
+
+    def add(self, transactions: Iterable[dict[str, Any]]) -> int:
+        """Apply the trades not seen before, oldest first, returning how many were new."""
+        trades: list[tuple[str, Any, dict[str, Any], tuple[str, float, float]]] = []
+        for transaction in transactions:
+            if not self._seen.add(transaction):
+                continue
+            if (trade := parse_trade(transaction)) is not None:
+                trades.append(
+                    (transaction_date(transaction), transaction["TransactionId"], transaction, trade)
+                )
+        self._seen.prune()
+        # Responses list the newest first; a new buy and sell must apply in order
+        trades.sort(key=lambda item: (item[0], str(item[1])))
+        for trade_date, transaction_id, transaction, (side, quantity, amount) in trades:
+            contract_code = transaction["ContractCode"]
+            if side == SIDE_BUY:
+                self.lots.setdefault(contract_code, []).append(
+                    {
+                        "transaction_id": transaction_id,
+                        "date": trade_date,
+                        "quantity": quantity,
+                        "cost": amount,
+                    }
+                )
+            else:
+                self._sell(contract_code, quantity, amount)
+        if trades:
+            _LOGGER.debug("Applied %d new trade(s) to the lots", len(trades))
+        return len(trades)
+
+    def _sell(self, contract_code: str, quantity: float, proceeds: float) -> None:
+        """Close the oldest lots of an instrument and realize the gain."""
+        lots = self.lots.get(contract_code, [])
+        remaining = quantity
+        cost = 0.0
+        while lots and remaining > 1e-9:
+            lot = lots[0]
+            if lot["quantity"] <= remaining + 1e-9:
+                remaining -= lot["quantity"]
+                cost += lot["cost"]
+                lots.pop(0)
+                continue
+            # Split the lot, keeping the cost of the shares still held
+            sold_cost = lot["cost"] * remaining / lot["quantity"]
+            lot["quantity"] -= remaining
+            lot["cost"] -= sold_cost
+            cost += sold_cost
+            remaining = 0.0
+        if not lots:
+            self.lots.pop(contract_code, None)
+        matched = quantity - max(remaining, 0.0)
+        if remaining > 1e-9:
+            self.unmatched[contract_code] = self.unmatched.get(contract_code, 0.0) + remaining
+        if matched > 0:
+            self.realized[contract_code] = (
+                self.realized.get(contract_code, 0.0) + proceeds * matched / quantity - cost
+            )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the book as JSON-serializable data for storage."""
+        return {
+            "seen": self._seen.as_dict(),
+            "lots": self.lots,
+            "realized": self.realized,
+            "unmatched": self.unmatched,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> LotBook:
+        """Return a book restored from storage."""
+        book = cls()
+        if data:
+            book._seen = SeenTransactions.from_dict(data.get("seen"))
+            book.lots = {code: list(lots) for code, lots in data.get("lots", {}).items()}
+            book.realized = dict(data.get("realized", {}))
+            book.unmatched = dict(data.get("unmatched", {}))
+        return book
+
+
+def _age(lot: Lot, today: date) -> int | None:
+    """Return the age of a lot in days."""
+    try:
+        return (today - date.fromisoformat(lot["date"])).days
+    except ValueError:
+        return None
+
+
+def summarize_lots(
+    book: LotBook, holdings: list[dict[str, Any]], today: date
+) -> dict[str, Any]:
+    """Return the gains and lot ages of an account, per contract code and in total.
+
+    Unrealized gains value the open lots at each holding's current value per
+    share, so only holdings with lots are included.
+    """
+    prices: dict[str, float] = {}
+    for holding in holdings:
+        shares = parse_number(holding.get("shares"))
+        value = parse_number(holding.get("current_value"))
+        if shares and value is not None and (contract_code := holding.get("contract_code")):
+            prices[contract_code] = value / shares
+
+    by_holding: dict[str, dict[str, Any]] = {}
+    for contract_code in book.lots.keys() | book.realized.keys() | book.unmatched.keys():
+        lots = book.lots.get(contract_code, [])
+        quantity = sum(lot["quantity"] for lot in lots)
+        cost = sum(lot["cost"] for lot in lots)
+        ages = [(age, lot["quantity"]) for lot in lots if (age := _age(lot, today)) is not None]
+        price = prices.get(contract_code)
+        by_holding[contract_code] = {
+            "lots": len(lots),
+            "shares": quantity,
+            "cost_basis": cost,
+            "unrealized_gain": quantity * price - cost if lots and price is not None else None,
+            "realized_gain": book.realized.get(contract_code, 0.0),
+            "unmatched_shares": book.unmatched.get(contract_code, 0.0),
+            "oldest_lot_days": max((age for age, _ in ages), default=None),
+            "average_age_days": (
+                sum(age * shares for age, shares in ages) / sum(shares for _, shares in ages)
+                if ages
+                else None
+            ),
+        }
+    return _totals(by_holding)
+
+
+def _totals(by_holding: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Add the portfolio totals to per-holding lot figures."""
+    aged = [row for row in by_holding.values() if row["average_age_days"] is not None]
+    aged_shares = sum(row["shares"] for row in aged)
+    return {
+        "realized_gain": sum(row["realized_gain"] for row in by_holding.values()),
+        "unrealized_gain": sum(
+            row["unrealized_gain"] or 0.0 for row in by_holding.values()
+        ),
+        "cost_basis": sum(row["cost_basis"] for row in by_holding.values()),
+        "oldest_lot_days": max((row["oldest_lot_days"] for row in aged), default=None),
+        "average_age_days": (
+            sum(row["average_age_days"] * row["shares"] for row in aged) / aged_shares
+            if aged_shares
+            else None
+        ),
+        "by_holding": by_holding,
+    }
+
+
+def combine_lots(summaries: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """Combine account lot summaries into portfolio figures."""
+    by_holding: dict[str, dict[str, Any]] = {}
+    for summary in summaries:
+        for contract_code, row in summary["by_holding"].items():
+            if (combined := by_holding.get(contract_code)) is None:
+                by_holding[contract_code] = dict(row)
+                continue
+            shares = combined["shares"] + row["shares"]
+            if combined["average_age_days"] is None or row["average_age_days"] is None:
+                combined["average_age_days"] = (
+                    combined["average_age_days"]
+                    if row["average_age_days"] is None
+                    else row["average_age_days"]
+                )
+            elif shares:
+                combined["average_age_days"] = (
+                    combined["average_age_days"] * combined["shares"]
+                    + row["average_age_days"] * row["shares"]
+                ) / shares
+            for field in ("lots", "cost_basis", "realized_gain", "unmatched_shares"):
+                combined[field] += row[field]
+            if row["unrealized_gain"] is not None:
+                combined["unrealized_gain"] = (combined["unrealized_gain"] or 0.0) + row[
+                    "unrealized_gain"
+                ]
+            combined["oldest_lot_days"] = max(
+                (days for days in (combined["oldest_lot_days"], row["oldest_lot_days"]) if days is not None),
+                default=None,
+            )
+            combined["shares"] = shares
+    return _totals(by_holding)
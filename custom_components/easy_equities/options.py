@@ -1,13 +1,37 @@
 """Options flow for Easy Equities integration."""
 from __future__ import annotations
 
+from typing import Any
+
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    CONF_ACCOUNT_IDS,
+    CONF_ACCOUNT_SCAN_INTERVALS,
+    CONF_KEEP_RAW_DATA,
+    CONF_POLLER,
+    CONF_POLLER_TOKEN,
+    CONF_PRICE_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL,
+    CONF_TRADINGVIEW_OVERRIDES,
+    CONF_TRANSACTION_RETENTION,
+    CONF_VALUE_CHANGE_THRESHOLD,
+    DEFAULT_PRICE_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TRANSACTION_RETENTION,
+    DEFAULT_VALUE_CHANGE_THRESHOLD,
+    DOMAIN,
+    MAX_TRANSACTION_RETENTION,
+)
+from .snapshot import parse_address
+from .tradingview import parse_overrides
 
-from .const import CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, DOMAIN
+SCAN_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=60, max=86400))
 
 
 class EasyEquitiesOptionsFlowHandler(OptionsFlow):
@@ -17,25 +41,127 @@ class EasyEquitiesOptionsFlowHandler(OptionsFlow):
         """Initialize options flow."""
         self.config_entry = config_entry
 
+    def _account_fields(self) -> dict[str, str]:
+        """Map a form field label to each monitored account id."""
+        coordinator = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        if coordinator is None:
+            return {}
+        fields: dict[str, str] = {}
+        for account_id, account_coordinator in coordinator.account_coordinators.items():
+            name = coordinator.account_label(account_coordinator.account)
+            label = f"{name} interval (seconds)"
+            if label in fields:
+                label = f"{name} ({account_id}) interval (seconds)"
+            fields[label] = account_id
+        return fields
+
     async def async_step_init(
-        self, user_input: dict[str, int] | None = None
+        self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        account_fields = self._account_fields()
+        scan_interval = self.config_entry.options.get(
+            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+        )
+
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            try:
+                parse_overrides(user_input.get(CONF_TRADINGVIEW_OVERRIDES, ""))
+            except ValueError:
+                errors[CONF_TRADINGVIEW_OVERRIDES] = "invalid_tradingview_overrides"
+            if poller := user_input.get(CONF_POLLER, "").strip():
+                try:
+                    parse_address(poller)
+                except ValueError:
+                    errors[CONF_POLLER] = "invalid_poller"
+        if user_input is not None and not errors:
+            options = {
+                CONF_SCAN_INTERVAL: user_input[CONF_SCAN_INTERVAL],
+                CONF_VALUE_CHANGE_THRESHOLD: user_input[CONF_VALUE_CHANGE_THRESHOLD],
+                CONF_TRADINGVIEW_OVERRIDES: user_input.get(CONF_TRADINGVIEW_OVERRIDES, ""),
+                CONF_TRANSACTION_RETENTION: user_input[CONF_TRANSACTION_RETENTION],
+                CONF_KEEP_RAW_DATA: user_input[CONF_KEEP_RAW_DATA],
+                CONF_PRICE_SCAN_INTERVAL: user_input[CONF_PRICE_SCAN_INTERVAL],
+                CONF_POLLER: user_input.get(CONF_POLLER, "").strip(),
+                CONF_POLLER_TOKEN: user_input.get(CONF_POLLER_TOKEN, ""),
+            }
+            if CONF_ACCOUNT_IDS in user_input:
+                options[CONF_ACCOUNT_IDS] = user_input[CONF_ACCOUNT_IDS]
+            # Only keep per-account intervals that differ from the default
+            options[CONF_ACCOUNT_SCAN_INTERVALS] = {
+                account_id: user_input[label]
+                for label, account_id in account_fields.items()
+                if label in user_input
+                and user_input[label] != user_input[CONF_SCAN_INTERVAL]
+            }
+            return self.async_create_entry(title="", data=options)
+
+        account_intervals = self.config_entry.options.get(
+            CONF_ACCOUNT_SCAN_INTERVALS, {}
+        )
+        schema: dict[Any, Any] = {
+            vol.Optional(CONF_SCAN_INTERVAL, default=scan_interval): vol.All(
+                vol.Coerce(int), vol.Range(min=60, max=3600)
+            ),
+            vol.Optional(
+                CONF_VALUE_CHANGE_THRESHOLD,
+                default=self.config_entry.options.get(
+                    CONF_VALUE_CHANGE_THRESHOLD, DEFAULT_VALUE_CHANGE_THRESHOLD
+                ),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=100)),
+            # e.g. "EQU.ZA.STX40=JSE:STX40, EQU.US.BRK.B=NYSE:BRK.B"
+            vol.Optional(
+                CONF_TRADINGVIEW_OVERRIDES,
+                default=self.config_entry.options.get(CONF_TRADINGVIEW_OVERRIDES, ""),
+            ): str,
+            vol.Optional(
+                CONF_TRANSACTION_RETENTION,
+                default=self.config_entry.options.get(
+                    CONF_TRANSACTION_RETENTION, DEFAULT_TRANSACTION_RETENTION
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_TRANSACTION_RETENTION)),
+            # Keep every field of the API responses, e.g. while debugging
+            vol.Optional(
+                CONF_KEEP_RAW_DATA,
+                default=self.config_entry.options.get(CONF_KEEP_RAW_DATA, False),
+            ): bool,
+            # Prices and values only, between the full refreshes
+            vol.Optional(
+                CONF_PRICE_SCAN_INTERVAL,
+                default=self.config_entry.options.get(
+                    CONF_PRICE_SCAN_INTERVAL, DEFAULT_PRICE_SCAN_INTERVAL
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+            # HOST[:PORT] of scripts/poller.py, which then replaces the polling
+            vol.Optional(
+                CONF_POLLER, default=self.config_entry.options.get(CONF_POLLER, "")
+            ): str,
+            vol.Optional(
+                CONF_POLLER_TOKEN, default=self.config_entry.options.get(CONF_POLLER_TOKEN, "")
+            ): str,
+        }
+        coordinator = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        if coordinator is not None and coordinator.accounts:
+            account_options = {acc.id: coordinator.account_label(acc) for acc in coordinator.accounts}
+            schema[
+                vol.Required(CONF_ACCOUNT_IDS, default=coordinator.account_ids)
+            ] = vol.All(
+                cv.multi_select(account_options),
+                vol.Length(min=1, msg="Select at least one account"),
+            )
+        # Accounts that change rarely (e.g. tax-free savings) can poll less often
+        for label, account_id in account_fields.items():
+            schema[
+                vol.Optional(
+                    label, default=account_intervals.get(account_id, scan_interval)
+                )
+            ] = SCAN_INTERVAL_VALIDATOR
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_SCAN_INTERVAL,
-                        default=self.config_entry.options.get(
-                            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-                        ),
-                    ): vol.All(vol.Coerce(int), vol.Range(min=60, max=3600)),
-                }
-            ),
+            data_schema=vol.Schema(schema),
+            errors=errors,
         )
 
 
@@ -0,0 +1,72 @@
+"""Consolidate holdings of one instrument across accounts.
+
+The same instrument can be held in several accounts of an entry, or on both
+platforms. Holdings are grouped by ISIN, or by contract code when there is
+none, and their shares, value and cost added up, in one pass over the
+holdings per refresh. Holdings of one instrument in accounts of different
+currencies are kept as separate positions, so positions are keyed by
+instrument and currency.
+"""
+from __future__ import annotations
+
+from typing import Any, TypedDict
+
+from .util import parse_number
+
+
+class Position(TypedDict):
+    """The combined holdings of one instrument."""
+
+    name: str | None
+    isin: str | None
+    contract_codes: list[str]
+    currency: str | None
+    accounts: list[str]
+    shares: float
+    current_value: float
+    purchase_value: float
+    profit_loss: float
+
+
+def instrument_key(holding: dict[str, Any]) -> str:
+    """Return the key grouping the holdings of one instrument."""
+    return str(
+        holding.get("isin") or holding.get("contract_code") or holding.get("name", "unknown")
+    ).upper()
+
+
+def consolidate_positions(holdings: list[dict[str, Any]]) -> dict[str, Position]:
+    """Return the positions of the holdings, keyed ``{instrument}_{currency}``.
+
+    The currency is always part of the key, so a position keeps its key when
+    an account of another currency starts holding the instrument.
+    """
+    positions: dict[str, Position] = {}
+    for holding in holdings:
+        currency = holding.get("_account_currency")
+        key = f"{instrument_key(holding)}_{currency}"
+        if (position := positions.get(key)) is None:
+            position = positions[key] = {
+                "name": holding.get("name"),
+                "isin": holding.get("isin"),
+                "contract_codes": [],
+                "currency": currency,
+                "accounts": [],
+                "shares": 0.0,
+                "current_value": 0.0,
+                "purchase_value": 0.0,
+                "profit_loss": 0.0,
+            }
+        if (contract_code := holding.get("contract_code")) and contract_code not in position[
+            "contract_codes"
+        ]:
+            position["contract_codes"].append(contract_code)
+        if (account_id := holding.get("_account_id")) and account_id not in position["accounts"]:
+            position["accounts"].append(account_id)
+        position["shares"] += parse_number(holding.get("shares")) or 0.0
+        position["current_value"] += parse_number(holding.get("current_value")) or 0.0
+        position["purchase_value"] += parse_number(holding.get("purchase_value")) or 0.0
+
+    for position in positions.values():
+        position["profit_loss"] = position["current_value"] - position["purchase_value"]
+    return positions
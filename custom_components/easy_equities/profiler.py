@@ -0,0 +1,89 @@
+"""Profile a refresh of Easy Equities accounts on demand."""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import io
+import logging
+from pathlib import Path
+import pstats
+
+from homeassistant.components import persistent_notification
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .cache import async_get_cache
+from .const import DATA_PROFILE_LOCK, DOMAIN
+from .coordinator import EasyEquitiesAccountCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+NOTIFICATION_ID = f"{DOMAIN}_profile"
+
+
+def _write_stats(profiler: cProfile.Profile, path: Path, top: int) -> str:
+    """Write the stats to a pstats file and return the top hot spots."""
+    profiler.dump_stats(path)
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.strip_dirs().sort_stats(pstats.SortKey.TIME).print_stats(top)
+    # Keep the table, without the header lines pstats prints before it
+    lines = stream.getvalue().splitlines()
+    start = next(
+        (index for index, line in enumerate(lines) if line.lstrip().startswith("ncalls")),
+        0,
+    )
+    return "\n".join(line for line in lines[start:] if line.strip())
+
+
+async def async_profile_refresh(
+    hass: HomeAssistant, targets: list[EasyEquitiesAccountCoordinator], top: int
+) -> str:
+    """Refresh the accounts under cProfile and report the hot spots.
+
+    The profile covers the event loop, where responses are parsed and the
+    data is built; API calls run in the executor and are reported as
+    wall-clock timings per endpoint instead. cProfile records everything
+    that runs on the loop while the refresh is awaited, so work of other
+    integrations in that window appears in the profile too. Only one
+    profile runs at a time. Returns the pstats file path.
+    """
+    lock: asyncio.Lock = hass.data.setdefault(DATA_PROFILE_LOCK, asyncio.Lock())
+    if lock.locked():
+        raise HomeAssistantError("A refresh is already being profiled")
+    async with lock:
+        # Profile calls to the API, not hits of the response cache
+        cache = async_get_cache(hass)
+        for credential in {target.session.credential for target in targets}:
+            cache.async_invalidate(credential)
+        path = Path(hass.config.path(f"{DOMAIN}_profile_{dt_util.now():%Y%m%d_%H%M%S}.prof"))
+        profiler = cProfile.Profile()
+        started = dt_util.utcnow()
+        profiler.enable()
+        try:
+            await asyncio.gather(*(target.async_refresh() for target in targets))
+        finally:
+            profiler.disable()
+        elapsed = (dt_util.utcnow() - started).total_seconds()
+
+    hot_spots = await hass.async_add_executor_job(_write_stats, profiler, path, top)
+    timings = "\n".join(
+        f"- {target.account.name}: "
+        + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in target.timings.items())
+        for target in targets
+    )
+    persistent_notification.async_create(
+        hass,
+        (
+            f"Refreshed {len(targets)} account(s) in {elapsed:.2f}s.\n\n"
+            f"**API calls and data building**\n{timings}\n\n"
+            f"**Top {top} functions on the event loop (by own time)**\n"
+            f"```\n{hot_spots}\n```\n\n"
+            f"Full profile: `{path}` (open with snakeviz or `python -m pstats`)."
+        ),
+        title="Easy Equities refresh profile",
+        notification_id=NOTIFICATION_ID,
+    )
+    _LOGGER.info("Wrote refresh profile to %s", path)
+    return str(path)
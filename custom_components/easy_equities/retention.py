@@ -0,0 +1,64 @@
+"""Trim API responses to the fields the integration uses.
+
+Coordinators keep the latest response of every endpoint for the life of the
+config entry, so only the fields read by sensors, events, alerts and the
+WebSocket API are retained. The full responses can still be fetched on demand
+with the fetch_raw_data service.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+# Holding fields read by the integration; images and links are dropped
+HOLDING_FIELDS = (
+    "name",
+    "contract_code",
+    "isin",
+    "shares",
+    "purchase_value",
+    "current_value",
+    "current_price",
+)
+
+# Valuation sections and their fields that are retained
+VALUATION_FIELDS: dict[str, tuple[str, ...]] = {
+    "TopSummary": ("AccountValue", "AccountCurrency"),
+}
+
+TRANSACTION_FIELDS = (
+    "TransactionId",
+    "TransactionDate",
+    "Action",
+    "Comment",
+    "ContractCode",
+    "DebitCredit",
+)
+
+
+def trim_holdings(holdings: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return the holdings with only the retained fields."""
+    return [
+        {field: holding[field] for field in HOLDING_FIELDS if field in holding}
+        for holding in holdings
+    ]
+
+
+def trim_valuations(valuations: dict[str, Any]) -> dict[str, Any]:
+    """Return the retained sections and fields of a valuations response."""
+    if not isinstance(valuations, dict):
+        return {}
+    trimmed: dict[str, Any] = {}
+    for section, fields in VALUATION_FIELDS.items():
+        if isinstance(values := valuations.get(section), dict):
+            trimmed[section] = {field: values[field] for field in fields if field in values}
+    return trimmed
+
+
+def trim_transactions(
+    transactions: list[dict[str, Any]], limit: int
+) -> list[dict[str, Any]]:
+    """Return the first transactions up to the limit, with the retained fields."""
+    return [
+        {field: transaction[field] for field in TRANSACTION_FIELDS if field in transaction}
+        for transaction in transactions[:limit]
+    ]
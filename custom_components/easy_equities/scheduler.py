@@ -0,0 +1,106 @@
+"""Domain-wide refresh scheduler for Easy Equities."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DATA_SCHEDULER,
+    DEFAULT_MAX_CONCURRENT_REFRESHES,
+    DEFAULT_REFRESH_BURST,
+    DEFAULT_REFRESHES_PER_MINUTE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _van_der_corput(index: int) -> float:
+    """Return the base-2 van der Corput value for an index.
+
+    Successive values (0, 0.5, 0.25, 0.75, ...) stay close to evenly spaced in
+    [0, 1) for any count, so phases never need rebalancing as entries are added.
+    """
+    phase = 0.0
+    denominator = 1.0
+    while index:
+        denominator *= 2
+        index, remainder = divmod(index, 2)
+        phase += remainder / denominator
+    return phase
+
+
+class EasyEquitiesRefreshScheduler:
+    """Spread refreshes of every config entry and cap the global API load.
+
+    Each account coordinator is assigned a phase within its scan interval so
+    that entries do not poll in lockstep, and every API round-trip must take a
+    slot, which enforces a global concurrency limit and a token-bucket rate
+    budget. During startup the budget staggers the initial refreshes of all
+    entries once the burst allowance is used up.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_REFRESHES,
+        refreshes_per_minute: int = DEFAULT_REFRESHES_PER_MINUTE,
+        burst: int = DEFAULT_REFRESH_BURST,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        # Token bucket: small setups refresh without delay, large ones are paced
+        self._rate = refreshes_per_minute / 60
+        self._burst = float(burst)
+        self._tokens = float(burst)
+        self._last_refill: float | None = None
+        self._rate_lock = asyncio.Lock()
+        self._slots: dict[str, int] = {}
+
+    @callback
+    def async_register(self, key: str) -> float:
+        """Register a coordinator and return its phase in [0, 1)."""
+        if key not in self._slots:
+            used = set(self._slots.values())
+            self._slots[key] = next(i for i in range(len(used) + 1) if i not in used)
+        phase = _van_der_corput(self._slots[key])
+        _LOGGER.debug("Registered %s with refresh phase %.3f", key, phase)
+        return phase
+
+    @callback
+    def async_unregister(self, key: str) -> None:
+        """Release the phase slot held by a coordinator."""
+        self._slots.pop(key, None)
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[None]:
+        """Wait for a free refresh slot within the global budget."""
+        async with self._semaphore:
+            async with self._rate_lock:
+                self._refill()
+                if self._tokens < 1:
+                    delay = (1 - self._tokens) / self._rate
+                    _LOGGER.debug("Delaying refresh by %.1f seconds to respect rate budget", delay)
+                    await asyncio.sleep(delay)
+                    self._refill()
+                self._tokens -= 1
+            yield
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = asyncio.get_running_loop().time()
+        if self._last_refill is not None:
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._last_refill) * self._rate
+            )
+        self._last_refill = now
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> EasyEquitiesRefreshScheduler:
+    """Return the shared scheduler, creating it on first use."""
+    if DATA_SCHEDULER not in hass.data:
+        hass.data[DATA_SCHEDULER] = EasyEquitiesRefreshScheduler()
+    return hass.data[DATA_SCHEDULER]
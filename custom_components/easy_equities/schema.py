@@ -0,0 +1,160 @@
+"""Fingerprint the shape of Easy Equities API responses.
+
+A fingerprint maps every field path of the responses (for example
+``holdings[].current_value``) to the formats its values were seen in, such
+as ``currency:R`` or ``datetime``. Comparing a fresh fingerprint with a
+stored one shows API changes, and flags those that would break parsing or
+the sensors. This module does not import Home Assistant; it is used by
+``scripts/analyze_data.py --schema``.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+import re
+from typing import Any
+
+from .retention import HOLDING_FIELDS, TRANSACTION_FIELDS, VALUATION_FIELDS
+
+DRIFT_BREAKING = "breaking"
+DRIFT_CHANGED = "changed"
+
+_SYMBOLS = "R$€£¥"
+_DIGITS = r"-?[\d\s,]*\d(?:\.\d+)?"
+_CURRENCY_PREFIX = re.compile(rf"^-?\s*(?P<symbol>[{_SYMBOLS}])\s?{_DIGITS}$")
+_CURRENCY_SUFFIX = re.compile(rf"^{_DIGITS}\s?(?P<symbol>[{_SYMBOLS}])$")
+_NUMBER = re.compile(rf"^{_DIGITS}$")
+_PERCENT = re.compile(rf"^{_DIGITS}\s?%$")
+_DATETIME = re.compile(r"^\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?")
+
+# Formats parse_currency turns into a number
+NUMERIC_FORMATS = frozenset({"int", "float", "number", "null"})
+
+# Paths read by the integration; drift here breaks sensors or events
+READ_PATHS: frozenset[str] = frozenset(
+    {f"holdings[].{field}" for field in HOLDING_FIELDS}
+    | {f"transactions[].{field}" for field in TRANSACTION_FIELDS}
+    | {
+        f"valuations.{section}.{field}"
+        for section, fields in VALUATION_FIELDS.items()
+        for field in fields
+    }
+    | {
+        "valuations.FundSummaryItems[].Label",
+        "valuations.FundSummaryItems[].Value",
+        "valuations.InvestmentSummaryItems[].Label",
+        "valuations.InvestmentSummaryItems[].Value",
+        "valuations.InvestmentTypesAndManagers.InvestmentTypes[].Label",
+        "valuations.InvestmentTypesAndManagers.InvestmentTypes[].Value",
+        "valuations.AccrualSummaryItems[].Label",
+        "valuations.AccrualSummaryItems[].Value",
+    }
+)
+
+# Read paths whose values are parsed as numbers
+NUMERIC_PATHS: frozenset[str] = frozenset(
+    {
+        "holdings[].shares",
+        "holdings[].purchase_value",
+        "holdings[].current_value",
+        "holdings[].current_price",
+        "transactions[].DebitCredit",
+        "valuations.TopSummary.AccountValue",
+        "valuations.FundSummaryItems[].Value",
+        "valuations.InvestmentSummaryItems[].Value",
+        "valuations.InvestmentTypesAndManagers.InvestmentTypes[].Value",
+        "valuations.AccrualSummaryItems[].Value",
+    }
+)
+
+
+def value_format(value: Any) -> str:
+    """Return the format of a value, e.g. ``currency:R``, ``number`` or ``string``."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, dict):
+        return "object"
+    if isinstance(value, list):
+        return "array"
+    text = str(value).strip()
+    if not text:
+        return "empty"
+    if match := _CURRENCY_PREFIX.match(text) or _CURRENCY_SUFFIX.match(text):
+        return f"currency:{match['symbol']}"
+    if _NUMBER.match(text):
+        return "number"
+    if _PERCENT.match(text):
+        return "percent"
+    if _DATETIME.match(text):
+        return "datetime"
+    return "string"
+
+
+def _walk(value: Any, path: str, formats: dict[str, set[str]]) -> None:
+    """Record the format of value and of everything nested in it."""
+    if path:
+        formats.setdefault(path, set()).add(value_format(value))
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _walk(item, f"{path}.{key}" if path else str(key), formats)
+    elif isinstance(value, list):
+        for item in value:
+            _walk(item, f"{path}[]", formats)
+
+
+def fingerprint(responses: Iterable[dict[str, Any]]) -> dict[str, list[str]]:
+    """Return the fingerprint of the endpoint responses of one or more accounts.
+
+    Each item maps an endpoint name to its response.
+    """
+    formats: dict[str, set[str]] = {}
+    for account_responses in responses:
+        _walk(account_responses, "", formats)
+    return {path: sorted(formats[path]) for path in sorted(formats)}
+
+
+def _is_numeric(fmt: str) -> bool:
+    """Return True if parse_currency turns values of the format into numbers."""
+    return fmt in NUMERIC_FORMATS or fmt.startswith("currency:")
+
+
+def diff_fingerprints(
+    stored: dict[str, list[str]], current: dict[str, list[str]]
+) -> list[tuple[str, str, str]]:
+    """Return the (severity, path, description) differences between fingerprints.
+
+    Removed read paths and formats that can't be parsed where a number is
+    expected are breaking; everything else is reported as changed. A path
+    that is missing because a response was empty (no transactions, say) is
+    reported like any other removal, so compare fingerprints of full accounts.
+    """
+    drift: list[tuple[str, str, str]] = []
+    for path in sorted(stored.keys() | current.keys()):
+        before = set(stored.get(path, ()))
+        after = set(current.get(path, ()))
+        if before == after:
+            continue
+        if not after:
+            severity = DRIFT_BREAKING if path in READ_PATHS else DRIFT_CHANGED
+            drift.append((severity, path, "removed"))
+            continue
+        if not before:
+            drift.append((DRIFT_CHANGED, path, f"added as {', '.join(sorted(after))}"))
+            continue
+        added = after - before
+        severity = DRIFT_CHANGED
+        if path in NUMERIC_PATHS and not all(_is_numeric(fmt) for fmt in added):
+            severity = DRIFT_BREAKING
+        drift.append(
+            (
+                severity,
+                path,
+                f"formats {', '.join(sorted(before))} -> {', '.join(sorted(after))}",
+            )
+        )
+    return drift
@@ -10,30 +10,112 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.typing import StateType
+from homeassistant.util import slugify
 
 from .const import (
     ATTR_ACCOUNT_NAME,
+    ATTR_ACCOUNTS,
     ATTR_ACCOUNT_NUMBER,
+    ATTR_ACCRUED,
+    ATTR_BUY,
+    ATTR_BY_HOLDING,
+    ATTR_CASH_ITEMS,
     ATTR_CONTRACT_CODE,
+    ATTR_CONTRACT_CODES,
+    ATTR_COST_BASIS,
     ATTR_CURRENCY,
     ATTR_CURRENT_PRICE,
     ATTR_CURRENT_VALUE,
+    ATTR_DIVIDENDS,
+    ATTR_EXCHANGES,
+    ATTR_HOLDINGS,
+    ATTR_INTEREST,
     ATTR_ISIN,
+    ATTR_LOTS,
+    ATTR_MONTHLY,
+    ATTR_OLDEST_LOT_DAYS,
+    ATTR_PLATFORMS,
     ATTR_PROFIT_LOSS,
     ATTR_PROFIT_LOSS_PERCENT,
     ATTR_PURCHASE_VALUE,
+    ATTR_REALIZED_GAIN,
+    ATTR_SELL,
     ATTR_SHARES,
+    ATTR_STALE,
+    ATTR_STALE_ACCOUNTS,
+    ATTR_STALE_SINCE,
+    ATTR_TRAILING_12_MONTHS,
+    ATTR_UNMATCHED_SHARES,
+    ATTR_UNREALIZED_GAIN,
+    ATTR_WEIGHT,
+    ATTR_TRADINGVIEW_SYMBOL,
+    ATTR_TRADINGVIEW_SYMBOLS,
+    CONF_USERNAME,
     DOMAIN,
+    SIGNAL_ACCOUNTS_UPDATED,
 )
-from .coordinator import EasyEquitiesDataUpdateCoordinator
-from .util import parse_currency
+from .coordinator import EasyEquitiesAccountCoordinator, EasyEquitiesDataUpdateCoordinator
+from .income import INCOME_DIVIDEND, INCOME_FEE, INCOME_INTEREST
+from .util import parse_currency, parse_number
 
 _LOGGER = logging.getLogger(__name__)
 
+# Per-account sensors: key, name suffix, summary field, unit, icon. A unit of
+# None means the account's currency.
+ACCOUNT_SUMMARY_SENSORS: tuple[tuple[str, str, str, str | None, str], ...] = (
+    ("value", "Value", "total_current_value", None, "mdi:wallet"),
+    ("purchase_value", "Purchase Value", "total_purchase_value", None, "mdi:currency-usd"),
+    ("profit_loss", "Profit/Loss", "total_profit_loss", None, "mdi:trending-up"),
+    ("profit_loss_percent", "Profit/Loss %", "total_profit_loss_percent", "%", "mdi:percent"),
+    ("holdings_count", "Holdings Count", "holdings_count", "holdings", "mdi:chart-box"),
+)
+
+
+def _tradingview_symbols(holdings: list[dict[str, Any]]) -> list[str]:
+    """Return the TradingView symbols of the holdings, largest value first."""
+    symbols: list[str] = []
+    for holding in sorted(
+        holdings,
+        key=lambda holding: parse_number(holding.get("current_value")) or 0.0,
+        reverse=True,
+    ):
+        symbol = holding.get("_tradingview_symbol")
+        if symbol and symbol not in symbols:
+            symbols.append(symbol)
+    return symbols
+
+
+def _holding_unique_key(holding: dict[str, Any]) -> str:
+    """Return the unique id key of a holding sensor, unique across accounts."""
+    return f"holding_{holding.get('_account_id')}_{holding.get('contract_code', 'unknown')}"
+
+
+@callback
+def _async_migrate_holding_unique_ids(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: EasyEquitiesDataUpdateCoordinator
+) -> None:
+    """Move holding sensors to per-account unique ids, keeping their entity ids.
+
+    Unique ids used to hold only the contract code, so an instrument held in
+    two accounts had a single sensor; it stays with the first account.
+    """
+    registry = er.async_get(hass)
+    for account_coordinator in coordinator.account_coordinators.values():
+        for holding in (account_coordinator.data or {}).get("holdings", []):
+            old_unique_id = f"{entry.entry_id}_holding_{holding.get('contract_code', 'unknown')}"
+            new_unique_id = f"{entry.entry_id}_{_holding_unique_key(holding)}"
+            entity_id = registry.async_get_entity_id("sensor", DOMAIN, old_unique_id)
+            if entity_id is None or registry.async_get_entity_id("sensor", DOMAIN, new_unique_id):
+                continue
+            _LOGGER.debug("Migrating %s to unique id %s", entity_id, new_unique_id)
+            registry.async_update_entity(entity_id, new_unique_id=new_unique_id)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -41,11 +123,9 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Easy Equities sensor platform."""
-    import logging
-    _LOGGER = logging.getLogger(__name__)
-    
     _LOGGER.info("Setting up Easy Equities sensors for entry: %s", entry.entry_id)
     coordinator: EasyEquitiesDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    _async_migrate_holding_unique_ids(hass, entry, coordinator)
 
     entities: list[SensorEntity] = [
         EasyEquitiesPortfolioValueSensor(coordinator, entry, "portfolio_value"),
@@ -53,23 +133,163 @@ async def async_setup_entry(
         EasyEquitiesPortfolioProfitLossSensor(coordinator, entry, "portfolio_profit_loss"),
         EasyEquitiesPortfolioProfitLossPercentSensor(coordinator, entry, "portfolio_profit_loss_percent"),
         EasyEquitiesHoldingsCountSensor(coordinator, entry, "portfolio_holdings_count"),
+        EasyEquitiesIncomeSensor(coordinator, entry, "portfolio_income"),
+        EasyEquitiesIncomeYieldSensor(coordinator, entry, "portfolio_income_yield"),
+        EasyEquitiesFeesSensor(coordinator, entry, "portfolio_fees"),
+        EasyEquitiesCashSensor(coordinator, entry, "portfolio_cash"),
+        EasyEquitiesInvestedSensor(coordinator, entry, "portfolio_invested"),
+        EasyEquitiesAllocationDriftSensor(coordinator, entry, "portfolio_allocation_drift"),
+        EasyEquitiesRebalanceSensor(coordinator, entry, "portfolio_rebalance"),
+        EasyEquitiesRealizedGainSensor(coordinator, entry, "portfolio_realized_gain"),
+        EasyEquitiesUnrealizedGainSensor(coordinator, entry, "portfolio_unrealized_gain"),
+        EasyEquitiesLotAgeSensor(coordinator, entry, "portfolio_lot_age"),
     ]
     _LOGGER.debug("Created %d portfolio sensor(s)", len(entities))
 
-    # Add individual holding sensors
-    if coordinator.data and "holdings" in coordinator.data:
-        holdings = coordinator.data["holdings"]
-        _LOGGER.debug("Found %d holding(s) to create sensors for", len(holdings))
-        for holding in holdings:
-            entities.append(
-                EasyEquitiesHoldingSensor(coordinator, entry, holding)
-            )
-        _LOGGER.info("Created %d holding sensor(s)", len(holdings))
-    else:
-        _LOGGER.warning("No holdings data available yet, holding sensors will be created on next update")
+    # Asset class sensors, added as asset classes appear in the valuations
+    asset_class_sensors: set[str] = set()
+
+    @callback
+    def _async_new_asset_class_sensors() -> list[SensorEntity]:
+        """Create sensors for asset classes not seen before."""
+        breakdown = (coordinator.data or {}).get("breakdown") or {}
+        new_sensors: list[SensorEntity] = []
+        for asset_class in breakdown.get("asset_classes", {}):
+            if asset_class in asset_class_sensors:
+                continue
+            asset_class_sensors.add(asset_class)
+            new_sensors.append(EasyEquitiesAssetClassSensor(coordinator, entry, asset_class))
+        return new_sensors
+
+    @callback
+    def _async_check_new_asset_classes() -> None:
+        if new_sensors := _async_new_asset_class_sensors():
+            _LOGGER.info("Adding %d new asset class sensor(s)", len(new_sensors))
+            async_add_entities(new_sensors)
+
+    entities.extend(_async_new_asset_class_sensors())
+    entry.async_on_unload(coordinator.async_add_listener(_async_check_new_asset_classes))
+
+    # Position sensors for instruments held in more than one account
+    position_sensors: set[str] = set()
+
+    @callback
+    def _async_new_position_sensors() -> list[SensorEntity]:
+        """Create sensors for instruments newly held in several accounts."""
+        new_sensors: list[SensorEntity] = []
+        for key, position in ((coordinator.data or {}).get("positions") or {}).items():
+            if key in position_sensors or len(position["accounts"]) < 2:
+                continue
+            position_sensors.add(key)
+            new_sensors.append(EasyEquitiesPositionSensor(coordinator, entry, key, position))
+        return new_sensors
+
+    @callback
+    def _async_check_new_positions() -> None:
+        if new_sensors := _async_new_position_sensors():
+            _LOGGER.info("Adding %d new position sensor(s)", len(new_sensors))
+            async_add_entities(new_sensors)
+
+    entities.extend(_async_new_position_sensors())
+    entry.async_on_unload(coordinator.async_add_listener(_async_check_new_positions))
+
+    # Holding sensors per account, so accounts can be added and removed alone
+    holding_sensors: dict[str, dict[str, EasyEquitiesHoldingSensor]] = {}
+    account_sensors: dict[str, list[EasyEquitiesAccountSummarySensor]] = {}
+    account_unsubs: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def _async_account_sensors(
+        account_coordinator: EasyEquitiesAccountCoordinator,
+    ) -> list[SensorEntity]:
+        """Create the summary sensors of an account."""
+        sensors = account_sensors[account_coordinator.account_id] = [
+            EasyEquitiesAccountSummarySensor(account_coordinator, entry, *description)
+            for description in ACCOUNT_SUMMARY_SENSORS
+        ]
+        return list(sensors)
+
+    @callback
+    def _async_new_holding_sensors(
+        account_coordinator: EasyEquitiesAccountCoordinator,
+    ) -> list[SensorEntity]:
+        """Create sensors for holdings of an account not seen before."""
+        if not account_coordinator.data:
+            return []
+        known = holding_sensors.setdefault(account_coordinator.account_id, {})
+        new_sensors: list[SensorEntity] = []
+        for holding in account_coordinator.data["holdings"]:
+            key = _holding_unique_key(holding)
+            if key in known:
+                continue
+            known[key] = EasyEquitiesHoldingSensor(account_coordinator, entry, holding)
+            new_sensors.append(known[key])
+        return new_sensors
+
+    @callback
+    def _async_track_account(account_coordinator: EasyEquitiesAccountCoordinator) -> None:
+        """Add sensors for positions opened after setup."""
+
+        @callback
+        def _async_check_new_holdings() -> None:
+            if new_sensors := _async_new_holding_sensors(account_coordinator):
+                _LOGGER.info("Adding %d new holding sensor(s)", len(new_sensors))
+                async_add_entities(new_sensors)
+
+        account_unsubs[account_coordinator.account_id] = (
+            account_coordinator.async_add_listener(_async_check_new_holdings)
+        )
+
+    @callback
+    def _async_accounts_updated(added: list[str], removed: list[str]) -> None:
+        """Add and remove only the sensors of changed accounts."""
+        registry = er.async_get(hass)
+        for account_id in removed:
+            if unsub := account_unsubs.pop(account_id, None):
+                unsub()
+            for sensor in [
+                *holding_sensors.pop(account_id, {}).values(),
+                *account_sensors.pop(account_id, []),
+            ]:
+                if sensor.entity_id and registry.async_get(sensor.entity_id):
+                    registry.async_remove(sensor.entity_id)
+        new_sensors: list[SensorEntity] = []
+        for account_id in added:
+            account_coordinator = coordinator.account_coordinators[account_id]
+            new_sensors.extend(_async_account_sensors(account_coordinator))
+            new_sensors.extend(_async_new_holding_sensors(account_coordinator))
+            _async_track_account(account_coordinator)
+        if new_sensors:
+            async_add_entities(new_sensors)
+
+    # Add individual holding sensors, each bound to its own account coordinator
+    holdings_count = 0
+    for account_coordinator in coordinator.account_coordinators.values():
+        entities.extend(_async_account_sensors(account_coordinator))
+        new_sensors = _async_new_holding_sensors(account_coordinator)
+        holdings_count += len(new_sensors)
+        entities.extend(new_sensors)
+        _async_track_account(account_coordinator)
+    _LOGGER.info("Created %d holding sensor(s)", holdings_count)
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_ACCOUNTS_UPDATED.format(entry.entry_id),
+            _async_accounts_updated,
+        )
+    )
+
+    @callback
+    def _async_unsubscribe_accounts() -> None:
+        for unsub in account_unsubs.values():
+            unsub()
 
+    entry.async_on_unload(_async_unsubscribe_accounts)
+
+    # Data was fetched by the first refresh, so no update before adding
     _LOGGER.info("Adding %d total sensor(s) to Home Assistant", len(entities))
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
     _LOGGER.info("Sensor setup completed for entry: %s", entry.entry_id)
 
 
@@ -89,13 +309,38 @@ class EasyEquitiesSensor(CoordinatorEntity[EasyEquitiesDataUpdateCoordinator], S
             self._attr_unique_id = f"{entry.entry_id}_{key}"
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": f"Easy Equities ({coordinator.username})",
+            "name": f"Easy Equities ({entry.data[CONF_USERNAME]})",
             "manufacturer": "Easy Equities",
             "model": "Portfolio",
         }
 
 
-class EasyEquitiesPortfolioValueSensor(EasyEquitiesSensor):
+class EasyEquitiesCurrencySensor(EasyEquitiesSensor):
+    """Base for monetary portfolio sensors in the primary account's currency."""
+
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_native_unit_of_measurement = "ZAR"  # Default, will be updated from data
+
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Return the unit of measurement."""
+        data = self.coordinator.data or {}
+        account = data.get("account") or {}
+        if account.get("currency"):
+            return account["currency"]
+        # Fallback: the first account with data
+        accounts = data.get("accounts") or []
+        if accounts and accounts[0].get("account", {}).get("currency"):
+            return accounts[0]["account"]["currency"]
+        return self._attr_native_unit_of_measurement
+
+    @property
+    def _breakdown(self) -> dict[str, Any] | None:
+        """Return the portfolio valuations breakdown."""
+        return (self.coordinator.data or {}).get("breakdown")
+
+
+class EasyEquitiesPortfolioValueSensor(EasyEquitiesCurrencySensor):
     """Sensor for total portfolio value."""
 
     def __init__(
@@ -107,8 +352,6 @@ class EasyEquitiesPortfolioValueSensor(EasyEquitiesSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, entry, key)
         self._attr_name = "Portfolio Value"
-        self._attr_native_unit_of_measurement = "ZAR"  # Default, will be updated from data
-        self._attr_device_class = SensorDeviceClass.MONETARY
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_icon = "mdi:wallet"
 
@@ -119,21 +362,6 @@ class EasyEquitiesPortfolioValueSensor(EasyEquitiesSensor):
             return None
         return self.coordinator.data["summary"].get("total_current_value")
 
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return the unit of measurement."""
-        if not self.coordinator.data:
-            return self._attr_native_unit_of_measurement
-        # Get currency from primary account or first account
-        account = self.coordinator.data.get("account", {})
-        if account and account.get("currency"):
-            return account.get("currency")
-        # Fallback: check accounts list
-        accounts = self.coordinator.data.get("accounts", [])
-        if accounts and accounts[0].get("account", {}).get("currency"):
-            return accounts[0]["account"]["currency"]
-        return self._attr_native_unit_of_measurement
-
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
@@ -155,10 +383,16 @@ class EasyEquitiesPortfolioValueSensor(EasyEquitiesSensor):
         return {
             ATTR_ACCOUNT_NAME: account.get("name"),
             ATTR_CURRENCY: ", ".join(sorted(currencies)) if currencies else "ZAR",
+            ATTR_STALE_ACCOUNTS: data.get("stale_accounts", []),
+            ATTR_TRADINGVIEW_SYMBOLS: _tradingview_symbols(data.get("holdings", [])),
+            ATTR_PLATFORMS: {
+                platform: round(totals["total_current_value"], 2)
+                for platform, totals in data.get("summary", {}).get("platforms", {}).items()
+            },
         }
 
 
-class EasyEquitiesPortfolioPurchaseValueSensor(EasyEquitiesSensor):
+class EasyEquitiesPortfolioPurchaseValueSensor(EasyEquitiesCurrencySensor):
     """Sensor for total purchase value."""
 
     def __init__(
@@ -170,26 +404,9 @@ class EasyEquitiesPortfolioPurchaseValueSensor(EasyEquitiesSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, entry, key)
         self._attr_name = "Portfolio Purchase Value"
-        self._attr_native_unit_of_measurement = "ZAR"  # Default, will be updated from data
-        self._attr_device_class = SensorDeviceClass.MONETARY
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_icon = "mdi:currency-usd"
 
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return the unit of measurement."""
-        if not self.coordinator.data:
-            return self._attr_native_unit_of_measurement
-        # Get currency from primary account or first account
-        account = self.coordinator.data.get("account", {})
-        if account and account.get("currency"):
-            return account.get("currency")
-        # Fallback: check accounts list
-        accounts = self.coordinator.data.get("accounts", [])
-        if accounts and accounts[0].get("account", {}).get("currency"):
-            return accounts[0]["account"]["currency"]
-        return self._attr_native_unit_of_measurement
-
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
@@ -198,7 +415,7 @@ class EasyEquitiesPortfolioPurchaseValueSensor(EasyEquitiesSensor):
         return self.coordinator.data["summary"].get("total_purchase_value")
 
 
-class EasyEquitiesPortfolioProfitLossSensor(EasyEquitiesSensor):
+class EasyEquitiesPortfolioProfitLossSensor(EasyEquitiesCurrencySensor):
     """Sensor for total profit/loss."""
 
     def __init__(
@@ -210,26 +427,9 @@ class EasyEquitiesPortfolioProfitLossSensor(EasyEquitiesSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, entry, key)
         self._attr_name = "Portfolio Profit/Loss"
-        self._attr_native_unit_of_measurement = "ZAR"  # Default, will be updated from data
-        self._attr_device_class = SensorDeviceClass.MONETARY
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_icon = "mdi:trending-up"
 
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return the unit of measurement."""
-        if not self.coordinator.data:
-            return self._attr_native_unit_of_measurement
-        # Get currency from primary account or first account
-        account = self.coordinator.data.get("account", {})
-        if account and account.get("currency"):
-            return account.get("currency")
-        # Fallback: check accounts list
-        accounts = self.coordinator.data.get("accounts", [])
-        if accounts and accounts[0].get("account", {}).get("currency"):
-            return accounts[0]["account"]["currency"]
-        return self._attr_native_unit_of_measurement
-
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
@@ -299,21 +499,552 @@ class EasyEquitiesHoldingsCountSensor(EasyEquitiesSensor):
         return self.coordinator.data["summary"].get("holdings_count")
 
 
+class EasyEquitiesIncomeSensor(EasyEquitiesCurrencySensor):
+    """Sensor for dividends and interest received to date."""
+
+    def __init__(
+        self,
+        coordinator: EasyEquitiesDataUpdateCoordinator,
+        entry: ConfigEntry,
+        key: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, key)
+        self._attr_name = "Portfolio Income"
+        self._attr_state_class = SensorStateClass.TOTAL
+        self._attr_icon = "mdi:cash-plus"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        if not self.coordinator.data or "income" not in self.coordinator.data:
+            return None
+        income = self.coordinator.data["income"]
+        return round(income[INCOME_DIVIDEND]["total"] + income[INCOME_INTEREST]["total"], 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra state attributes."""
+        if not self.coordinator.data or "income" not in self.coordinator.data:
+            return {}
+        income = self.coordinator.data["income"]
+        dividends = income[INCOME_DIVIDEND]
+        interest = income[INCOME_INTEREST]
+        months = dividends[ATTR_MONTHLY].keys() | interest[ATTR_MONTHLY].keys()
+        return {
+            ATTR_DIVIDENDS: round(dividends["total"], 2),
+            ATTR_INTEREST: round(interest["total"], 2),
+            ATTR_TRAILING_12_MONTHS: round(
+                dividends[ATTR_TRAILING_12_MONTHS] + interest[ATTR_TRAILING_12_MONTHS], 2
+            ),
+            ATTR_MONTHLY: {
+                month: round(
+                    dividends[ATTR_MONTHLY].get(month, 0.0)
+                    + interest[ATTR_MONTHLY].get(month, 0.0),
+                    2,
+                )
+                for month in sorted(months)
+            },
+            ATTR_BY_HOLDING: {
+                code: round(amount, 2) for code, amount in income[ATTR_BY_HOLDING].items()
+            },
+        }
+
+
+class EasyEquitiesIncomeYieldSensor(EasyEquitiesSensor):
+    """Sensor for the trailing 12 month income yield on the current value."""
+
+    def __init__(
+        self,
+        coordinator: EasyEquitiesDataUpdateCoordinator,
+        entry: ConfigEntry,
+        key: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, key)
+        self._attr_name = "Portfolio Income Yield 12M"
+        self._attr_native_unit_of_measurement = "%"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_icon = "mdi:percent"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        data = self.coordinator.data
+        if not data or "income" not in data or "summary" not in data:
+            return None
+        current_value = data["summary"].get("total_current_value")
+        if not current_value:
+            return None
+        income = data["income"]
+        trailing = (
+            income[INCOME_DIVIDEND][ATTR_TRAILING_12_MONTHS]
+            + income[INCOME_INTEREST][ATTR_TRAILING_12_MONTHS]
+        )
+        return round(trailing / current_value * 100, 2)
+
+
+class EasyEquitiesFeesSensor(EasyEquitiesCurrencySensor):
+    """Sensor for fees and charges paid to date."""
+
+    def __init__(
+        self,
+        coordinator: EasyEquitiesDataUpdateCoordinator,
+        entry: ConfigEntry,
+        key: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, key)
+        self._attr_name = "Portfolio Fees"
+        self._attr_state_class = SensorStateClass.TOTAL
+        self._attr_icon = "mdi:cash-minus"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        if not self.coordinator.data or "income" not in self.coordinator.data:
+            return None
+        return round(self.coordinator.data["income"][INCOME_FEE]["total"], 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra state attributes."""
+        if not self.coordinator.data or "income" not in self.coordinator.data:
+            return {}
+        fees = self.coordinator.data["income"][INCOME_FEE]
+        return {
+            ATTR_TRAILING_12_MONTHS: round(fees[ATTR_TRAILING_12_MONTHS], 2),
+            ATTR_MONTHLY: {month: round(amount, 2) for month, amount in sorted(fees[ATTR_MONTHLY].items())},
+        }
+
+
+class EasyEquitiesCashSensor(EasyEquitiesCurrencySensor):
+    """Sensor for free cash across the accounts."""
+
+    def __init__(
+        self,
+        coordinator: EasyEquitiesDataUpdateCoordinator,
+        entry: ConfigEntry,
+        key: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, key)
+        self._attr_name = "Portfolio Cash"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_icon = "mdi:cash"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        if not self._breakdown or self._breakdown["cash"] is None:
+            return None
+        return round(self._breakdown["cash"], 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra state attributes."""
+        if not self._breakdown:
+            return {}
+        return {
+            ATTR_CASH_ITEMS: {
+                label: round(value, 2) for label, value in self._breakdown["cash_items"].items()
+            },
+            ATTR_ACCRUED: round(self._breakdown["accrued"], 2),
+        }
+
+
+class EasyEquitiesInvestedSensor(EasyEquitiesCurrencySensor):
+    """Sensor for the value invested in instruments, excluding cash."""
+
+    def __init__(
+        self,
+        coordinator: EasyEquitiesDataUpdateCoordinator,
+        entry: ConfigEntry,
+        key: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, key)
+        self._attr_name = "Portfolio Invested"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_icon = "mdi:briefcase"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        if not self._breakdown or self._breakdown["invested"] is None:
+            return None
+        return round(self._breakdown["invested"], 2)
+
+
+class EasyEquitiesAssetClassSensor(EasyEquitiesCurrencySensor):
+    """Sensor for the value held in one asset class across the accounts."""
+
+    def __init__(
+        self,
+        coordinator: EasyEquitiesDataUpdateCoordinator,
+        entry: ConfigEntry,
+        asset_class: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, f"asset_class_{slugify(asset_class)}")
+        self._asset_class = asset_class
+        self._attr_name = f"Asset Class: {asset_class}"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_icon = "mdi:chart-pie"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        if not self._breakdown:
+            return None
+        value = self._breakdown["asset_classes"].get(self._asset_class)
+        return round(value, 2) if value is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra state attributes."""
+        if not self._breakdown:
+            return {}
+        value = self._breakdown["asset_classes"].get(self._asset_class)
+        total = sum(self._breakdown["asset_classes"].values())
+        return {
+            ATTR_WEIGHT: round(value / total * 100, 2) if value is not None and total else None,
+        }
+
+
+class EasyEquitiesAllocationDriftSensor(EasyEquitiesSensor):
+    """Sensor for the largest drift from the allocation targets."""
+
+    def __init__(
+        self,
+        coordinator: EasyEquitiesDataUpdateCoordinator,
+        entry: ConfigEntry,
+        key: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, key)
+        self._attr_name = "Portfolio Allocation Drift"
+        self._attr_native_unit_of_measurement = "%"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_icon = "mdi:scale-unbalanced"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        allocation = (self.coordinator.data or {}).get("allocation")
+        return allocation["max_drift"] if allocation else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra state attributes."""
+        allocation = (self.coordinator.data or {}).get("allocation")
+        if not allocation:
+            return {}
+        return {
+            ATTR_HOLDINGS: allocation["holdings"],
+            ATTR_EXCHANGES: allocation["exchanges"],
+        }
+
+
+class EasyEquitiesRebalanceSensor(EasyEquitiesCurrencySensor):
+    """Sensor for the amount to buy to bring holdings back to their targets."""
+
+    def __init__(
+        self,
+        coordinator: EasyEquitiesDataUpdateCoordinator,
+        entry: ConfigEntry,
+        key: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, key)
+        self._attr_name = "Portfolio Rebalance Amount"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_icon = "mdi:swap-horizontal"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        allocation = (self.coordinator.data or {}).get("allocation")
+        return allocation["buy"] if allocation else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra state attributes."""
+        allocation = (self.coordinator.data or {}).get("allocation")
+        if not allocation:
+            return {}
+        return {
+            ATTR_BUY: {
+                code: row["rebalance"]
+                for code, row in allocation["holdings"].items()
+                if row["rebalance"] and row["rebalance"] > 0
+            },
+            ATTR_SELL: {
+                code: -row["rebalance"]
+                for code, row in allocation["holdings"].items()
+                if row["rebalance"] and row["rebalance"] < 0
+            },
+        }
+
+
+class EasyEquitiesRealizedGainSensor(EasyEquitiesCurrencySensor):
+    """Sensor for the gains realized by sells, against their FIFO lots."""
+
+    def __init__(
+        self,
+        coordinator: EasyEquitiesDataUpdateCoordinator,
+        entry: ConfigEntry,
+        key: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, key)
+        self._attr_name = "Portfolio Realized Gain"
+        self._attr_state_class = SensorStateClass.TOTAL
+        self._attr_icon = "mdi:cash-check"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        lots = (self.coordinator.data or {}).get("lots")
+        return round(lots["realized_gain"], 2) if lots else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra state attributes."""
+        lots = (self.coordinator.data or {}).get("lots")
+        if not lots:
+            return {}
+        return {
+            ATTR_BY_HOLDING: {
+                code: round(row["realized_gain"], 2)
+                for code, row in lots["by_holding"].items()
+                if row["realized_gain"]
+            },
+            ATTR_UNMATCHED_SHARES: {
+                code: row["unmatched_shares"]
+                for code, row in lots["by_holding"].items()
+                if row["unmatched_shares"]
+            },
+        }
+
+
+class EasyEquitiesUnrealizedGainSensor(EasyEquitiesCurrencySensor):
+    """Sensor for the gains of the open FIFO lots at the current prices."""
+
+    def __init__(
+        self,
+        coordinator: EasyEquitiesDataUpdateCoordinator,
+        entry: ConfigEntry,
+        key: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, key)
+        self._attr_name = "Portfolio Unrealized Gain"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_icon = "mdi:cash-clock"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        lots = (self.coordinator.data or {}).get("lots")
+        return round(lots["unrealized_gain"], 2) if lots else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra state attributes."""
+        lots = (self.coordinator.data or {}).get("lots")
+        if not lots:
+            return {}
+        return {
+            ATTR_COST_BASIS: round(lots["cost_basis"], 2),
+            ATTR_BY_HOLDING: {
+                code: round(row["unrealized_gain"], 2)
+                for code, row in lots["by_holding"].items()
+                if row["unrealized_gain"] is not None
+            },
+        }
+
+
+class EasyEquitiesLotAgeSensor(EasyEquitiesSensor):
+    """Sensor for the share-weighted average age of the open FIFO lots."""
+
+    def __init__(
+        self,
+        coordinator: EasyEquitiesDataUpdateCoordinator,
+        entry: ConfigEntry,
+        key: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, key)
+        self._attr_name = "Portfolio Average Lot Age"
+        self._attr_native_unit_of_measurement = "d"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_icon = "mdi:calendar-clock"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        lots = (self.coordinator.data or {}).get("lots")
+        if not lots or lots["average_age_days"] is None:
+            return None
+        return round(lots["average_age_days"], 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra state attributes."""
+        lots = (self.coordinator.data or {}).get("lots")
+        if not lots:
+            return {}
+        return {
+            ATTR_OLDEST_LOT_DAYS: lots["oldest_lot_days"],
+            ATTR_BY_HOLDING: {
+                code: row["oldest_lot_days"]
+                for code, row in lots["by_holding"].items()
+                if row["oldest_lot_days"] is not None
+            },
+        }
+
+
+class EasyEquitiesPositionSensor(EasyEquitiesSensor):
+    """Sensor for the value of one instrument across the accounts."""
+
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:layers"
+
+    def __init__(
+        self,
+        coordinator: EasyEquitiesDataUpdateCoordinator,
+        entry: ConfigEntry,
+        key: str,
+        position: dict[str, Any],
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, f"position_{slugify(key)}")
+        self._key = key
+        self._attr_name = f"Position: {position.get('name') or key}"
+        self._attr_native_unit_of_measurement = position.get("currency") or "ZAR"
+
+    @property
+    def _position(self) -> dict[str, Any] | None:
+        """Return the position from the portfolio data."""
+        return ((self.coordinator.data or {}).get("positions") or {}).get(self._key)
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the combined value of the instrument."""
+        if (position := self._position) is None:
+            return None
+        return round(position["current_value"], 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra state attributes."""
+        if (position := self._position) is None:
+            return {}
+        return {
+            ATTR_ISIN: position["isin"],
+            ATTR_CONTRACT_CODES: position["contract_codes"],
+            ATTR_ACCOUNTS: position["accounts"],
+            ATTR_SHARES: round(position["shares"], 6),
+            ATTR_PURCHASE_VALUE: round(position["purchase_value"], 2),
+            ATTR_PROFIT_LOSS: round(position["profit_loss"], 2),
+            ATTR_PROFIT_LOSS_PERCENT: (
+                round(position["profit_loss"] / position["purchase_value"] * 100, 2)
+                if position["purchase_value"]
+                else None
+            ),
+        }
+
+
+class EasyEquitiesAccountSummarySensor(EasyEquitiesSensor):
+    """Sensor for one figure of an account's summary, updated only by its account."""
+
+    coordinator: EasyEquitiesAccountCoordinator
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: EasyEquitiesAccountCoordinator,
+        entry: ConfigEntry,
+        key: str,
+        name: str,
+        field: str,
+        unit: str | None,
+        icon: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, f"account_{coordinator.account_id}_{key}")
+        self._field = field
+        self._unit = unit
+        self._attr_name = f"{coordinator.portfolio.account_label(coordinator.account)} {name}"
+        self._attr_icon = icon
+        if unit is None:
+            self._attr_device_class = SensorDeviceClass.MONETARY
+        self._last_state = self._summary_state()
+
+    def _summary_state(self) -> tuple[Any, ...]:
+        """Return what the written state depends on: summary, staleness, availability."""
+        data = self.coordinator.data or {}
+        return (data.get("summary"), data.get("stale"), self.available)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the account's summary or availability has changed."""
+        state = self._summary_state()
+        if state == self._last_state:
+            return
+        self._last_state = state
+        super()._handle_coordinator_update()
+
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Return the unit of measurement."""
+        if self._unit is not None:
+            return self._unit
+        summary = (self.coordinator.data or {}).get("summary") or {}
+        return summary.get("currency", "ZAR")
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        if not self.coordinator.data or "summary" not in self.coordinator.data:
+            return None
+        value = self.coordinator.data["summary"].get(self._field)
+        return round(value, 2) if isinstance(value, float) else value
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra state attributes."""
+        data = self.coordinator.data or {}
+        attrs = {
+            "account_id": self.coordinator.account_id,
+            ATTR_ACCOUNT_NAME: self.coordinator.account.name,
+            ATTR_STALE: bool(data.get("stale")),
+        }
+        if data.get("stale_since"):
+            attrs[ATTR_STALE_SINCE] = data["stale_since"]
+        return attrs
+
+
 class EasyEquitiesHoldingSensor(EasyEquitiesSensor):
-    """Sensor for individual holding."""
+    """Sensor for individual holding, updated only by its account."""
+
+    coordinator: EasyEquitiesAccountCoordinator
 
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:chart-line"
 
     def __init__(
         self,
-        coordinator: EasyEquitiesDataUpdateCoordinator,
+        coordinator: EasyEquitiesAccountCoordinator,
         entry: ConfigEntry,
         holding: dict[str, Any],
     ) -> None:
         """Initialize the holding sensor."""
         contract_code = holding.get("contract_code", "unknown")
-        super().__init__(coordinator, entry, f"holding_{contract_code}")
+        super().__init__(coordinator, entry, _holding_unique_key(holding))
         self._contract_code = contract_code
         self._attr_name = f"Holding: {holding.get('name', 'Unknown')}"
         self._attr_native_unit_of_measurement = holding.get("_account_currency", "ZAR")
@@ -369,6 +1100,7 @@ class EasyEquitiesHoldingSensor(EasyEquitiesSensor):
             ATTR_PURCHASE_VALUE: holding.get("purchase_value"),
             ATTR_SHARES: holding.get("shares"),
             ATTR_CURRENT_VALUE: holding.get("current_value"),
+            ATTR_TRADINGVIEW_SYMBOL: holding.get("_tradingview_symbol"),
         }
         # Add account info if multiple accounts
         if holding.get("_account_id"):
@@ -377,4 +1109,17 @@ class EasyEquitiesHoldingSensor(EasyEquitiesSensor):
         # Add currency
         if holding.get("_account_currency"):
             attrs[ATTR_CURRENCY] = holding.get("_account_currency")
+        # Flag values served from cache while the account is being retried
+        attrs[ATTR_STALE] = bool(holding.get("_stale_since"))
+        if holding.get("_stale_since"):
+            attrs[ATTR_STALE_SINCE] = holding.get("_stale_since")
+        # Cost basis, gains and age of the holding's FIFO lots
+        lots = self.coordinator.data.get("lots") or {}
+        if (row := lots.get("by_holding", {}).get(self._contract_code)) is not None:
+            attrs[ATTR_LOTS] = row["lots"]
+            attrs[ATTR_COST_BASIS] = round(row["cost_basis"], 2)
+            if row["unrealized_gain"] is not None:
+                attrs[ATTR_UNREALIZED_GAIN] = round(row["unrealized_gain"], 2)
+            attrs[ATTR_REALIZED_GAIN] = round(row["realized_gain"], 2)
+            attrs[ATTR_OLDEST_LOT_DAYS] = row["oldest_lot_days"]
         return attrs
\ No newline at end of file
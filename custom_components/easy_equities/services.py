@@ -0,0 +1,317 @@
+"""Services for the Easy Equities integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from pathlib import Path
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .alerts import EasyEquitiesAlertRegistry
+from .allocation import TARGET_EXCHANGES, TARGET_HOLDINGS, EasyEquitiesAllocationTargets
+from .cache import async_get_cache
+from .const import (
+    ALERT_DIRECTION_BOTH,
+    ALERT_DIRECTIONS,
+    ALERT_METRICS,
+    ATTR_CONTRACT_CODE,
+    ATTR_ENDPOINTS,
+    CONF_ACCOUNT_IDS,
+    DATA_ALERTS,
+    DATA_ALLOCATION,
+    DOMAIN,
+    ENDPOINT_TRANSACTIONS,
+    ENDPOINTS,
+    EXPORT_DIRECTORY,
+    SERVICE_ADD_ALERT,
+    SERVICE_BACKFILL_STATISTICS,
+    SERVICE_CACHE_STATS,
+    SERVICE_EXPORT,
+    SERVICE_FETCH_RAW_DATA,
+    SERVICE_LIST_ALERTS,
+    SERVICE_PROFILE_REFRESH,
+    SERVICE_REFRESH,
+    SERVICE_REMOVE_ALERT,
+    SERVICE_SET_ALLOCATION,
+)
+from .coordinator import EasyEquitiesAccountCoordinator
+from .export import EXPORT_KINDS, FORMAT_CSV, FORMATS
+from .profiler import async_profile_refresh
+from .statistics import async_write_statistics, cash_flow_rows, statistic_id
+
+_LOGGER = logging.getLogger(__name__)
+
+REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_ACCOUNT_IDS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_ENDPOINTS, default=list(ENDPOINTS)): vol.All(
+            cv.ensure_list, [vol.In(ENDPOINTS)]
+        ),
+    }
+)
+
+ADD_ALERT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONTRACT_CODE): cv.string,
+        vol.Required("threshold"): vol.Coerce(float),
+        vol.Optional("metric", default="price"): vol.In(ALERT_METRICS),
+        vol.Optional("direction", default=ALERT_DIRECTION_BOTH): vol.In(ALERT_DIRECTIONS),
+        vol.Optional("account_id"): cv.string,
+        vol.Optional("name"): cv.string,
+    }
+)
+
+FETCH_RAW_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required("account_id"): cv.string,
+        vol.Optional(ATTR_ENDPOINTS, default=list(ENDPOINTS)): vol.All(
+            cv.ensure_list, [vol.In(ENDPOINTS)]
+        ),
+    }
+)
+
+EXPORT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_ACCOUNT_IDS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("format", default=FORMAT_CSV): vol.In(FORMATS),
+        vol.Optional("data", default=list(EXPORT_KINDS)): vol.All(
+            cv.ensure_list, [vol.In(EXPORT_KINDS)]
+        ),
+        vol.Optional("start_date"): cv.date,
+        vol.Optional("end_date"): cv.date,
+        vol.Optional("directory"): cv.string,
+    }
+)
+
+PROFILE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_ACCOUNT_IDS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("top", default=15): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+    }
+)
+
+BACKFILL_STATISTICS_SCHEMA = vol.Schema(
+    {vol.Optional(CONF_ACCOUNT_IDS): vol.All(cv.ensure_list, [cv.string])}
+)
+
+REMOVE_ALERT_SCHEMA = vol.Schema({vol.Required("alert_id"): cv.string})
+
+SET_ALLOCATION_SCHEMA = vol.Schema(
+    {
+        vol.Optional(TARGET_HOLDINGS): {cv.string: vol.Coerce(float)},
+        vol.Optional(TARGET_EXCHANGES): {cv.string: vol.Coerce(float)},
+    }
+)
+
+
+def _account_coordinators(
+    hass: HomeAssistant, account_ids: list[str] | None
+) -> list[EasyEquitiesAccountCoordinator]:
+    """Return the account coordinators targeted by a service call."""
+    coordinators = {
+        account_id: account_coordinator
+        for coordinator in hass.data.get(DOMAIN, {}).values()
+        for account_id, account_coordinator in coordinator.account_coordinators.items()
+    }
+    if account_ids is None:
+        return list(coordinators.values())
+    if unknown := [account_id for account_id in account_ids if account_id not in coordinators]:
+        raise HomeAssistantError(
+            f"Unknown Easy Equities account id(s): {', '.join(unknown)}"
+        )
+    return [coordinators[account_id] for account_id in account_ids]
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Easy Equities services."""
+
+    async def async_refresh(call: ServiceCall) -> None:
+        """Refresh the requested endpoints of the requested accounts."""
+        targets = _account_coordinators(hass, call.data.get(CONF_ACCOUNT_IDS))
+        endpoints = set(call.data[ATTR_ENDPOINTS])
+        _LOGGER.debug(
+            "Refresh requested for %d account(s): %s",
+            len(targets),
+            ", ".join(sorted(endpoints)),
+        )
+        results = await asyncio.gather(
+            *(target.async_request_endpoint_refresh(endpoints) for target in targets),
+            return_exceptions=True,
+        )
+        if errors := [str(result) for result in results if isinstance(result, Exception)]:
+            raise HomeAssistantError("; ".join(errors))
+
+    hass.services.async_register(DOMAIN, SERVICE_REFRESH, async_refresh, schema=REFRESH_SCHEMA)
+
+    async def async_fetch_raw_data(call: ServiceCall) -> ServiceResponse:
+        """Return the untrimmed API responses of an account."""
+        (target,) = _account_coordinators(hass, [call.data["account_id"]])
+        return await target.async_fetch_raw_data(set(call.data[ATTR_ENDPOINTS]))
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FETCH_RAW_DATA,
+        async_fetch_raw_data,
+        schema=FETCH_RAW_DATA_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def async_export(call: ServiceCall) -> ServiceResponse:
+        """Export transactions and holdings snapshots to files."""
+        targets = _account_coordinators(hass, call.data.get(CONF_ACCOUNT_IDS))
+        directory = Path(hass.config.path(EXPORT_DIRECTORY))
+        if custom_directory := call.data.get("directory"):
+            if not hass.config.is_allowed_path(custom_directory):
+                raise HomeAssistantError(
+                    f"Export directory is not in allowlist_external_dirs: {custom_directory}"
+                )
+            directory = Path(custom_directory)
+        files: list[str] = []
+        # Accounts are exported one after another, keeping one in memory
+        for target in targets:
+            paths = await target.async_export(
+                directory,
+                call.data["format"],
+                call.data["data"],
+                call.data.get("start_date"),
+                call.data.get("end_date"),
+            )
+            files.extend(str(path) for path in paths)
+        return {"files": files}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT,
+        async_export,
+        schema=EXPORT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_profile(call: ServiceCall) -> ServiceResponse:
+        """Run one refresh under the profiler."""
+        targets = _account_coordinators(hass, call.data.get(CONF_ACCOUNT_IDS))
+        path = await async_profile_refresh(hass, targets, call.data["top"])
+        return {"path": path}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        async_profile,
+        schema=PROFILE_REFRESH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_backfill_statistics(call: ServiceCall) -> ServiceResponse:
+        """Backfill cumulative cash flow statistics from transaction history."""
+        if "recorder" not in hass.config.components:
+            raise HomeAssistantError("The recorder is not enabled")
+        targets = _account_coordinators(hass, call.data.get(CONF_ACCOUNT_IDS))
+        backfilled: dict[str, int] = {}
+        for target in targets:
+            raw = await target.async_fetch_raw_data({ENDPOINT_TRANSACTIONS})
+            rows = cash_flow_rows(raw[ENDPOINT_TRANSACTIONS])
+            stat_id = statistic_id("account", target.account_id, "cash_flow")
+            async_write_statistics(
+                hass,
+                stat_id,
+                f"{target.account.name} cash flow",
+                target.data["account"]["currency"] if target.data else None,
+                rows,
+                has_sum=True,
+            )
+            backfilled[stat_id] = len(rows)
+        return {"statistics": backfilled}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BACKFILL_STATISTICS,
+        async_backfill_statistics,
+        schema=BACKFILL_STATISTICS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    alerts: EasyEquitiesAlertRegistry = hass.data[DATA_ALERTS]
+
+    async def async_add_alert(call: ServiceCall) -> ServiceResponse:
+        """Add a threshold alert."""
+        alert = await alerts.async_add(
+            call.data[ATTR_CONTRACT_CODE],
+            call.data["threshold"],
+            call.data["metric"],
+            call.data["direction"],
+            call.data.get("account_id"),
+            call.data.get("name"),
+        )
+        _LOGGER.info("Added alert %s for %s", alert["id"], alert[ATTR_CONTRACT_CODE])
+        return {"alert_id": alert["id"]}
+
+    async def async_remove_alert(call: ServiceCall) -> None:
+        """Remove a threshold alert."""
+        if not await alerts.async_remove(call.data["alert_id"]):
+            raise HomeAssistantError(f"Unknown alert id: {call.data['alert_id']}")
+
+    async def async_list_alerts(call: ServiceCall) -> ServiceResponse:
+        """Return the configured alerts."""
+        return {"alerts": list(alerts.alerts.values())}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ADD_ALERT,
+        async_add_alert,
+        schema=ADD_ALERT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_REMOVE_ALERT, async_remove_alert, schema=REMOVE_ALERT_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LIST_ALERTS,
+        async_list_alerts,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    allocation: EasyEquitiesAllocationTargets = hass.data[DATA_ALLOCATION]
+
+    async def async_set_allocation(call: ServiceCall) -> ServiceResponse:
+        """Set the allocation targets, or reload them from the YAML file."""
+        if TARGET_HOLDINGS in call.data or TARGET_EXCHANGES in call.data:
+            targets = await allocation.async_set(dict(call.data))
+        else:
+            targets = await allocation.async_load_file()
+        _LOGGER.info(
+            "Allocation targets set for %d holding(s) and %d exchange(s)",
+            len(targets[TARGET_HOLDINGS]),
+            len(targets[TARGET_EXCHANGES]),
+        )
+        return dict(targets)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_ALLOCATION,
+        async_set_allocation,
+        schema=SET_ALLOCATION_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_cache_stats(call: ServiceCall) -> ServiceResponse:
+        """Return the response cache counters."""
+        return async_get_cache(hass).stats()
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CACHE_STATS,
+        async_cache_stats,
+        supports_response=SupportsResponse.ONLY,
+    )
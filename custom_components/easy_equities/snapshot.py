@@ -0,0 +1,101 @@
+"""Account snapshots shared between the poller daemon and its consumers.
+
+``scripts/poller.py`` fetches every account once per interval and publishes
+each account's responses as a snapshot, one JSON document per line, to the
+consumers connected over TCP. An entry with a poller configured applies the
+snapshots instead of polling the API itself. This module does not import
+Home Assistant.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from .retention import trim_holdings, trim_transactions
+
+SNAPSHOT_VERSION = 1
+DEFAULT_POLLER_PORT = 8765
+DEFAULT_POLLER_INTERVAL = 300  # Seconds
+
+# Largest snapshot line accepted by consumers
+MAX_SNAPSHOT_BYTES = 8 * 1024 * 1024
+
+
+def fetch_responses(client: Any, account_id: str) -> dict[str, Any]:
+    """Fetch every endpoint of an account, as the account coordinators do."""
+    return {
+        "holdings": client.accounts.holdings(account_id, True),
+        "valuations": client.accounts.valuations(account_id),
+        "transactions": client.accounts.transactions(account_id),
+    }
+
+
+def normalize_responses(responses: dict[str, Any]) -> dict[str, Any]:
+    """Return the responses with only the fields the integration reads.
+
+    Valuations are kept whole for the cash and asset class breakdown, and
+    every transaction is kept so consumers can index income and fees;
+    consumers trim them further to their own retention.
+    """
+    normalized = dict(responses)
+    if "holdings" in normalized:
+        normalized["holdings"] = trim_holdings(normalized["holdings"])
+    if "transactions" in normalized:
+        transactions = normalized["transactions"]
+        normalized["transactions"] = trim_transactions(transactions, len(transactions))
+    return normalized
+
+
+def encode_snapshot(
+    username: str,
+    platform: str,
+    account: Any,
+    responses: dict[str, Any],
+    fetched_at: str,
+    interval: int = DEFAULT_POLLER_INTERVAL,
+) -> bytes:
+    """Return the snapshot of an account as one line of JSON.
+
+    The poller's interval tells consumers when a snapshot is overdue.
+    """
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "username": username,
+        "platform": platform,
+        "account": {
+            "id": account.id,
+            "name": account.name,
+            "trading_currency_id": getattr(account, "trading_currency_id", None),
+        },
+        "fetched_at": fetched_at,
+        "interval": interval,
+        "responses": normalize_responses(responses),
+    }
+    return json.dumps(snapshot, default=str, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def decode_snapshot(line: bytes) -> dict[str, Any]:
+    """Return the snapshot in a line, raising ValueError if it isn't one."""
+    snapshot = json.loads(line)
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        raise ValueError("Unsupported snapshot version")
+    if not isinstance(snapshot.get("account"), dict) or "id" not in snapshot["account"]:
+        raise ValueError("Snapshot has no account")
+    if not isinstance(snapshot.get("responses"), dict):
+        raise ValueError("Snapshot has no responses")
+    return snapshot
+
+
+def parse_address(address: str) -> tuple[str, int]:
+    """Return the host and port of a HOST[:PORT] poller address."""
+    host, _, port = address.strip().rpartition(":")
+    if not host:
+        host, port = port, ""
+    host = host.strip("[]")
+    if not host:
+        raise ValueError("Poller address has no host")
+    if not port:
+        return host, DEFAULT_POLLER_PORT
+    if not port.isdigit() or not 0 < int(port) < 65536:
+        raise ValueError(f"Invalid poller port: {port}")
+    return host, int(port)
@@ -0,0 +1,270 @@
+"""Long-term statistics for Easy Equities values.
+
+Holding, account and portfolio values are written to the recorder as
+external statistics, one row per hour, so history graphs read the compact
+statistics tables instead of raw states.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+from functools import partial
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DATA_STATISTICS, DOMAIN
+from .events import holding_key
+from .util import parse_number
+
+if TYPE_CHECKING:
+    from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+
+    from .coordinator import EasyEquitiesDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _hour_start(moment: datetime) -> datetime:
+    """Return the start of the hour containing moment."""
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def statistic_id(*parts: str) -> str:
+    """Return the external statistic id for the given name parts."""
+    return f"{DOMAIN}:{slugify('_'.join(parts))}"
+
+
+class _HourAccumulator:
+    """Min, max and mean of the values recorded during one hour."""
+
+    def __init__(self, start: datetime, name: str, unit: str | None) -> None:
+        """Initialize the accumulator."""
+        self.start = start
+        self.name = name
+        self.unit = unit
+        self.min = float("inf")
+        self.max = float("-inf")
+        self.total = 0.0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """Record a value."""
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.total += value
+        self.count += 1
+
+    def row(self) -> StatisticData:
+        """Return the statistics row for the hour."""
+        return {
+            "start": self.start,
+            "mean": self.total / self.count,
+            "min": self.min,
+            "max": self.max,
+        }
+
+
+class EasyEquitiesStatistics:
+    """Aggregate the values of a config entry into hourly statistics.
+
+    Every refresh adds to the current hour's min, max and mean; completed
+    hours are written in one batch per statistic when the hour rolls over.
+    An hour is only written once it is complete, since writing it again
+    replaces the earlier row rather than adding to it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: EasyEquitiesDataUpdateCoordinator,
+        current: dict[str, _HourAccumulator] | None = None,
+    ) -> None:
+        """Initialize the statistics, resuming the current hour of a previous setup."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.current: dict[str, _HourAccumulator] = current or {}
+        self._pending: dict[str, list[_HourAccumulator]] = {}
+
+    def _values(self) -> list[tuple[str, str, str | None, float]]:
+        """Return (statistic id, name, unit, value) for the current data."""
+        data = self.coordinator.data or {}
+        values: list[tuple[str, str, str | None, float]] = []
+        for account_data in data.get("accounts", []):
+            account = account_data["account"]
+            if account_data.get("stale"):
+                continue
+            currency = account.get("currency")
+            values.append(
+                (
+                    statistic_id("account", account["id"]),
+                    f"{account['name']} value",
+                    currency,
+                    account_data["summary"]["total_current_value"],
+                )
+            )
+            for holding in account_data["holdings"]:
+                if (value := parse_number(holding.get("current_value"))) is None:
+                    continue
+                values.append(
+                    (
+                        statistic_id("holding", account["id"], holding_key(holding)),
+                        f"{holding.get('name')} ({account['name']})",
+                        currency,
+                        value,
+                    )
+                )
+        if data.get("summary") and not data.get("stale_accounts"):
+            primary = data.get("account") or {}
+            values.append(
+                (
+                    statistic_id("portfolio", self.coordinator.entry.entry_id),
+                    "Portfolio value",
+                    primary.get("currency"),
+                    data["summary"]["total_current_value"],
+                )
+            )
+        return values
+
+    @callback
+    def async_record(self) -> None:
+        """Add the current values to the statistics of the current hour."""
+        hour = _hour_start(dt_util.utcnow())
+        for stat_id, name, unit, value in self._values():
+            accumulator = self.current.get(stat_id)
+            if accumulator is not None and accumulator.start != hour:
+                self._pending.setdefault(stat_id, []).append(accumulator)
+                accumulator = None
+            if accumulator is None:
+                accumulator = self.current[stat_id] = _HourAccumulator(hour, name, unit)
+            accumulator.add(value)
+        self.async_flush_completed()
+
+    @callback
+    def async_flush_completed(self, _now: datetime | None = None) -> None:
+        """Write the hours that have ended."""
+        hour = _hour_start(dt_util.utcnow())
+        for stat_id, accumulator in list(self.current.items()):
+            if accumulator.start != hour:
+                self._pending.setdefault(stat_id, []).append(self.current.pop(stat_id))
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        for stat_id, hours in pending.items():
+            async_write_statistics(
+                self.hass,
+                stat_id,
+                hours[-1].name,
+                hours[-1].unit,
+                [accumulator.row() for accumulator in hours],
+            )
+        _LOGGER.debug("Wrote hourly statistics for %d statistic(s)", len(pending))
+
+
+@callback
+def async_write_statistics(
+    hass: HomeAssistant,
+    stat_id: str,
+    name: str,
+    unit: str | None,
+    rows: list[StatisticData],
+    has_sum: bool = False,
+) -> None:
+    """Queue hourly rows of an external statistic in the recorder."""
+    # The recorder is loaded before the integration when it is enabled
+    from homeassistant.components.recorder.statistics import (  # pylint: disable=import-outside-toplevel
+        async_add_external_statistics,
+    )
+
+    metadata: StatisticMetaData = {
+        "has_mean": not has_sum,
+        "has_sum": has_sum,
+        "name": name,
+        "source": DOMAIN,
+        "statistic_id": stat_id,
+        "unit_of_measurement": unit,
+    }
+    async_add_external_statistics(hass, metadata, rows)
+
+
+def cash_flow_rows(transactions: list[dict[str, Any]]) -> list[StatisticData]:
+    """Return hourly cumulative cash flow rows from an account's transactions."""
+    hourly: dict[datetime, float] = {}
+    for transaction in transactions:
+        if (amount := parse_number(transaction.get("DebitCredit"))) is None:
+            continue
+        try:
+            moment = datetime.fromisoformat(str(transaction.get("TransactionDate"))[:19])
+        except ValueError:
+            continue
+        hour = _hour_start(dt_util.as_utc(moment.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)))
+        hourly[hour] = hourly.get(hour, 0.0) + amount
+    rows: list[StatisticData] = []
+    total = 0.0
+    for hour in sorted(hourly):
+        total += hourly[hour]
+        rows.append({"start": hour, "state": total, "sum": total})
+    return rows
+
+
+async def async_migrate_statistics(
+    hass: HomeAssistant, coordinator: EasyEquitiesDataUpdateCoordinator
+) -> None:
+    """Rename the portfolio statistic once keyed on the login to the entry id."""
+    if "recorder" not in hass.config.components:
+        return
+    # The recorder is loaded before the integration when it is enabled
+    from homeassistant.components.recorder import (  # pylint: disable=import-outside-toplevel
+        get_instance,
+    )
+    from homeassistant.components.recorder.statistics import (  # pylint: disable=import-outside-toplevel
+        get_metadata,
+    )
+
+    old_id = statistic_id("portfolio", coordinator.username)
+    new_id = statistic_id("portfolio", coordinator.entry.entry_id)
+    instance = get_instance(hass)
+    existing = await instance.async_add_executor_job(
+        partial(get_metadata, hass, statistic_ids={old_id, new_id})
+    )
+    if old_id in existing and new_id not in existing:
+        _LOGGER.info("Renaming statistic %s to %s", old_id, new_id)
+        instance.async_update_statistics_metadata(old_id, new_statistic_id=new_id)
+
+
+@callback
+def async_setup_statistics(
+    hass: HomeAssistant, coordinator: EasyEquitiesDataUpdateCoordinator
+) -> Callable[[], None] | None:
+    """Record the entry's values as statistics; return a callback to stop.
+
+    Returns None when the recorder is not enabled.
+    """
+    if "recorder" not in hass.config.components:
+        _LOGGER.debug("Recorder not loaded, not recording long-term statistics")
+        return None
+    entry_id = coordinator.entry.entry_id
+    # The hour in progress when the entry was last unloaded, e.g. on reload
+    statistics = EasyEquitiesStatistics(
+        hass, coordinator, hass.data.setdefault(DATA_STATISTICS, {}).pop(entry_id, None)
+    )
+    remove_listener = coordinator.async_add_listener(statistics.async_record)
+    # Write the previous hour even if no refresh happens right after it ends
+    remove_timer: CALLBACK_TYPE = async_track_time_change(
+        hass, statistics.async_flush_completed, minute=0, second=30
+    )
+    statistics.async_record()
+
+    @callback
+    def _async_stop() -> None:
+        remove_listener()
+        remove_timer()
+        statistics.async_flush_completed()
+        # Hand the incomplete hour to the next setup instead of writing it
+        hass.data[DATA_STATISTICS][entry_id] = statistics.current
+
+    return _async_stop
+
@@ -0,0 +1,60 @@
+"""Map Easy Equities contract codes to TradingView symbols.
+
+Contract codes look like ``EQU.{EXCHANGE}.{SYMBOL}``. TradingView widgets
+expect ``{EXCHANGE}:{SYMBOL}`` with TradingView's own exchange prefixes, so the
+mapping is computed once per contract code instead of in dashboard templates.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+import re
+
+# Easy Equities exchange code -> TradingView exchange prefix. US symbols are
+# left bare so TradingView resolves the listing (NASDAQ or NYSE) itself.
+EXCHANGE_PREFIXES: dict[str, str | None] = {
+    "ZA": "JSE",
+    "US": None,
+    "AU": "ASX",
+    "DE": "XETR",
+    "NL": "EURONEXT",
+    "GB": "LSE",
+}
+
+_OVERRIDE_SEPARATOR = re.compile(r"[,\n]")
+
+
+@lru_cache(maxsize=512)
+def default_symbol(contract_code: str) -> str | None:
+    """Return the TradingView symbol for a contract code, if it can be mapped."""
+    parts = contract_code.split(".", 2)
+    if len(parts) != 3 or parts[0] != "EQU" or parts[1] not in EXCHANGE_PREFIXES:
+        return None
+    prefix = EXCHANGE_PREFIXES[parts[1]]
+    return f"{prefix}:{parts[2]}" if prefix else parts[2]
+
+
+def tradingview_symbol(
+    contract_code: str | None, overrides: dict[str, str]
+) -> str | None:
+    """Return the TradingView symbol for a contract code, preferring overrides."""
+    if not contract_code:
+        return None
+    if contract_code in overrides:
+        return overrides[contract_code]
+    return default_symbol(contract_code)
+
+
+def parse_overrides(value: str) -> dict[str, str]:
+    """Parse ``CONTRACT_CODE=SYMBOL`` pairs separated by commas or newlines.
+
+    Raises ValueError on a malformed pair.
+    """
+    overrides: dict[str, str] = {}
+    for pair in _OVERRIDE_SEPARATOR.split(value or ""):
+        if not pair.strip():
+            continue
+        contract_code, separator, symbol = pair.partition("=")
+        if not separator or not contract_code.strip() or not symbol.strip():
+            raise ValueError(f"Invalid TradingView override: {pair.strip()}")
+        overrides[contract_code.strip()] = symbol.strip()
+    return overrides
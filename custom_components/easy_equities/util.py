@@ -1,12 +1,16 @@
 """Utility functions for Easy Equities integration."""
 from __future__ import annotations
 
+from datetime import date, datetime, timedelta
 import logging
 import re
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
+# Transactions dated this long before the newest one applied are assumed applied
+SEEN_OVERLAP_DAYS = 90
+
 
 def parse_currency(value: str | Any) -> float:
     """
@@ -56,3 +60,89 @@ def parse_currency(value: str | Any) -> float:
             err
         )
         raise ValueError(f"Could not parse currency value: {value}") from err
+
+
+def parse_number(value: Any) -> float | None:
+    """Parse a currency or share value, returning None if it can't be parsed."""
+    try:
+        return parse_currency(value)
+    except ValueError:
+        return None
+
+
+def transaction_date(transaction: dict[str, Any]) -> str:
+    """Return the ISO date of a transaction, or an empty string."""
+    try:
+        return datetime.fromisoformat(str(transaction.get("TransactionDate"))[:19]).date().isoformat()
+    except ValueError:
+        return ""
+
+
+class SeenTransactions:
+    """Ids of the transactions already applied, bounded by a high-water mark.
+
+    Only the ids dated within SEEN_OVERLAP_DAYS of the newest applied
+    transaction are kept; older transactions are taken as applied, so the
+    stored ids cover the overlap window rather than the whole history.
+    Transactions without a date can't be aged and are kept.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with nothing seen."""
+        self.latest = ""
+        self._newest = ""
+        self._ids: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        """Return the number of ids kept."""
+        return len(self._ids)
+
+    def _cutoff(self) -> str:
+        """Return the date before which transactions are taken as applied."""
+        if not self.latest:
+            return ""
+        return (date.fromisoformat(self.latest) - timedelta(days=SEEN_OVERLAP_DAYS)).isoformat()
+
+    def add(self, transaction: dict[str, Any]) -> bool:
+        """Record a transaction, returning False if it was applied before."""
+        if (transaction_id := transaction.get("TransactionId")) is None:
+            return False
+        key = str(transaction_id)
+        if key in self._ids:
+            return False
+        day = transaction_date(transaction)
+        if day and day < self._cutoff():
+            return False
+        self._ids[key] = day
+        self._newest = max(self._newest, day)
+        return True
+
+    def prune(self) -> None:
+        """Advance the high-water mark and drop the ids that fell out of the overlap.
+
+        Called after each batch, so the mark doesn't move while a batch that
+        lists the newest transactions first is still being applied.
+        """
+        self.latest = max(self.latest, self._newest)
+        cutoff = self._cutoff()
+        self._ids = {key: day for key, day in self._ids.items() if not day or day >= cutoff}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the ids and high-water mark as JSON-serializable data for storage."""
+        return {"latest": self.latest, "ids": self._ids}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | list[Any] | None) -> SeenTransactions:
+        """Return the ids restored from storage.
+
+        Older stores hold a plain list of ids; those are dated today, so they
+        age out once the newest transactions are SEEN_OVERLAP_DAYS past it.
+        """
+        seen = cls()
+        if isinstance(data, list):
+            today = date.today().isoformat()
+            seen._ids = {str(transaction_id): today for transaction_id in data}
+        elif data:
+            seen.latest = data.get("latest", "")
+            seen._ids = dict(data.get("ids", {}))
+        return seen
@@ -0,0 +1,116 @@
+"""Parse the valuations response of an Easy Equities account.
+
+The valuations endpoint returns the account value, cash, accruals and the
+split by asset class as sections of label and value items. They are parsed
+once per valuations response into a breakdown the sensors read directly.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any, TypedDict
+
+from .util import parse_number
+
+_LOGGER = logging.getLogger(__name__)
+
+# Cash items whose label contains this are free to invest or withdraw
+_FREE_CASH = "free cash"
+
+
+class ValuationBreakdown(TypedDict):
+    """The parsed valuations of one account."""
+
+    currency: str | None
+    account_value: float | None
+    cash: float | None
+    cash_items: dict[str, float]
+    invested: float | None
+    asset_classes: dict[str, float]
+    accrued: float
+    accrued_items: dict[str, float]
+
+
+def _items(section: Any) -> dict[str, float]:
+    """Return the label and value pairs of a section, skipping unparseable ones."""
+    items: dict[str, float] = {}
+    if not isinstance(section, list):
+        return items
+    for item in section:
+        if not isinstance(item, dict):
+            continue
+        label = item.get("Label") or item.get("Name")
+        value = parse_number(item.get("Value", item.get("Amount")))
+        if label and value is not None:
+            items[str(label).strip()] = value
+    return items
+
+
+def parse_valuations(valuations: Any) -> ValuationBreakdown:
+    """Return the breakdown of a valuations response.
+
+    Missing sections are returned empty, and figures that can't be derived
+    as None, so a change in the response shape degrades the sensors rather
+    than failing the refresh.
+    """
+    if not isinstance(valuations, dict):
+        valuations = {}
+    top_summary = valuations.get("TopSummary") or {}
+    account_value = parse_number(top_summary.get("AccountValue"))
+
+    cash_items = _items(valuations.get("FundSummaryItems"))
+    summary_items = _items(valuations.get("InvestmentSummaryItems"))
+    # Free cash is listed with the funds; some accounts only have a cash summary
+    cash = next(
+        (value for label, value in cash_items.items() if _FREE_CASH in label.lower()),
+        next(
+            (value for label, value in summary_items.items() if label.lower() == "cash"),
+            None,
+        ),
+    )
+
+    types_and_managers = valuations.get("InvestmentTypesAndManagers") or {}
+    asset_classes = _items(types_and_managers.get("InvestmentTypes"))
+    invested_classes = [
+        value for label, value in asset_classes.items() if "cash" not in label.lower()
+    ]
+    if invested_classes:
+        invested: float | None = sum(invested_classes)
+    elif account_value is not None and cash is not None:
+        invested = account_value - cash
+    else:
+        invested = None
+
+    accrued_items = _items(valuations.get("AccrualSummaryItems"))
+    if valuations and not (cash_items or asset_classes):
+        _LOGGER.debug("Valuations response has no cash or asset class items")
+
+    return {
+        "currency": top_summary.get("AccountCurrency"),
+        "account_value": account_value,
+        "cash": cash,
+        "cash_items": cash_items,
+        "invested": invested,
+        "asset_classes": asset_classes,
+        "accrued": sum(accrued_items.values()),
+        "accrued_items": accrued_items,
+    }
+
+
+def combine_breakdowns(breakdowns: list[ValuationBreakdown]) -> dict[str, Any]:
+    """Add up the breakdowns of several accounts into portfolio figures."""
+    cash = [b["cash"] for b in breakdowns if b["cash"] is not None]
+    invested = [b["invested"] for b in breakdowns if b["invested"] is not None]
+    asset_classes: dict[str, float] = {}
+    cash_items: dict[str, float] = {}
+    for breakdown in breakdowns:
+        for label, value in breakdown["asset_classes"].items():
+            asset_classes[label] = asset_classes.get(label, 0.0) + value
+        for label, value in breakdown["cash_items"].items():
+            cash_items[label] = cash_items.get(label, 0.0) + value
+    return {
+        "cash": sum(cash) if cash else None,
+        "cash_items": cash_items,
+        "invested": sum(invested) if invested else None,
+        "asset_classes": asset_classes,
+        "accrued": sum(b["accrued"] for b in breakdowns),
+    }
@@ -0,0 +1,206 @@
+"""WebSocket API for Easy Equities dashboards.
+
+Returns the whole portfolio as one table, so a dashboard can render hundreds
+of holdings without subscribing to and filtering every holding entity.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .coordinator import EasyEquitiesDataUpdateCoordinator
+from .events import holding_key
+from .util import parse_number
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _row_key(holding: dict[str, Any]) -> str:
+    """Return the key identifying a holding row across accounts."""
+    return f"{holding.get('_account_id')}:{holding_key(holding)}"
+
+
+def build_portfolio_table(coordinator: EasyEquitiesDataUpdateCoordinator) -> dict[str, Any]:
+    """Build the portfolio table of a config entry."""
+    data = coordinator.data or {}
+    summary = data.get("summary", {})
+    total_current_value = summary.get("total_current_value") or 0.0
+    rows: dict[str, dict[str, Any]] = {}
+    for holding in data.get("holdings", []):
+        current_value = parse_number(holding.get("current_value"))
+        purchase_value = parse_number(holding.get("purchase_value"))
+        profit_loss = (
+            current_value - purchase_value
+            if current_value is not None and purchase_value is not None
+            else None
+        )
+        rows[_row_key(holding)] = {
+            "account_id": holding.get("_account_id"),
+            "name": holding.get("name"),
+            "contract_code": holding.get("contract_code"),
+            "isin": holding.get("isin"),
+            "currency": holding.get("_account_currency"),
+            "shares": parse_number(holding.get("shares")),
+            "current_price": parse_number(holding.get("current_price")),
+            "current_value": current_value,
+            "purchase_value": purchase_value,
+            "profit_loss": profit_loss,
+            "profit_loss_percent": (
+                round(profit_loss / purchase_value * 100, 2)
+                if profit_loss is not None and purchase_value
+                else None
+            ),
+            "weight": (
+                round(current_value / total_current_value * 100, 2)
+                if current_value is not None and total_current_value
+                else None
+            ),
+            "tradingview_symbol": holding.get("_tradingview_symbol"),
+            "stale": bool(holding.get("_stale_since")),
+        }
+    return {
+        "entry_id": coordinator.entry.entry_id,
+        "accounts": [
+            {
+                **account_data["account"],
+                "summary": account_data["summary"],
+                "stale": account_data.get("stale", False),
+            }
+            for account_data in data.get("accounts", [])
+        ],
+        "summary": summary,
+        "holdings": rows,
+        "positions": data.get("positions", {}),
+    }
+
+
+def _coordinators(
+    hass: HomeAssistant, entry_id: str | None
+) -> list[EasyEquitiesDataUpdateCoordinator] | None:
+    """Return the coordinators requested by a command, or None if unknown."""
+    coordinators: dict[str, EasyEquitiesDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+    if entry_id is None:
+        return list(coordinators.values())
+    if entry_id not in coordinators:
+        return None
+    return [coordinators[entry_id]]
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the WebSocket commands."""
+    websocket_api.async_register_command(hass, websocket_portfolio)
+    websocket_api.async_register_command(hass, websocket_subscribe_portfolio)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/portfolio",
+        vol.Optional("entry_id"): str,
+    }
+)
+@callback
+def websocket_portfolio(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the portfolio table of every (or one) config entry."""
+    if (coordinators := _coordinators(hass, msg.get("entry_id"))) is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Entry not found")
+        return
+    connection.send_result(
+        msg["id"],
+        {"portfolios": [build_portfolio_table(coordinator) for coordinator in coordinators]},
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/portfolio/subscribe",
+        vol.Optional("entry_id"): str,
+    }
+)
+@callback
+def websocket_subscribe_portfolio(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send the portfolio tables, then only what changes after each refresh.
+
+    The first event carries the full tables. Each later event carries, per
+    entry, the accounts and summary if they changed, the holding rows and
+    positions that changed and the keys of those that were removed. Updates
+    that change nothing send no event.
+    """
+    if (coordinators := _coordinators(hass, msg.get("entry_id"))) is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Entry not found")
+        return
+
+    tables = {
+        coordinator.entry.entry_id: build_portfolio_table(coordinator)
+        for coordinator in coordinators
+    }
+
+    def _async_listener(
+        coordinator: EasyEquitiesDataUpdateCoordinator,
+    ) -> Callable[[], None]:
+        """Return the listener sending the deltas of a config entry."""
+
+        @callback
+        def _async_send_delta() -> None:
+            entry_id = coordinator.entry.entry_id
+            previous = tables[entry_id]
+            table = build_portfolio_table(coordinator)
+            tables[entry_id] = table
+            delta: dict[str, Any] = {}
+            for field in ("accounts", "summary"):
+                if table[field] != previous[field]:
+                    delta[field] = table[field]
+            for field, changed_field, removed_field in (
+                ("holdings", "changed", "removed"),
+                ("positions", "positions", "removed_positions"),
+            ):
+                changed = {
+                    key: row
+                    for key, row in table[field].items()
+                    if previous[field].get(key) != row
+                }
+                removed = [key for key in previous[field] if key not in table[field]]
+                if changed:
+                    delta[changed_field] = changed
+                if removed:
+                    delta[removed_field] = removed
+            if not delta:
+                return
+            connection.send_message(
+                websocket_api.event_message(
+                    msg["id"], {"delta": {"entry_id": entry_id, **delta}}
+                )
+            )
+
+        return _async_send_delta
+
+    unsubs = [
+        coordinator.async_add_listener(_async_listener(coordinator))
+        for coordinator in coordinators
+    ]
+
+    @callback
+    def _async_unsubscribe() -> None:
+        for unsub in unsubs:
+            unsub()
+
+    connection.subscriptions[msg["id"]] = _async_unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(msg["id"], {"portfolios": list(tables.values())})
+    )
@@ -1,9 +1,33 @@
 #!/usr/bin/env python3
-"""Script to analyze Easy Equities data structure."""
+"""Script to analyze Easy Equities data structure.
+
+Usage:
+    python scripts/analyze_data.py
+    python scripts/analyze_data.py --export DIR [--format csv|ndjson]
+        [--data transactions holdings] [--start YYYY-MM-DD] [--end YYYY-MM-DD]
+    python scripts/analyze_data.py --profile [--workers 4]
+    python scripts/analyze_data.py --schema FILE [--update-schema]
+
+With --export, transactions and holdings snapshots are streamed to one file
+per account and kind instead, like the easy_equities.export service.
+
+With --profile, every account is fetched in parallel, each with its own
+session, and the latency and payload size of each endpoint are reported.
+With --schema, the fingerprint of the responses (field paths and value
+formats) is compared with the one stored in FILE; the script exits with
+status 1 if a change would break parsing or the sensors. --update-schema
+stores the current fingerprint in FILE instead.
+"""
+import argparse
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import importlib
 import json
 import os
 import sys
+import time
+import types
+from datetime import date
 from pathlib import Path
 
 # Fix Windows encoding issues
@@ -21,8 +45,129 @@ from easy_equities_client.clients import EasyEquitiesClient, SatrixClient
 # Load environment variables
 load_dotenv()
 
+INTEGRATION_DIR = Path(__file__).parent.parent / "custom_components" / "easy_equities"
+
+
+def load_integration_module(name: str) -> types.ModuleType:
+    """Import a module of the integration that doesn't need Home Assistant.
+
+    The package's __init__ imports Home Assistant, so the modules are loaded
+    from a bare package that only points at the integration's directory.
+    """
+    if "easy_equities" not in sys.modules:
+        package = types.ModuleType("easy_equities")
+        package.__path__ = [str(INTEGRATION_DIR)]
+        sys.modules["easy_equities"] = package
+    return importlib.import_module(f"easy_equities.{name}")
+
+
+def export_data(client, accounts, args) -> None:
+    """Stream the accounts' transactions and holdings to export files."""
+    export = load_integration_module("export")
+    directory = Path(args.export)
+    for account in accounts:
+        print(f"Exporting account: {account.name} ({account.id})")
+        for path in export.export_account(
+            client,
+            account,
+            directory,
+            args.format,
+            args.data,
+            args.start,
+            args.end,
+        ):
+            print(f"[OK] Wrote {path}")
+
+
+# Client calls per endpoint, as made by the integration's coordinators
+ENDPOINT_CALLS = {
+    "holdings": lambda client, account_id: client.accounts.holdings(account_id, True),
+    "valuations": lambda client, account_id: client.accounts.valuations(account_id),
+    "transactions": lambda client, account_id: client.accounts.transactions(account_id),
+}
+
+
+def fetch_account(client_class, username, password, account) -> dict:
+    """Fetch every endpoint of an account with its own session, timing each call.
+
+    The client switches the active account server-side, so accounts fetched
+    in parallel need separate sessions.
+    """
+    client = client_class()
+    started = time.perf_counter()
+    client.login(username, password)
+    results = {"login": {"seconds": time.perf_counter() - started, "bytes": 0}}
+    for endpoint, call in ENDPOINT_CALLS.items():
+        started = time.perf_counter()
+        response = call(client, account.id)
+        results[endpoint] = {
+            "seconds": time.perf_counter() - started,
+            "bytes": len(json.dumps(response, default=str).encode("utf-8")),
+            "response": response,
+        }
+    return results
 
-async def analyze_data():
+
+def profile_accounts(client_class, username, password, accounts, workers) -> dict:
+    """Fetch the accounts in parallel and print the latency and size per endpoint."""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            account.id: pool.submit(fetch_account, client_class, username, password, account)
+            for account in accounts
+        }
+        results = {account_id: future.result() for account_id, future in futures.items()}
+    elapsed = time.perf_counter() - started
+
+    print(f"{'Account':<30} {'Endpoint':<14} {'Seconds':>8} {'Bytes':>10}")
+    print("-" * 65)
+    totals: dict = {}
+    for account in accounts:
+        for endpoint, result in results[account.id].items():
+            print(
+                f"{account.name[:30]:<30} {endpoint:<14} "
+                f"{result['seconds']:>8.2f} {result['bytes']:>10,}"
+            )
+            total = totals.setdefault(endpoint, [0.0, 0])
+            total[0] += result["seconds"]
+            total[1] += result["bytes"]
+    print("-" * 65)
+    for endpoint, (seconds, size) in totals.items():
+        print(f"{'All accounts':<30} {endpoint:<14} {seconds:>8.2f} {size:>10,}")
+    sequential = sum(seconds for seconds, _ in totals.values())
+    print(
+        f"Fetched {len(accounts)} account(s) in {elapsed:.2f}s "
+        f"({sequential:.2f}s of calls, {workers} worker(s))"
+    )
+    print()
+    return results
+
+
+def check_schema(results: dict, path: Path, update: bool) -> int:
+    """Compare the responses' fingerprint with the stored one; return the exit status."""
+    schema = load_integration_module("schema")
+    current = schema.fingerprint(
+        {endpoint: result["response"] for endpoint, result in account.items() if "response" in result}
+        for account in results.values()
+    )
+    if update or not path.exists():
+        path.write_text(json.dumps(current, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"[OK] Stored fingerprint of {len(current)} field(s) in {path}")
+        return 0
+
+    stored = json.loads(path.read_text(encoding="utf-8"))
+    drift = schema.diff_fingerprints(stored, current)
+    if not drift:
+        print(f"[OK] Responses match the fingerprint in {path}")
+        return 0
+    breaking = [item for item in drift if item[0] == schema.DRIFT_BREAKING]
+    print(f"Schema drift against {path}: {len(drift)} change(s), {len(breaking)} breaking")
+    for severity, field, description in drift:
+        print(f"  [{severity.upper():<8}] {field}: {description}")
+    return 1 if breaking else 0
+
+
+async def analyze_data(args):
     """Fetch and analyze Easy Equities data structure."""
     username = os.getenv("EASYEQUITIES_USERNAME") or os.getenv("EASY_EQUITIES_USERNAME")
     password = os.getenv("EASYEQUITIES_PASSWORD") or os.getenv("EASY_EQUITIES_PASSWORD")
@@ -80,6 +225,19 @@ async def analyze_data():
         else:
             accounts_to_analyze = accounts
 
+        if args.export:
+            export_data(client, accounts_to_analyze, args)
+            return
+
+        if args.profile or args.schema:
+            client_class = SatrixClient if is_satrix else EasyEquitiesClient
+            results = profile_accounts(
+                client_class, username, password, accounts_to_analyze, args.workers
+            )
+            if args.schema:
+                sys.exit(check_schema(results, Path(args.schema), args.update_schema))
+            return
+
         all_data = {}
 
         for account in accounts_to_analyze:
@@ -205,5 +363,32 @@ async def analyze_data():
         sys.exit(1)
 
 
+def parse_args():
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--export", metavar="DIR", help="Export to files in DIR instead")
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    parser.add_argument(
+        "--data",
+        nargs="+",
+        choices=["transactions", "holdings"],
+        default=["transactions", "holdings"],
+    )
+    parser.add_argument("--start", type=date.fromisoformat, help="First transaction date")
+    parser.add_argument("--end", type=date.fromisoformat, help="Last transaction date")
+    parser.add_argument(
+        "--profile", action="store_true", help="Report latency and size per endpoint"
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Accounts fetched at once")
+    parser.add_argument("--schema", metavar="FILE", help="Compare with the fingerprint in FILE")
+    parser.add_argument(
+        "--update-schema", action="store_true", help="Store the fingerprint in FILE instead"
+    )
+    args = parser.parse_args()
+    if args.update_schema and not args.schema:
+        parser.error("--update-schema requires --schema FILE")
+    return args
+
+
 if __name__ == "__main__":
-    asyncio.run(analyze_data())
+    asyncio.run(analyze_data(parse_args()))
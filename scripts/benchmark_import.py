@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark the integration's import cost on the Home Assistant event loop.
+
+Home Assistant imports an integration's modules on the event loop during
+bootstrap. This script measures how long importing the integration takes on
+top of the Home Assistant modules that are already loaded at that point, and
+fails if it exceeds the budget or if the client library is imported eagerly.
+
+Usage:
+    python scripts/benchmark_import.py [--budget-ms 25] [--runs 5]
+
+Requires homeassistant to be installed in the current environment.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Import cost budget for the integration, in milliseconds
+DEFAULT_BUDGET_MS = 25
+
+# Modules Home Assistant has already imported before loading the integration
+PRELOADED_MODULES = [
+    "voluptuous",
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.const",
+    "homeassistant.exceptions",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.dispatcher",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.entity_registry",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.components.persistent_notification",
+    "homeassistant.components.sensor",
+    "homeassistant.components.websocket_api",
+]
+
+INTEGRATION_MODULES = [
+    "custom_components.easy_equities",
+    "custom_components.easy_equities.config_flow",
+    "custom_components.easy_equities.sensor",
+]
+
+# Libraries that must only be imported lazily, in the executor
+LAZY_MODULES = ["easy_equities_client", "numpy"]
+
+_MEASURE = """
+import importlib, json, sys, time
+for name in {preloaded!r}:
+    importlib.import_module(name)
+start = time.perf_counter()
+for name in {integration!r}:
+    importlib.import_module(name)
+elapsed = (time.perf_counter() - start) * 1000
+eager = [name for name in {lazy!r} if name in sys.modules]
+print(json.dumps({{"elapsed_ms": elapsed, "eager": eager}}))
+"""
+
+
+def measure_once() -> dict:
+    """Import the integration in a fresh interpreter and return the timing."""
+    code = _MEASURE.format(
+        preloaded=PRELOADED_MODULES,
+        integration=INTEGRATION_MODULES,
+        lazy=LAZY_MODULES,
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    """Run the benchmark and report against the budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [measure_once() for _ in range(args.runs)]
+    timings = sorted(run["elapsed_ms"] for run in runs)
+    median = timings[len(timings) // 2]
+    eager = sorted({name for run in runs for name in run["eager"]})
+
+    print(f"Integration import time over {args.runs} run(s):")
+    print(f"  min:    {timings[0]:.1f} ms")
+    print(f"  median: {median:.1f} ms")
+    print(f"  max:    {timings[-1]:.1f} ms")
+    print(f"  budget: {args.budget_ms:.1f} ms")
+
+    failed = False
+    if eager:
+        print(f"FAIL: imported eagerly on the event loop: {', '.join(eager)}")
+        failed = True
+    if median > args.budget_ms:
+        print("FAIL: import time exceeds budget")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Benchmark the memory retained per holding by the account coordinators.
+
+Coordinators keep the latest response of every endpoint between refreshes.
+This script builds synthetic responses shaped like the Easy Equities API,
+measures the bytes retained per holding for the raw responses and for the
+trimmed ones kept by default, and fails if the trimmed size exceeds the budget.
+
+Usage:
+    python scripts/benchmark_memory.py [--holdings 200] [--budget-bytes 1000]
+
+Does not require Home Assistant.
+"""
+import argparse
+import importlib.util
+import sys
+import tracemalloc
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+RETENTION_PATH = REPO_ROOT / "custom_components" / "easy_equities" / "retention.py"
+
+# Retained bytes budget per holding, including its share of the account's
+# valuations and transactions
+DEFAULT_BUDGET_BYTES = 1000
+
+# Transactions returned by the API per account, and kept by default
+RAW_TRANSACTIONS = 200
+RETAINED_TRANSACTIONS = 10
+
+
+def load_retention():
+    """Import the retention module without importing Home Assistant."""
+    spec = importlib.util.spec_from_file_location("easy_equities_retention", RETENTION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_holding(index: int) -> dict:
+    """Return a holding shaped like the client library's output."""
+    code = f"EQU.ZA.SYM{index:04d}"
+    return {
+        "name": f"Example Holding {index} Limited",
+        "contract_code": code,
+        "purchase_value": f"R{1000 + index:,}.00",
+        "current_value": f"R{1100 + index:,}.00",
+        "current_price": f"R{50 + index % 100}.{index % 100:02d}",
+        "img": f"https://resources.easyequities.co.za/logos/{code}.png",
+        "view_url": (
+            "/AccountOverview/GetInstrumentDetailAction/"
+            f"?IsinCode=ZAE0000{index:05d}&InstrumentName=Example%20Holding%20{index}"
+            "&InvestmentTypeId=1&TradingCurrencyId=2"
+        ),
+        "isin": f"ZAE0000{index:05d}",
+        "shares": f"{index % 50}.{index % 10:04d}",
+    }
+
+
+def make_valuations(count: int) -> dict:
+    """Return a valuations response for an account."""
+    items = [{"Label": f"Item {i}", "Value": f"R{i * 10:,}.00"} for i in range(count)]
+    return {
+        "TopSummary": {
+            "AccountValue": 123456.78,
+            "AccountCurrency": "ZAR",
+            "AccountNumber": "EE123456-789",
+            "AccountName": "EasyEquities ZAR",
+            "PeriodMovements": [
+                {"Label": label, "Value": "R1,234.56", "Percentage": "1.23%"}
+                for label in ("1D", "1W", "1M", "3M", "1Y", "All")
+            ],
+        },
+        "InvestmentTypesAndManagers": {"InvestmentTypes": items[:5], "Managers": items[:5]},
+        "InvestmentSummaryItems": items,
+        "AccrualSummaryItems": items[:5],
+        "NetInterestOnCashItems": items[:5],
+        "CostsSummaryItems": items[:10],
+        "FundSummaryItems": items[:10],
+    }
+
+
+def make_transactions(count: int) -> list:
+    """Return a transactions response for an account."""
+    return [
+        {
+            "TransactionId": 1000 + i,
+            "DebitCredit": -100.0 - i,
+            "Comment": f"Bought Example Holding {i} Limited 1.0000 @ {100 + i}.00",
+            "TransactionDate": f"2024-01-{i % 28 + 1:02d}T00:00:00",
+            "LogId": 5000 + i,
+            "ActionId": 1,
+            "Action": "Buy",
+            "ContractCode": f"EQU.ZA.SYM{i:04d}",
+        }
+        for i in range(count)
+    ]
+
+
+def retained_bytes(build) -> int:
+    """Return the bytes still allocated by the object build() returns."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    retained = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del retained
+    return after - before
+
+
+def main() -> int:
+    """Run the benchmark and report against the budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--holdings", type=int, default=200)
+    parser.add_argument("--budget-bytes", type=float, default=DEFAULT_BUDGET_BYTES)
+    args = parser.parse_args()
+    retention = load_retention()
+
+    def build_raw():
+        return {
+            "holdings": [make_holding(i) for i in range(args.holdings)],
+            "valuations": make_valuations(args.holdings),
+            "transactions": make_transactions(RAW_TRANSACTIONS),
+        }
+
+    def build_trimmed():
+        raw = build_raw()
+        return {
+            "holdings": retention.trim_holdings(raw["holdings"]),
+            "valuations": retention.trim_valuations(raw["valuations"]),
+            "transactions": retention.trim_transactions(
+                raw["transactions"], RETAINED_TRANSACTIONS
+            ),
+        }
+
+    raw = retained_bytes(build_raw) / args.holdings
+    trimmed = retained_bytes(build_trimmed) / args.holdings
+
+    print(f"Retained memory per holding ({args.holdings} holdings):")
+    print(f"  raw:     {raw:,.0f} bytes")
+    print(f"  trimmed: {trimmed:,.0f} bytes ({(1 - trimmed / raw) * 100:.0f}% less)")
+    print(f"  budget:  {args.budget_bytes:,.0f} bytes")
+
+    if trimmed > args.budget_bytes:
+        print("FAIL: retained memory per holding exceeds budget")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Poll Easy Equities once and publish the snapshots to many consumers.
+
+Usage:
+    python scripts/poller.py [--host 127.0.0.1] [--port 8765] [--interval 300]
+        [--platforms easy_equities satrix] [--token TOKEN]
+
+Every interval, each account is fetched like the integration's coordinators
+do, and its snapshot is sent as one line of JSON to every connected
+consumer. Home Assistant entries with this poller set in their options apply
+the snapshots instead of polling the API, so several instances watching the
+same accounts share one fetch. New consumers get the latest snapshot of every
+account as soon as they connect.
+
+Consumers send {"token": ...} as their first line; set a token with --token
+or EASYEQUITIES_POLLER_TOKEN whenever the poller listens beyond localhost.
+Credentials are read from the same .env file as analyze_data.py.
+"""
+import argparse
+import asyncio
+from datetime import datetime, timezone
+import hmac
+import importlib
+import json
+import logging
+import os
+import sys
+import types
+from pathlib import Path
+
+from dotenv import load_dotenv
+from easy_equities_client.clients import EasyEquitiesClient, SatrixClient
+
+load_dotenv()
+
+INTEGRATION_DIR = Path(__file__).parent.parent / "custom_components" / "easy_equities"
+
+CLIENT_CLASSES = {"easy_equities": EasyEquitiesClient, "satrix": SatrixClient}
+
+# Consumers that fall this far behind are disconnected
+MAX_BUFFERED_BYTES = 32 * 1024 * 1024
+HELLO_TIMEOUT = 10  # Seconds
+
+_LOGGER = logging.getLogger("easy_equities.poller")
+
+
+def load_integration_module(name: str) -> types.ModuleType:
+    """Import a module of the integration that doesn't need Home Assistant."""
+    if "easy_equities" not in sys.modules:
+        package = types.ModuleType("easy_equities")
+        package.__path__ = [str(INTEGRATION_DIR)]
+        sys.modules["easy_equities"] = package
+    return importlib.import_module(f"easy_equities.{name}")
+
+
+snapshot = load_integration_module("snapshot")
+
+
+class SnapshotServer:
+    """Keep the latest snapshot per account and send them to consumers."""
+
+    def __init__(self, token: str) -> None:
+        """Initialize the server."""
+        self.token = token
+        self.latest: dict[tuple[str, str], bytes] = {}
+        self.consumers: set[asyncio.StreamWriter] = set()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Authenticate a consumer, send it the latest snapshots and keep it."""
+        peer = writer.get_extra_info("peername")
+        try:
+            hello = json.loads(await asyncio.wait_for(reader.readline(), HELLO_TIMEOUT))
+            token = str(hello.get("token", "")) if isinstance(hello, dict) else ""
+        except (asyncio.TimeoutError, ValueError, OSError):
+            token = None
+        if token is None or not hmac.compare_digest(token, self.token):
+            _LOGGER.warning("Rejected consumer %s", peer)
+            writer.close()
+            return
+        _LOGGER.info("Consumer %s connected", peer)
+        for line in self.latest.values():
+            writer.write(line)
+        self.consumers.add(writer)
+        try:
+            # Consumers don't send anything else; wait until they disconnect
+            while await reader.read(1024):
+                pass
+        except OSError:
+            pass
+        finally:
+            self.consumers.discard(writer)
+            writer.close()
+            _LOGGER.info("Consumer %s disconnected", peer)
+
+    def publish(self, key: tuple[str, str], line: bytes) -> None:
+        """Send a snapshot to every consumer, dropping those that fell behind."""
+        self.latest[key] = line
+        for writer in list(self.consumers):
+            if writer.transport.get_write_buffer_size() > MAX_BUFFERED_BYTES:
+                _LOGGER.warning("Dropping slow consumer %s", writer.get_extra_info("peername"))
+                self.consumers.discard(writer)
+                writer.close()
+                continue
+            writer.write(line)
+
+
+async def poll_platform(
+    server: SnapshotServer, platform: str, username: str, password: str, clients: dict, interval: int
+) -> None:
+    """Fetch every account of a platform and publish their snapshots.
+
+    The client switches the active account server-side, so the accounts of a
+    platform are fetched one after the other on its session.
+    """
+    if (client := clients.get(platform)) is None:
+        client = CLIENT_CLASSES[platform]()
+        await asyncio.to_thread(client.login, username, password)
+        clients[platform] = client
+    accounts = await asyncio.to_thread(client.accounts.list)
+    for account in accounts:
+        responses = await asyncio.to_thread(snapshot.fetch_responses, client, account.id)
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        line = snapshot.encode_snapshot(username, platform, account, responses, fetched_at, interval)
+        server.publish((platform, account.id), line)
+        _LOGGER.info(
+            "Published %s account %s (%d holding(s), %d bytes) to %d consumer(s)",
+            platform,
+            account.name,
+            len(responses["holdings"]),
+            len(line),
+            len(server.consumers),
+        )
+
+
+async def run(args) -> None:
+    """Serve consumers and poll every interval."""
+    username = os.getenv("EASYEQUITIES_USERNAME") or os.getenv("EASY_EQUITIES_USERNAME")
+    password = os.getenv("EASYEQUITIES_PASSWORD") or os.getenv("EASY_EQUITIES_PASSWORD")
+    if not username or not password:
+        print("ERROR: EASYEQUITIES_USERNAME and EASYEQUITIES_PASSWORD must be set in .env file")
+        sys.exit(1)
+
+    server = SnapshotServer(args.token)
+    listener = await asyncio.start_server(server.handle, args.host, args.port)
+    _LOGGER.info("Serving snapshots on %s:%d every %d seconds", args.host, args.port, args.interval)
+    clients: dict = {}
+    async with listener:
+        while True:
+            for platform in args.platforms:
+                try:
+                    await poll_platform(server, platform, username, password, clients, args.interval)
+                except Exception as err:  # noqa: BLE001 - keep serving the last snapshots
+                    _LOGGER.error("Failed to poll %s: %s", platform, err)
+                    # Log in again on the next poll
+                    clients.pop(platform, None)
+            await asyncio.sleep(args.interval)
+
+
+def main() -> None:
+    """Parse the arguments and run the poller."""
+    parser = argparse.ArgumentParser(description="Publish Easy Equities snapshots to consumers")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=snapshot.DEFAULT_POLLER_PORT)
+    parser.add_argument(
+        "--interval",
+        type=int,
+        default=snapshot.DEFAULT_POLLER_INTERVAL,
+        help="Seconds between polls (minimum 60)",
+    )
+    parser.add_argument(
+        "--platforms",
+        nargs="+",
+        choices=sorted(CLIENT_CLASSES),
+        default=(
+            ["satrix"]
+            if os.getenv("EASYEQUITIES_IS_SATRIX", "false").lower() == "true"
+            else ["easy_equities"]
+        ),
+    )
+    parser.add_argument(
+        "--token",
+        default=os.getenv("EASYEQUITIES_POLLER_TOKEN", ""),
+        help="Token consumers must send (default: EASYEQUITIES_POLLER_TOKEN)",
+    )
+    args = parser.parse_args()
+    args.interval = max(args.interval, 60)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()